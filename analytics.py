@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+FantasyPros accuracy analytics outside the browser
+
+Python twin of calculateFPAccuracy() in the dashboard: per-player ECR vs
+actual positional rank for the current season, graded the same way
+(MAE 40%, correlation 30%, consistency 20%, sample size 10%, each metric
+converted from a percentile rank within the position).
+
+baseline_curves() precomputes the rank -> points curves the page uses to turn
+an ECR rank into a projection and to fill the Historical tab.
+
+accuracy_table() is the player_scores_power_curve.csv report: games, MAE,
+average score and the power-curve accuracy score the Historical tab shows.
+
+project_week() is the Python twin of calculateProjections(): ECR rank ->
+points on the baseline curve, blended with the player's average by position
+and player reliability, then ranked and tiered per position.
+
+Per-player metrics are built from AccuracyAccumulator, a set of running sums
+(n, Σx, Σy, Σxy, Σx², Σy², within-3, signed diff) plus a Welford mean/M2 of
+the absolute rank differences. Adding or removing one week is O(1) per
+player, which is what lets data_store keep season-to-date and rolling-window
+accuracy up to date as weeks are ingested.
+
+Players are joined across the season and ECR data by the crosswalk ID `i`
+when the records carry one (player_ids.attach_ids), otherwise by normalized
+name. Percentile ranks are computed with one sort per metric and tied values
+share their average rank, so grading stays O(n log n) per position.
+
+Example:
+    import analytics
+    import player_ids
+    from generate_dashboard_fixed import load_current_season, load_weekly_projections
+    current, projections = load_current_season(), load_weekly_projections()
+    crosswalk = player_ids.build_crosswalk(current, projections)
+    accuracy = analytics.fp_accuracy(*player_ids.attach_ids(crosswalk, current, projections))
+"""
+
+import math
+
+from player_ids import normalize_player_name
+
+POSITIONS = ('QB', 'RB', 'WR', 'TE')
+
+# Positional baselines: how many ranks to keep, and blend weights from the
+# most recent season back (renormalized over the seasons present)
+BASELINE_DEPTH = 100
+BASELINE_YEAR_WEIGHTS = (0.5, 0.3, 0.2)
+
+# Percentile -> grade anchor points (same as percentileToGrade in the page)
+GRADE_ANCHORS = [(0.00, 10), (0.25, 43), (0.50, 75), (0.75, 87), (1.00, 100)]
+
+# Accuracy score = max(0, 100 - (MAE * scale) ^ exponent); the page is
+# generated with the same constants
+POWER_CURVE_SCALE = 0.5
+POWER_CURVE_EXPONENT = 1.3
+
+# Projections: tier cutoffs (Elite/High/Mid, rest Stream) and Rankings tab depth
+TIER_CUTOFFS = {'QB': (6, 12, 24), 'RB': (12, 24, 36), 'WR': (12, 24, 36), 'TE': (6, 12, 20)}
+RANKINGS_DEPTH = {'QB': 30, 'RB': 41, 'WR': 54, 'TE': 26}
+
+
+# ==================== RANKS & GRADES ====================
+
+def percentile_ranks(values, higher_is_better=True):
+    """Tie-aware percentile rank of each value: 0 = worst, 1 = best.
+
+    One sort; tied values get the average of their positions. NaN sorts as worst.
+    """
+    n = len(values)
+    if n == 0:
+        return []
+    if n == 1:
+        return [0.5]
+
+    worst = -math.inf if higher_is_better else math.inf
+    keys = [worst if v != v else v for v in values]
+    order = sorted(range(n), key=keys.__getitem__, reverse=not higher_is_better)
+
+    percentiles = [0.0] * n
+    start = 0
+    while start < n:
+        end = start
+        while end + 1 < n and keys[order[end + 1]] == keys[order[start]]:
+            end += 1
+        percentile = (start + end) / 2 / (n - 1)
+        for k in range(start, end + 1):
+            percentiles[order[k]] = percentile
+        start = end + 1
+    return percentiles
+
+
+def power_curve_score(mae):
+    """0-100 accuracy score from a mean absolute rank error."""
+    return max(0.0, 100 - (mae * POWER_CURVE_SCALE) ** POWER_CURVE_EXPONENT)
+
+
+def percentile_to_grade(percentile):
+    """Convert a percentile (0-1) to a grade (0-100) by linear interpolation between anchors."""
+    for (p1, g1), (p2, g2) in zip(GRADE_ANCHORS, GRADE_ANCHORS[1:]):
+        if p1 <= percentile <= p2:
+            return g1 + (percentile - p1) / (p2 - p1) * (g2 - g1)
+    return percentile * 100
+
+
+def pearson_correlation(x, y):
+    """Pearson correlation, 0 when undefined (same as pearsonCorrelation in the page)."""
+    n = len(x)
+    if n != len(y) or n == 0:
+        return 0
+    sum_x, sum_y = sum(x), sum(y)
+    sum_xy = sum(a * b for a, b in zip(x, y))
+    sum_x2 = sum(a * a for a in x)
+    sum_y2 = sum(b * b for b in y)
+    numerator = n * sum_xy - sum_x * sum_y
+    denominator = math.sqrt((n * sum_x2 - sum_x * sum_x) * (n * sum_y2 - sum_y * sum_y))
+    return 0 if denominator == 0 else numerator / denominator
+
+
+def grade_reliability(players):
+    """Set 'reliabilityScore' on each player dict of one position in place."""
+    mae_pct = percentile_ranks([p['mae'] for p in players], higher_is_better=False)
+    corr_pct = percentile_ranks([p['correlation'] for p in players])
+    cons_pct = percentile_ranks([p['consistency'] for p in players])
+
+    for player, mae_p, corr_p, cons_p in zip(players, mae_pct, corr_pct, cons_pct):
+        sample_bonus = min(100, player['games'] / 8 * 100)
+        score = (percentile_to_grade(mae_p) * 0.40 +
+                 percentile_to_grade(corr_p) * 0.30 +
+                 percentile_to_grade(cons_p) * 0.20 +
+                 sample_bonus * 0.10)
+        player['reliabilityScore'] = max(0, min(100, score))
+
+
+# ==================== BASELINE CURVES ====================
+
+def baseline_curve(season_data, pos, depth=BASELINE_DEPTH):
+    """Per-game averages of one position, best first: curve[rank - 1] = points."""
+    averages = []
+    for player in season_data:
+        if player['pos'] != pos or not player['w']:
+            continue
+        avg = sum(player['w'].values()) / len(player['w'])
+        if avg > 0:
+            averages.append(avg)
+    averages.sort(reverse=True)
+    return averages[:depth]
+
+
+def blend_curves(curves, weights=BASELINE_YEAR_WEIGHTS):
+    """Weighted rank-by-rank blend of curves ordered most recent first."""
+    blended = []
+    for idx in range(max((len(c) for c in curves), default=0)):
+        total = weight_sum = 0.0
+        for curve, weight in zip(curves, weights):
+            if idx < len(curve):
+                total += curve[idx] * weight
+                weight_sum += weight
+        blended.append(total / weight_sum)
+    return blended
+
+
+def baseline_curves(historical_data, depth=BASELINE_DEPTH, decimals=2):
+    """Rank -> points curves for every format, season and position, plus a blend.
+
+    Returns {format: {'years': {year: {pos: [...]}}, 'blend': {pos: [...]}}},
+    rounded to `decimals` so they embed compactly.
+    """
+    curves = {}
+    for scoring_format, years in historical_data.items():
+        by_year = {year: {pos: baseline_curve(data, pos, depth) for pos in POSITIONS}
+                   for year, data in sorted(years.items())}
+        recent_first = sorted(by_year, key=int, reverse=True)
+        blend = {pos: blend_curves([by_year[year][pos] for year in recent_first]) for pos in POSITIONS}
+
+        curves[scoring_format] = {
+            'years': {year: {pos: [round(v, decimals) for v in curve] for pos, curve in by_pos.items()}
+                      for year, by_pos in by_year.items()},
+            'blend': {pos: [round(v, decimals) for v in curve] for pos, curve in blend.items()},
+        }
+    return curves
+
+
+# ==================== ACCUMULATORS ====================
+
+class AccuracyAccumulator:
+    """Running ECR-vs-actual rank statistics for one player.
+
+    x = projected (ECR) rank, y = actual positional rank. Supports removing a
+    week again so the same structure serves rolling windows.
+    """
+
+    FIELDS = ('n', 'sum_x', 'sum_y', 'sum_xy', 'sum_x2', 'sum_y2',
+              'within3', 'sum_diff', 'sum_abs', 'mean', 'm2')
+
+    def __init__(self, n=0, sum_x=0.0, sum_y=0.0, sum_xy=0.0, sum_x2=0.0, sum_y2=0.0,
+                 within3=0, sum_diff=0.0, sum_abs=0.0, mean=0.0, m2=0.0):
+        self.n = n
+        self.sum_x = sum_x
+        self.sum_y = sum_y
+        self.sum_xy = sum_xy
+        self.sum_x2 = sum_x2
+        self.sum_y2 = sum_y2
+        self.within3 = within3
+        self.sum_diff = sum_diff
+        self.sum_abs = sum_abs
+        self.mean = mean    # Welford mean of |y - x|
+        self.m2 = m2        # Welford sum of squared deviations of |y - x|
+
+    def add(self, projected, actual):
+        """Fold in one week."""
+        d = abs(projected - actual)
+        self.n += 1
+        self.sum_x += projected
+        self.sum_y += actual
+        self.sum_xy += projected * actual
+        self.sum_x2 += projected * projected
+        self.sum_y2 += actual * actual
+        self.within3 += d <= 3
+        self.sum_diff += actual - projected
+        self.sum_abs += d
+        delta = d - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (d - self.mean)
+
+    def remove(self, projected, actual):
+        """Take one previously added week back out (reverse Welford)."""
+        d = abs(projected - actual)
+        if self.n <= 1:
+            self.__init__()
+            return
+        old_mean = self.mean
+        self.n -= 1
+        self.sum_x -= projected
+        self.sum_y -= actual
+        self.sum_xy -= projected * actual
+        self.sum_x2 -= projected * projected
+        self.sum_y2 -= actual * actual
+        self.within3 -= d <= 3
+        self.sum_diff -= actual - projected
+        self.sum_abs -= d
+        self.mean = (old_mean * (self.n + 1) - d) / self.n
+        self.m2 = max(0.0, self.m2 - (d - old_mean) * (d - self.mean))
+
+    def merge(self, other):
+        """Fold another accumulator in (pooling seasons); Chan's parallel Welford update."""
+        if not other.n:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.sum_x += other.sum_x
+        self.sum_y += other.sum_y
+        self.sum_xy += other.sum_xy
+        self.sum_x2 += other.sum_x2
+        self.sum_y2 += other.sum_y2
+        self.within3 += other.within3
+        self.sum_diff += other.sum_diff
+        self.sum_abs += other.sum_abs
+
+    def as_tuple(self):
+        return tuple(getattr(self, f) for f in self.FIELDS)
+
+    def metrics(self):
+        """{'games', 'correlation', 'mae', 'accuracy', 'avgDiff', 'consistency'}."""
+        n = self.n
+        numerator = n * self.sum_xy - self.sum_x * self.sum_y
+        spread = (n * self.sum_x2 - self.sum_x ** 2) * (n * self.sum_y2 - self.sum_y ** 2)
+        denominator = math.sqrt(spread) if spread > 0 else 0
+        std_dev = math.sqrt(self.m2 / n) if n else 0
+        return {
+            'games': n,
+            'correlation': numerator / denominator if denominator else 0,
+            'mae': self.sum_abs / n if n else 0,
+            'accuracy': self.within3 / n if n else 0,
+            'avgDiff': self.sum_diff / n if n else 0,
+            'consistency': max(0, 1 - std_dev / 15),
+        }
+
+
+# ==================== FP ACCURACY ====================
+
+def _player_key(record):
+    return record['i'] if 'i' in record else normalize_player_name(record['p'])
+
+
+def weekly_position_ranks(season_data, weeks):
+    """{week: {(pos, player_key): rank}} from actual scores (first listing wins)."""
+    ranks = {}
+    for week in weeks:
+        by_pos = {pos: [] for pos in POSITIONS}
+        for player in season_data:
+            score = player['w'].get(week)
+            if score is not None and score > 0 and player['pos'] in by_pos:
+                by_pos[player['pos']].append((score, _player_key(player)))
+        week_ranks = {}
+        for pos, scored in by_pos.items():
+            scored.sort(key=lambda s: -s[0])
+            for idx, (_, key) in enumerate(scored):
+                week_ranks.setdefault((pos, key), idx + 1)
+        ranks[week] = week_ranks
+    return ranks
+
+
+def season_observations(season_data, projections):
+    """Yield (player, [(week, ecr, actual_rank), ...]) for one season.
+
+    Only weeks where the player scored and had an ECR count, and players
+    need at least 3 scored weeks, as in calculateFPAccuracy().
+    """
+    weeks = sorted(int(w) for w in projections)
+    ranks = weekly_position_ranks(season_data, weeks)
+
+    ecr_by_week = {}
+    for week in weeks:
+        by_key = {}
+        for row in projections.get(week, projections.get(str(week), [])):
+            by_key.setdefault(_player_key(row), row)
+        ecr_by_week[week] = by_key
+
+    for player in season_data:
+        scores = player['w']
+        if not scores or len(scores) < 3:
+            continue
+        key = _player_key(player)
+        pos = player['pos']
+
+        observed = []
+        for week in weeks:
+            score = scores.get(week)
+            if score is None or score <= 0:
+                continue
+            proj = ecr_by_week[week].get(key)
+            if not proj or proj['ecr'] <= 0:
+                continue
+            actual_rank = ranks[week].get((pos, key), 0)
+            if actual_rank > 0:
+                observed.append((week, proj['ecr'], actual_rank))
+        yield player, observed
+
+
+def season_accumulators(season_data, projections):
+    """{normalized_name: (pos, AccuracyAccumulator)} for one season."""
+    accumulators = {}
+    for player, observed in season_observations(season_data, projections):
+        if not observed:
+            continue
+        acc = AccuracyAccumulator()
+        for _, ecr, rank in observed:
+            acc.add(ecr, rank)
+        accumulators.setdefault(normalize_player_name(player['p']), (player['pos'], acc))
+    return accumulators
+
+
+def pooled_accumulators(seasons):
+    """Merge per-season accumulators across seasons.
+
+    seasons is an iterable of (season_data, projections) pairs, oldest first;
+    a player's position is taken from the latest season.
+    """
+    pooled = {}
+    for season_data, projections in seasons:
+        for key, (pos, acc) in season_accumulators(season_data, projections).items():
+            if key in pooled:
+                pooled[key][1].merge(acc)
+                pooled[key] = (pos, pooled[key][1])
+            else:
+                pooled[key] = (pos, acc)
+    return pooled
+
+
+def fp_accuracy(current_season, projections, prior=None):
+    """Per-player ECR accuracy for the current season.
+
+    prior maps a player key (crosswalk ID or normalized name) to an
+    AccuracyAccumulator of past seasons, pooled in like PRIOR_ACCURACY.
+
+    Returns {name: {'position', 'games', 'seasonGames', 'weeks', 'correlation',
+    'mae', 'accuracy', 'avgDiff', 'avgScore', 'consistency', 'reliabilityScore'}}.
+    """
+    if not current_season:
+        return {}
+
+    accuracy = {}
+    for player, observed in season_observations(current_season['data'], projections):
+        if len(observed) < 3:
+            continue
+
+        past = (prior or {}).get(_player_key(player))
+        acc = AccuracyAccumulator(*past.as_tuple()) if past else AccuracyAccumulator()
+        details = {}
+        scores = player['w']
+        for week, ecr, rank in observed:
+            acc.add(ecr, rank)
+            details[week] = {'projRank': ecr, 'actualRank': rank,
+                             'actualScore': scores[week], 'rankDiff': rank - ecr}
+
+        played = [s for s in scores.values() if s > 0]
+        accuracy[player['p']] = {
+            'position': player['pos'],
+            'seasonGames': len(observed),
+            'weeks': details,
+            **acc.metrics(),
+            'avgScore': sum(played) / len(played) if played else 0,
+            'reliabilityScore': 0,
+        }
+
+    for pos in POSITIONS:
+        grade_reliability([stats for stats in accuracy.values() if stats['position'] == pos])
+
+    return accuracy
+
+
+def accuracy_table(season_data, projections, min_games=3):
+    """Rows of the power-curve accuracy report for one season, best score first.
+
+    Each row is {'player', 'position', 'games', 'mae', 'avg_score',
+    'accuracy_score'}; avg_score averages the weeks the player scored.
+    """
+    rows = []
+    for player, observed in season_observations(season_data, projections):
+        if len(observed) < min_games:
+            continue
+        abs_diff = 0.0
+        for _, ecr, rank in observed:
+            abs_diff += abs(rank - ecr)
+        mae = abs_diff / len(observed)
+        played = [s for s in player['w'].values() if s > 0]
+        rows.append({
+            'player': player['p'],
+            'position': player['pos'],
+            'games': len(observed),
+            'mae': mae,
+            'avg_score': sum(played) / len(played) if played else 0,
+            'accuracy_score': power_curve_score(mae),
+        })
+    rows.sort(key=lambda r: -r['accuracy_score'])
+    return rows
+
+
+# ==================== PROJECTIONS ====================
+
+def position_accuracy(accuracy):
+    """Average accuracy per position, as in the page's POSITION_ACCURACY."""
+    summary = {}
+    for pos in POSITIONS:
+        players = [stats for stats in accuracy.values() if stats['position'] == pos]
+        if not players:
+            continue
+        n = len(players)
+        summary[pos] = {
+            'avgCorrelation': sum(p['correlation'] for p in players) / n,
+            'avgMAE': sum(p['mae'] for p in players) / n,
+            'avgAccuracy': sum(p['accuracy'] for p in players) / n,
+            'avgReliability': sum(p['reliabilityScore'] for p in players) / n,
+            'playerCount': n,
+        }
+    return summary
+
+
+def ecr_to_points(ecr, pos_baseline, avg_score):
+    """ECR rank -> points on the positional baseline curve, extrapolating past its end."""
+    index = math.floor(ecr) - 1
+    if index < len(pos_baseline):
+        return pos_baseline[index]
+    last_known = pos_baseline[-1] if pos_baseline and pos_baseline[-1] else avg_score
+    return max(last_known - (index - len(pos_baseline)) * 0.3, 3)
+
+
+def blend_with_reliability(proj, avg_score, pos, accuracy, pos_accuracy):
+    """Blend an ECR projection with the player's average (see blendWithReliability())."""
+    pos_reliability = pos_accuracy.get(pos, {}).get('avgCorrelation') or 0.5
+    weight = 0.3 if pos_reliability < 0 else max(0.3, min(0.9, pos_reliability))
+
+    if accuracy and accuracy['games'] >= 5:
+        if accuracy['correlation'] > 0.7:
+            player_weight = 0.7 + (accuracy['correlation'] - 0.7) * 0.3
+            return player_weight * proj + (1 - player_weight) * avg_score
+        if accuracy['correlation'] < 0:
+            return 0.3 * proj + 0.7 * avg_score
+    return weight * proj + (1 - weight) * avg_score
+
+
+def _tier(pos, rank):
+    elite, high, mid = TIER_CUTOFFS[pos]
+    if rank <= elite:
+        return 'Elite'
+    if rank <= high:
+        return 'High'
+    return 'Mid' if rank <= mid else 'Stream'
+
+
+def project_week(season_data, week_ecr, pos_baselines, accuracy, pos_accuracy):
+    """Projections for one week, sorted best first with per-position rank and tier.
+
+    week_ecr is that week's ECR rows; players without one are on bye (proj 0,
+    rank 999, tier BYE). Each row has the fields calculateProjections() sets
+    except the rest-of-season total.
+    """
+    ecr_by_key = {}
+    for row in week_ecr:
+        ecr_by_key.setdefault(_player_key(row), row)
+
+    projections = []
+    for player in season_data:
+        scores = list(player['w'].values())
+        if not scores:
+            continue
+        name, pos = player['p'], player['pos']
+        avg_score = sum(scores) / len(scores)
+        acc = accuracy.get(name)
+        row = {
+            'p': name, 'pos': pos, 'proj': 0, 'floor': 0, 'ceiling': 0,
+            'avgScore': avg_score, 'games': len(scores), 'hasECR': False, 'ecrRank': 999,
+            'correlation': acc['correlation'] if acc else 0, 'mae': acc['mae'] if acc else 0,
+            'avgDiff': acc['avgDiff'] if acc else 0, 'accuracy': acc['accuracy'] if acc else 0,
+            'onBye': True,
+        }
+        ecr = ecr_by_key.get(_player_key(player))
+        if ecr and ecr['ecr'] and ecr['ecr'] > 0:
+            proj = ecr_to_points(ecr['ecr'], pos_baselines.get(pos, []), avg_score)
+            std_points = (ecr.get('std') or 5) * 0.8
+            row.update({
+                'proj': blend_with_reliability(proj, avg_score, pos, acc, pos_accuracy),
+                'floor': max(proj - std_points, proj * 0.5), 'ceiling': proj + std_points,
+                'hasECR': True, 'ecrRank': ecr['ecr'], 'onBye': False,
+            })
+        projections.append(row)
+
+    projections.sort(key=lambda p: -p['proj'])
+    counts = dict.fromkeys(POSITIONS, 0)
+    for p in projections:
+        if p['onBye']:
+            p['rank'], p['tier'] = 999, 'BYE'
+            continue
+        counts[p['pos']] += 1
+        p['rank'] = counts[p['pos']]
+        p['tier'] = _tier(p['pos'], p['rank'])
+    return projections
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: dict player records vs records.PlayerRecord / EcrRecord
+
+Parses every points and ECR file in DATA_FOLDER once, then builds the data
+set SCALE times over (as if there were SCALE times more seasons of the same
+players) in both representations and reports traced memory for each:
+
+    dicts    {'p': name, 'pos': pos, 'w': {week: points}} and ECR row dicts,
+             fresh name strings per row as csv.DictReader hands them out
+    records  PlayerRecord (interned name, array('d') of 18 weeks) and EcrRecord
+
+Usage:
+    python3 bench_memory.py            # 10x the data in historical_data/
+    python3 bench_memory.py --scale 1
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from generate_dashboard_fixed import (CURRENT_SEASON_FILE, DATA_FOLDER, HISTORICAL_FILES, parse_csv_to_compact,
+                                      parse_ecr_filename, parse_projections_csv)
+from records import EcrRecord, PlayerRecord
+
+
+def _fresh(s):
+    """A new str object with the same value (what the CSV reader produces per row)."""
+    return s.encode('utf-8').decode('utf-8')
+
+
+def load_sources(data_folder=DATA_FOLDER):
+    """Parsed records from every points and ECR file: (points_files, ecr_files)."""
+    folder = Path(data_folder)
+    names = [f for years in HISTORICAL_FILES.values() for f in years.values()] + [CURRENT_SEASON_FILE]
+    points = [parse_csv_to_compact(folder / name) for name in names if (folder / name).exists()]
+    ecr = [parse_projections_csv(path) for path in sorted(folder.glob('*.csv')) if parse_ecr_filename(path.name)]
+    return points, ecr
+
+
+def build_dicts(points, ecr, scale):
+    data = []
+    for _ in range(scale):
+        for players in points:
+            data.append([{'p': _fresh(p.p), 'pos': _fresh(p.pos), 'w': dict(p.w.items())} for p in players])
+        for rows in ecr:
+            data.append([{'p': _fresh(r.p), 'pos': _fresh(r.pos), 'ecr': r.ecr, 'std': r.std} for r in rows])
+    return data
+
+
+def build_records(points, ecr, scale):
+    data = []
+    for _ in range(scale):
+        for players in points:
+            data.append([PlayerRecord(_fresh(p.p), _fresh(p.pos), p.w) for p in players])
+        for rows in ecr:
+            data.append([EcrRecord(_fresh(r.p), _fresh(r.pos), r.ecr, r.std) for r in rows])
+    return data
+
+
+def measure(build, *args):
+    """(bytes still allocated after build, peak bytes, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = build(*args)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory of dict vs compact player records")
+    parser.add_argument('--scale', type=int, default=10, help="copies of the data set to build (default: 10)")
+    args = parser.parse_args()
+
+    points, ecr = load_sources()
+    players = sum(len(p) for p in points) * args.scale
+    rows = sum(len(r) for r in ecr) * args.scale
+    print("=" * 60)
+    print(f"🧮 {players:,} player-seasons + {rows:,} ECR rows ({args.scale}x {DATA_FOLDER}/)")
+    print("=" * 60)
+
+    results = {}
+    for label, build in (('dicts', build_dicts), ('records', build_records)):
+        current, peak, elapsed = measure(build, points, ecr, args.scale)
+        results[label] = current
+        print(f"   {label:<8} {current / 2**20:8.1f} MB  (peak {peak / 2**20:.1f} MB, {elapsed:.2f}s)")
+
+    saved = 1 - results['records'] / results['dicts']
+    print(f"\n✅ Records use {saved:.0%} less memory ({results['dicts'] / results['records']:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+SQLite data store for FantasyPros points and ECR files
+
+`python3 generate_dashboard_fixed.py ingest` loads every CSV in DATA_FOLDER
+into DB_FILE once. Files whose size and mtime haven't changed since the last
+ingest are skipped, so re-running it after a weekly drop only touches the new
+files, and the data of files deleted since is dropped. The generator (`--db`) and any other tooling can then query the tables
+instead of reparsing CSVs:
+
+    players         player_id, name
+    player_seasons  season, format, player_id, pos, row_num
+    weekly_points   season, format, week, player_id, points
+    weekly_ecr      season, week, player_id, pos, ecr, std, row_num
+    source_files    path, kind, season, format, week, mtime_ns, size, row_count
+    accuracy_state  season, window_weeks, player_id, pos, <AccuracyAccumulator fields>
+    accuracy_weeks  season, window_weeks, week   (weeks folded in so far)
+
+Weekly ECR files from any season are ingested (season-partitioned by the
+season column); accuracy for past seasons uses that season's PPR points file.
+accuracy_state holds running ECR accuracy sums per player (see
+analytics.AccuracyAccumulator) for the season to date (window_weeks = 0) and
+for each rolling window in ACCURACY_WINDOWS. Every ingest folds in only the
+weeks that have both ECR and actual points and weren't folded before, and
+drops the week that falls out of each rolling window, so a new week costs
+O(players) instead of a full recomputation.
+
+Example:
+    import data_store
+    conn = data_store.connect()
+    rows = data_store.ecr_vs_actual(conn, 'RB', 2025, 'PPR', 8, 17)
+    last4 = data_store.load_accuracy(conn, 2025, window=4)
+    pooled = data_store.load_accuracy(conn)          # every season
+"""
+
+import sqlite3
+from pathlib import Path
+
+from generate_dashboard_fixed import (
+    CURRENT_SEASON,
+    CURRENT_SEASON_FILE,
+    DATA_FOLDER,
+    DB_FILE,
+    HISTORICAL_FILES,
+    log,
+    parse_csv_to_compact,
+    parse_ecr_filename,
+    parse_projections_csv,
+)
+from records import EcrRecord, PlayerRecord
+
+ACCURACY_FORMAT = 'PPR'     # Actual ranks for accuracy come from PPR points
+ACCURACY_WINDOWS = (0, 4, 8)  # 0 = season to date, otherwise last N weeks
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS player_seasons (
+    season INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(player_id),
+    pos TEXT NOT NULL,
+    row_num INTEGER NOT NULL,
+    PRIMARY KEY (season, format, player_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS weekly_points (
+    season INTEGER NOT NULL,
+    format TEXT NOT NULL,
+    week INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(player_id),
+    points REAL NOT NULL,
+    PRIMARY KEY (season, format, week, player_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS weekly_ecr (
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(player_id),
+    pos TEXT NOT NULL,
+    ecr REAL NOT NULL,
+    std REAL NOT NULL,
+    row_num INTEGER NOT NULL,
+    PRIMARY KEY (season, week, player_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS source_files (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    format TEXT,
+    week INTEGER,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    row_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS accuracy_state (
+    season INTEGER NOT NULL,
+    window_weeks INTEGER NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(player_id),
+    pos TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    sum_x REAL NOT NULL,
+    sum_y REAL NOT NULL,
+    sum_xy REAL NOT NULL,
+    sum_x2 REAL NOT NULL,
+    sum_y2 REAL NOT NULL,
+    within3 INTEGER NOT NULL,
+    sum_diff REAL NOT NULL,
+    sum_abs REAL NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    PRIMARY KEY (season, window_weeks, player_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS accuracy_weeks (
+    season INTEGER NOT NULL,
+    window_weeks INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    PRIMARY KEY (season, window_weeks, week)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_weekly_points_player ON weekly_points (player_id, season, format);
+CREATE INDEX IF NOT EXISTS idx_weekly_ecr_pos ON weekly_ecr (pos, season, week);
+CREATE INDEX IF NOT EXISTS idx_weekly_ecr_player ON weekly_ecr (player_id, season);
+'''
+
+
+# ==================== FILE CLASSIFICATION ====================
+
+def classify_file(name):
+    """Work out what a CSV in DATA_FOLDER holds.
+
+    Returns {'kind': 'points'|'ecr', 'season', 'format', 'week'} or None.
+    """
+    for scoring_format, years in HISTORICAL_FILES.items():
+        for year, filename in years.items():
+            if name == filename:
+                return {'kind': 'points', 'season': year, 'format': scoring_format, 'week': None}
+
+    if name == CURRENT_SEASON_FILE:
+        return {'kind': 'points', 'season': CURRENT_SEASON, 'format': 'PPR', 'week': None}
+
+    # Weekly ECR files for any season: '2025 - ALL - 3.csv', 'FantasyPros_2023_Week_8_OP_Rankings.csv'
+    parsed = parse_ecr_filename(name)
+    if parsed:
+        return {'kind': 'ecr', 'season': parsed[0], 'format': None, 'week': parsed[1]}
+    return None
+
+
+# ==================== INGEST ====================
+
+def connect(db_path=DB_FILE):
+    """Open the store, creating tables and indexes if needed."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _player_ids(conn, names):
+    """Return {name: player_id}, inserting any names not seen before."""
+    conn.executemany('INSERT OR IGNORE INTO players (name) VALUES (?)', ((n,) for n in names))
+    ids = {}
+    for name, player_id in conn.execute('SELECT name, player_id FROM players'):
+        ids[name] = player_id
+    return ids
+
+
+def _unique_names(data, filepath):
+    """Drop rows whose name already appeared earlier in the file, logging each one.
+
+    Players are keyed by name, so a second row would otherwise be merged into
+    the first one's. The CSV loaders keep both; the store keeps the first.
+    """
+    names = set()
+    unique = []
+    for p in data:
+        if p['p'] in names:
+            log(f"   ⚠️  {Path(filepath).name}: duplicate player {p['p']} ({p['pos']}), keeping the first row")
+            continue
+        names.add(p['p'])
+        unique.append(p)
+    return unique
+
+
+def _ingest_points(conn, filepath, info):
+    """Replace one season/format; returns (rows, earliest week whose stored points changed)."""
+    data = _unique_names(parse_csv_to_compact(filepath), filepath)
+    ids = _player_ids(conn, [p['p'] for p in data])
+    season, fmt = info['season'], info['format']
+
+    # A re-downloaded file usually just adds a week; stat corrections change old ones
+    old = {}
+    for week, player_id, points in conn.execute(
+            'SELECT week, player_id, points FROM weekly_points WHERE season = ? AND format = ?', (season, fmt)):
+        old.setdefault(week, {})[player_id] = points
+    new = {}
+    for p in data:
+        for week, pts in p['w'].items():
+            new.setdefault(week, {})[ids[p['p']]] = pts
+    changed = min((week for week in old if new.get(week) != old[week]), default=None)
+
+    conn.execute('DELETE FROM player_seasons WHERE season = ? AND format = ?', (season, fmt))
+    conn.execute('DELETE FROM weekly_points WHERE season = ? AND format = ?', (season, fmt))
+    conn.executemany(
+        'INSERT INTO player_seasons VALUES (?, ?, ?, ?, ?)',
+        ((season, fmt, ids[p['p']], p['pos'], row) for row, p in enumerate(data)))
+    conn.executemany(
+        'INSERT INTO weekly_points VALUES (?, ?, ?, ?, ?)',
+        ((season, fmt, week, ids[p['p']], pts) for p in data for week, pts in p['w'].items()))
+    return len(data), changed
+
+
+def _ingest_ecr(conn, filepath, info):
+    data = _unique_names(parse_projections_csv(filepath), filepath)
+    ids = _player_ids(conn, [p['p'] for p in data])
+    season, week = info['season'], info['week']
+
+    conn.execute('DELETE FROM weekly_ecr WHERE season = ? AND week = ?', (season, week))
+    conn.executemany(
+        'INSERT INTO weekly_ecr VALUES (?, ?, ?, ?, ?, ?, ?)',
+        ((season, week, ids[p['p']], p['pos'], p['ecr'], p['std'], row) for row, p in enumerate(data)))
+    return len(data)
+
+
+def _remove_deleted(conn):
+    """Drop the rows of source files that are no longer on disk.
+
+    Returns {season: earliest week whose accuracy inputs went away} and the
+    paths of remaining files that held the same data, which need re-ingesting.
+    """
+    files = conn.execute('SELECT path, kind, season, format, week FROM source_files').fetchall()
+    removed = {}
+    reingest = set()
+    for path, kind, season, fmt, week in files:
+        if Path(path).exists():
+            continue
+        with conn:
+            conn.execute('DELETE FROM source_files WHERE path = ?', (path,))
+            if kind == 'points':
+                conn.execute('DELETE FROM player_seasons WHERE season = ? AND format = ?', (season, fmt))
+                conn.execute('DELETE FROM weekly_points WHERE season = ? AND format = ?', (season, fmt))
+            else:
+                conn.execute('DELETE FROM weekly_ecr WHERE season = ? AND week = ?', (season, week))
+        # Another file with the same season/format/week was overwritten by this one
+        reingest.update(other for other, *key in files
+                        if other != path and key == [kind, season, fmt, week])
+        first = week or 1 if kind == 'ecr' or fmt == ACCURACY_FORMAT else None
+        earlier = removed.get(season)
+        removed[season] = first if earlier is None else min(earlier, first or earlier)
+        label = fmt or f"Week {week}"
+        log(f"   🗑️  {Path(path).name}: removed {kind} {season} {label}")
+    return removed, reingest
+
+
+def ingest(data_folder=DATA_FOLDER, db_path=DB_FILE):
+    """Load every recognised CSV in data_folder into the store.
+
+    Data from files that have been deleted since the last ingest is dropped.
+    Returns {'ingested': [...], 'skipped': [...], 'unknown': [...]} file names.
+    """
+    conn = connect(db_path)
+    removed, reingest = _remove_deleted(conn)
+    seen = {path: (mtime, size) for path, mtime, size in
+            conn.execute('SELECT path, mtime_ns, size FROM source_files')}
+    result = {'ingested': [], 'skipped': [], 'unknown': []}
+    touched = set(removed)
+    # season -> earliest already-stored week a changed or deleted file rewrote
+    changed_since = {season: week for season, week in removed.items() if week is not None}
+
+    for filepath in sorted(Path(data_folder).glob('*.csv')):
+        info = classify_file(filepath.name)
+        if info is None:
+            result['unknown'].append(filepath.name)
+            continue
+
+        stat = filepath.stat()
+        if seen.get(str(filepath)) == (stat.st_mtime_ns, stat.st_size) and str(filepath) not in reingest:
+            result['skipped'].append(filepath.name)
+            continue
+
+        with conn:
+            if info['kind'] == 'points':
+                rows, changed = _ingest_points(conn, filepath, info)
+                if info['format'] != ACCURACY_FORMAT:
+                    changed = None
+            else:
+                rows = _ingest_ecr(conn, filepath, info)
+                changed = info['week'] if str(filepath) in seen else None
+            conn.execute(
+                'INSERT OR REPLACE INTO source_files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (str(filepath), info['kind'], info['season'], info['format'], info['week'],
+                 stat.st_mtime_ns, stat.st_size, rows))
+        result['ingested'].append(filepath.name)
+        touched.add(info['season'])
+        if changed is not None:
+            changed_since[info['season']] = min(changed, changed_since.get(info['season'], changed))
+        label = info['format'] or f"Week {info['week']}"
+        log(f"   ✅ {filepath.name}: {info['kind']} {info['season']} {label}, {rows} players")
+
+    # Only seasons with new or deleted files need their accumulators brought up to date
+    for season in sorted(touched):
+        update_accuracy(conn, season, changed_since=changed_since.get(season))
+
+    conn.execute('ANALYZE')
+    conn.close()
+    return result
+
+
+# ==================== ACCURACY ACCUMULATORS ====================
+
+def week_observations(conn, season, week):
+    """(player_id, pos, ecr, actual_rank) for every player with ECR and points that week.
+
+    Actual rank is the player's position-rank by points (ties keep file
+    order), the same ranking calculateFPAccuracy() uses. ECR rows are matched
+    by normalized name since the two sources spell some names differently.
+    """
+    from player_ids import normalize_player_name
+
+    ecr_by_name = {}
+    for name, ecr in conn.execute(
+            '''SELECT p.name, e.ecr FROM weekly_ecr e JOIN players p USING (player_id)
+               WHERE e.season = ? AND e.week = ? AND e.ecr > 0
+               ORDER BY e.row_num''', (season, week)):
+        ecr_by_name.setdefault(normalize_player_name(name), ecr)
+
+    observations = []
+    for player_id, name, pos, rank in conn.execute(
+            '''SELECT wp.player_id, p.name, ps.pos,
+                      ROW_NUMBER() OVER (PARTITION BY ps.pos ORDER BY wp.points DESC, ps.row_num)
+               FROM weekly_points wp
+               JOIN player_seasons ps
+                 ON ps.season = wp.season AND ps.format = wp.format AND ps.player_id = wp.player_id
+               JOIN players p ON p.player_id = wp.player_id
+               WHERE wp.season = ? AND wp.format = ? AND wp.week = ? AND wp.points > 0''',
+            (season, ACCURACY_FORMAT, week)):
+        ecr = ecr_by_name.get(normalize_player_name(name))
+        if ecr is not None:
+            observations.append((player_id, pos, ecr, rank))
+    return observations
+
+
+def _scored_weeks(conn, season):
+    """Weeks of a season that have both ECR rows and actual points."""
+    return [week for week, in conn.execute(
+        '''SELECT DISTINCT e.week FROM weekly_ecr e
+           WHERE e.season = ? AND EXISTS (
+               SELECT 1 FROM weekly_points wp
+               WHERE wp.season = e.season AND wp.format = ? AND wp.week = e.week AND wp.points > 0)
+           ORDER BY e.week''', (season, ACCURACY_FORMAT))]
+
+
+def update_accuracy(conn, season, windows=ACCURACY_WINDOWS, rebuild=False, changed_since=None):
+    """Fold newly scored weeks into the accuracy accumulators for one season.
+
+    Weeks arriving out of order, data rewritten for a week already folded in
+    (changed_since = the earliest such week), or rebuild=True restart that
+    window from scratch. Returns the weeks folded in.
+    """
+    from analytics import AccuracyAccumulator
+
+    scored = _scored_weeks(conn, season)
+    fields = ', '.join(AccuracyAccumulator.FIELDS)
+    placeholders = ', '.join('?' * (len(AccuracyAccumulator.FIELDS) + 4))
+    observations = {}
+    folded_any = []
+
+    def observe(week):
+        if week not in observations:
+            observations[week] = week_observations(conn, season, week)
+        return observations[week]
+
+    for window in windows:
+        done = {week for week, in conn.execute(
+            'SELECT week FROM accuracy_weeks WHERE season = ? AND window_weeks = ?', (season, window))}
+        new_weeks = [week for week in scored if week not in done]
+        stale = changed_since is not None and any(week >= changed_since for week in done)
+        if not new_weeks and not rebuild and not stale:
+            continue
+
+        if rebuild or stale or (done and min(new_weeks, default=max(done)) < max(done)):
+            conn.execute('DELETE FROM accuracy_state WHERE season = ? AND window_weeks = ?', (season, window))
+            conn.execute('DELETE FROM accuracy_weeks WHERE season = ? AND window_weeks = ?', (season, window))
+            done = set()
+            new_weeks = scored
+
+        state = {}
+        positions = {}
+        for row in conn.execute(
+                f'SELECT player_id, pos, {fields} FROM accuracy_state WHERE season = ? AND window_weeks = ?',
+                (season, window)):
+            positions[row[0]] = row[1]
+            state[row[0]] = AccuracyAccumulator(*row[2:])
+
+        # Weeks currently inside the window (every folded week for season to date)
+        latest = max(done, default=0)
+        active = {week for week in done if not window or week > latest - window}
+
+        for week in new_weeks:
+            for player_id, pos, ecr, rank in observe(week):
+                positions[player_id] = pos
+                state.setdefault(player_id, AccuracyAccumulator()).add(ecr, rank)
+            done.add(week)
+            active.add(week)
+
+            # Drop weeks that just left the rolling window
+            if window:
+                for expired in sorted(w for w in active if w <= week - window):
+                    for player_id, _, ecr, rank in observe(expired):
+                        state[player_id].remove(ecr, rank)
+                    active.discard(expired)
+
+        with conn:
+            conn.execute('DELETE FROM accuracy_state WHERE season = ? AND window_weeks = ?', (season, window))
+            conn.execute('DELETE FROM accuracy_weeks WHERE season = ? AND window_weeks = ?', (season, window))
+            conn.executemany(
+                f'INSERT INTO accuracy_state (season, window_weeks, player_id, pos, {fields}) '
+                f'VALUES ({placeholders})',
+                ((season, window, player_id, positions[player_id], *acc.as_tuple())
+                 for player_id, acc in state.items() if acc.n))
+            conn.executemany('INSERT INTO accuracy_weeks VALUES (?, ?, ?)',
+                             ((season, window, week) for week in sorted(done)))
+        folded_any.extend(w for w in new_weeks if w not in folded_any)
+
+    if folded_any:
+        log(f"   📈 Accuracy {season}: folded week(s) {', '.join(map(str, sorted(folded_any)))}")
+    return sorted(folded_any)
+
+
+def load_accuracy(conn, season=None, window=0, min_games=3):
+    """Graded accuracy from the accumulators: {name: {'position', 'games', 'correlation',
+    'mae', 'accuracy', 'avgDiff', 'consistency', 'reliabilityScore'}}.
+
+    season=None pools every ingested season (a player's position comes from
+    their latest season).
+    """
+    from analytics import POSITIONS, AccuracyAccumulator, grade_reliability
+
+    fields = ', '.join(AccuracyAccumulator.FIELDS)
+    season_filter = 'a.season = ?' if season is not None else '? IS NULL'
+    pooled = {}
+    for row in conn.execute(
+            f'''SELECT p.name, a.pos, {fields}
+                FROM accuracy_state a JOIN players p USING (player_id)
+                WHERE {season_filter} AND a.window_weeks = ?
+                ORDER BY a.season''',
+            (season, window)):
+        acc = AccuracyAccumulator(*row[2:])
+        if row[0] in pooled:
+            pooled[row[0]][1].merge(acc)
+            acc = pooled[row[0]][1]
+        pooled[row[0]] = (row[1], acc)
+
+    accuracy = {}
+    for name, (pos, acc) in pooled.items():
+        if acc.n >= min_games:
+            accuracy[name] = {'position': pos, **acc.metrics(), 'reliabilityScore': 0}
+
+    for pos in POSITIONS:
+        grade_reliability([stats for stats in accuracy.values() if stats['position'] == pos])
+    return accuracy
+
+
+# ==================== QUERIES ====================
+
+def load_points(conn, season, scoring_format):
+    """Return one season/format as PlayerRecords, like parse_csv_to_compact()."""
+    players = {}
+    for player_id, name, pos in conn.execute(
+            '''SELECT ps.player_id, p.name, ps.pos
+               FROM player_seasons ps JOIN players p USING (player_id)
+               WHERE ps.season = ? AND ps.format = ?
+               ORDER BY ps.row_num''', (season, scoring_format)):
+        players[player_id] = PlayerRecord(name, pos)
+
+    for player_id, week, points in conn.execute(
+            '''SELECT player_id, week, points FROM weekly_points
+               WHERE season = ? AND format = ?
+               ORDER BY player_id, week''', (season, scoring_format)):
+        players[player_id].weeks[week - 1] = points
+
+    return list(players.values())
+
+
+def load_ecr(conn, season):
+    """Return {week: [{'p','pos','ecr','std'}]} for one season."""
+    projections = {}
+    for week, name, pos, ecr, std in conn.execute(
+            '''SELECT e.week, p.name, e.pos, e.ecr, e.std
+               FROM weekly_ecr e JOIN players p USING (player_id)
+               WHERE e.season = ?
+               ORDER BY e.week, e.row_num''', (season,)):
+        projections.setdefault(week, []).append(EcrRecord(name, pos, ecr, std))
+    return projections
+
+
+def ecr_vs_actual(conn, pos, season, scoring_format, first_week=1, last_week=18):
+    """Every (name, week, ecr, points) pair for a position over a week range."""
+    return conn.execute(
+        '''SELECT p.name, e.week, e.ecr, wp.points
+           FROM weekly_ecr e
+           JOIN players p USING (player_id)
+           LEFT JOIN weekly_points wp
+             ON wp.player_id = e.player_id AND wp.season = e.season
+            AND wp.week = e.week AND wp.format = ?
+           WHERE e.pos = ? AND e.season = ? AND e.week BETWEEN ? AND ?
+           ORDER BY e.week, e.ecr''',
+        (scoring_format, pos, season, first_week, last_week)).fetchall()
+
+
+# ==================== GENERATOR LOADERS ====================
+
+def load_all_historical_data(conn):
+    """Same shape as generate_dashboard_fixed.load_all_historical_data()."""
+    all_data = {}
+    for scoring_format, years in HISTORICAL_FILES.items():
+        all_data[scoring_format] = {}
+        for year in years:
+            data = load_points(conn, year, scoring_format)
+            if data:
+                all_data[scoring_format][str(year)] = data
+    return all_data
+
+
+def load_current_season(conn):
+    """Same shape as generate_dashboard_fixed.load_current_season()."""
+    data = load_points(conn, CURRENT_SEASON, 'PPR')
+    if not data:
+        return None
+    max_week = max([max(p['w'].keys()) for p in data if p['w']], default=0)
+    return {'data': data, 'current_week': max_week}
+
+
+def load_weekly_projections(conn):
+    """Same shape as generate_dashboard_fixed.load_weekly_projections()."""
+    return load_ecr(conn, CURRENT_SEASON)
+
+
+def load_ecr_history(conn):
+    """Same shape as generate_dashboard_fixed.load_ecr_history()."""
+    seasons = [season for season, in conn.execute(
+        'SELECT DISTINCT season FROM weekly_ecr WHERE season < ? ORDER BY season', (CURRENT_SEASON,))]
+    return {season: load_ecr(conn, season) for season in seasons}
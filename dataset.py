@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+In-process access to the dashboard's data
+
+Dataset reads nothing up front. Each season/format of points and each
+season of weekly ECR is parsed on first access and cached on the instance,
+so a service that only needs 2024 HALF_PPR never touches the other files:
+
+    from dataset import Dataset
+    ds = Dataset()                                # or Dataset(db_path='fantasy_data.db')
+    ds.points(2024, 'HALF_PPR')                   # [{'p', 'pos', 'w'}, ...]
+    ds.ecr(2025)[8]                               # week 8 ECR rows
+    ds.accuracy()                                 # same grades as the Reliability tab
+    ds.projections(scoring_format='STANDARD')     # same rows as the Projections tab
+
+Progress output is off by default. Pass logger=print, or a logging.Logger
+(messages go to .info), to see what gets loaded.
+"""
+
+import analytics
+import exporter
+import player_ids
+from generate_dashboard_fixed import (CURRENT_SEASON, DATA_FOLDER, HISTORICAL_FILES, ecr_seasons, load_points,
+                                      load_weekly_projections, logging_to)
+
+
+class Dataset:
+    """Lazily loaded, cached view of the CSVs in data_folder (or the SQLite store)."""
+
+    def __init__(self, data_folder=DATA_FOLDER, db_path=None, logger=None):
+        self.data_folder = data_folder
+        self.db_path = db_path
+        self.logger = logger
+        self._conn = None
+        self._cache = {}
+
+    def _cached(self, key, loader):
+        if key not in self._cache:
+            with logging_to(self.logger):
+                self._cache[key] = loader()
+        return self._cache[key]
+
+    def _store(self):
+        if self._conn is None:
+            import data_store
+            self._conn = data_store.connect(self.db_path)
+        return self._conn
+
+    # ---- Raw data ----
+
+    def points(self, season=CURRENT_SEASON, scoring_format='PPR'):
+        """Weekly points for one season/format, or None if there is none."""
+        def load():
+            if self.db_path:
+                import data_store
+                return data_store.load_points(self._store(), season, scoring_format) or None
+            return load_points(season, scoring_format, self.data_folder)
+        return self._cached(('points', season, scoring_format), load)
+
+    def ecr(self, season=CURRENT_SEASON):
+        """{week: [{'p', 'pos', 'ecr', 'std'}]} for one season."""
+        def load():
+            if self.db_path:
+                import data_store
+                return data_store.load_ecr(self._store(), season)
+            return load_weekly_projections(season, quiet=True, data_folder=self.data_folder)
+        return self._cached(('ecr', season), load)
+
+    def ecr_seasons(self):
+        """Seasons that have weekly ECR, oldest first."""
+        def load():
+            if self.db_path:
+                return [s for s, in self._store().execute('SELECT DISTINCT season FROM weekly_ecr ORDER BY season')]
+            return ecr_seasons(self.data_folder)
+        return self._cached(('ecr_seasons',), load)
+
+    def historical(self):
+        """Every past season and format, shaped like load_all_historical_data()."""
+        all_data = {}
+        for scoring_format, years in HISTORICAL_FILES.items():
+            all_data[scoring_format] = {}
+            for year in years:
+                data = self.points(year, scoring_format)
+                if data is not None:
+                    all_data[scoring_format][str(year)] = data
+        return all_data
+
+    @property
+    def current_week(self):
+        """Latest week with points in the current season (0 before kickoff)."""
+        data = self.points(CURRENT_SEASON) or []
+        return max((max(p['w']) for p in data if p['w']), default=0)
+
+    # ---- Derived tables ----
+
+    def baseline_curves(self):
+        """analytics.baseline_curves() over the past seasons."""
+        return self._cached(('baselines',), lambda: analytics.baseline_curves(self.historical()))
+
+    def _stamped(self, season):
+        """Season points and ECR stamped with crosswalk IDs, plus the crosswalk."""
+        def load():
+            current = {'data': self.points(season) or []}
+            crosswalk = player_ids.build_crosswalk(current, self.ecr(season))
+            current, projections = player_ids.attach_ids(crosswalk, current, self.ecr(season))
+            return current['data'], projections, crosswalk
+        return self._cached(('stamped', season), load)
+
+    def _prior(self, season):
+        """Past-season accumulators keyed by `season`'s crosswalk IDs."""
+        def load():
+            past = [(self.points(s), self.ecr(s)) for s in self.ecr_seasons() if s < season and self.points(s)]
+            ids = self._stamped(season)[2]['ids']
+            return {ids[norm]: acc for norm, (_, acc) in analytics.pooled_accumulators(past).items()
+                    if norm in ids}
+        return self._cached(('prior', season), load)
+
+    def accuracy(self, season=CURRENT_SEASON):
+        """Per-player ECR accuracy and reliability grades (PPR), pooled with earlier seasons."""
+        def load():
+            season_data, projections, _ = self._stamped(season)
+            return analytics.fp_accuracy({'data': season_data}, projections, self._prior(season))
+        return self._cached(('accuracy', season), load)
+
+    def projections(self, week=None, scoring_format='PPR', season=CURRENT_SEASON):
+        """Projection rows for one week (default: the week after the latest scores).
+
+        Uses only data from before `week`, so past weeks show what the
+        dashboard would have shown then.
+        """
+        if week is None:
+            week = self.current_week + 1
+
+        def load():
+            season_data, projections, _ = self._stamped(season)
+            data, past_ecr = exporter.season_as_of({'data': season_data}, projections, week)
+            accuracy = analytics.fp_accuracy({'data': data}, past_ecr, self._prior(season))
+            curves = self.baseline_curves().get(scoring_format, {}).get('blend', {})
+            return analytics.project_week(data, projections.get(week, []), curves, accuracy,
+                                          analytics.position_accuracy(accuracy))
+        return self._cached(('projections', season, week, scoring_format), load)
+
+    # ---- Lifecycle ----
+
+    def clear(self):
+        """Drop everything cached so the next access re-reads (changed) files."""
+        self._cache.clear()
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -2,10 +2,10 @@
 """
 Quick debug script to see what files are in historical_data/
 """
-import re
 from pathlib import Path
 
-DATA_FOLDER = 'historical_data'
+from data_store import classify_file
+from generate_dashboard_fixed import CURRENT_SEASON, DATA_FOLDER
 
 print("=" * 60)
 print("📁 Files in historical_data/")
@@ -21,7 +21,7 @@ all_files = sorted(data_folder.glob('*.csv'))
 
 print(f"\nTotal CSV files: {len(all_files)}\n")
 
-# Categorize files
+# Categorize files using the same rules as `ingest`
 historical_files = []
 results_files = []
 projection_files = []
@@ -29,16 +29,15 @@ other_files = []
 
 for f in all_files:
     name = f.name
-    if any(year in name for year in ['2022', '2023', '2024']) and 'FantasyPros' in name:
-        historical_files.append(name)
-    elif '2025' in name and 'ALL' in name:
-        projection_files.append(name)
-    elif '2025' in name and 'Week' in name:
+    info = classify_file(name)
+    if info is None:
+        other_files.append(name)
+    elif info['kind'] == 'ecr':
         projection_files.append(name)
-    elif '2025' in name:
+    elif info['season'] == CURRENT_SEASON:
         results_files.append(name)
     else:
-        other_files.append(name)
+        historical_files.append(name)
 
 print("📚 HISTORICAL FILES (2022-2024):")
 for f in historical_files:
@@ -55,9 +54,7 @@ else:
 print(f"\n📊 2025 PROJECTION FILES:")
 if projection_files:
     for f in projection_files:
-        # Try to extract week number
-        week_match = re.search(r'(\d+)', f)
-        week_num = week_match.group(1) if week_match else '?'
+        week_num = classify_file(f)['week']
         print(f"   Week {week_num}: {f}")
 else:
     print(f"   ❌ No projection files found!")
@@ -7,15 +7,44 @@ chrome.action.onClicked.addListener((tab) => {
   // Open popup (this is handled automatically by manifest)
 });
 
+// Rosters are cached per league in chrome.storage.local (the service worker
+// itself is stopped whenever it is idle) and refreshed by an alarm, so the
+// popup answers from the cache instead of going to ESPN every time it opens.
+const ROSTER_CACHE_PREFIX = 'roster:';
+const ROSTER_TTL_MS = 30 * 60 * 1000;       // Older cached rosters are refetched on request
+const REFRESH_ALARM = 'refresh-espn-rosters';
+const REFRESH_PERIOD_MINUTES = 30;
+const DASHBOARD_URLS = ['https://*.github.io/*', 'http://localhost:*/*', 'http://127.0.0.1:*/*'];  // content.js matches
+
+const inFlight = new Map(); // cache key -> pending refresh, so concurrent requests share one fetch
+
 // Listen for messages from content scripts or popup
 chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
+  if (message.type === 'GET_ESPN_ROSTER') {
+    // Cached roster if it is fresh enough, otherwise fetch (force skips the cache)
+    getRoster(message.config, { force: message.force })
+      .then(entry => sendResponse({ success: true, ...entry }))
+      .catch(error => sendResponse({ success: false, error: error.message }));
+    
+    return true; // Keep channel open for async response
+  }
+  
+  if (message.type === 'GET_CACHED_ESPN_ROSTER') {
+    // Whatever is cached, however old - never touches ESPN
+    readCache(message.config)
+      .then(entry => sendResponse({ success: true, ...entry }))
+      .catch(error => sendResponse({ success: false, error: error.message }));
+    
+    return true;
+  }
+  
   if (message.type === 'FETCH_ESPN_ROSTER') {
-    // Handle roster fetch if needed
+    // Raw league JSON straight from ESPN, bypassing the cache
     fetchESPNRoster(message.config)
       .then(roster => sendResponse({ success: true, roster }))
       .catch(error => sendResponse({ success: false, error: error.message }));
     
-    return true; // Keep channel open for async response
+    return true;
   }
 });
 
@@ -162,8 +191,186 @@ async function fetchViaBackgroundCookies(config) {
   return data;
 }
 
+// ===== ROSTER CACHE =====
+
+function cacheKey(config) {
+  return `${ROSTER_CACHE_PREFIX}${config.leagueId}:${config.seasonYear}`;
+}
+
+// {roster, fetchedAt, age, stale} for the cached roster, or {roster: null}
+async function readCache(config) {
+  const key = cacheKey(config);
+  const stored = await chrome.storage.local.get(key);
+  const entry = stored[key];
+  if (!entry) return { roster: null };
+  
+  const age = Date.now() - entry.fetchedAt;
+  return { roster: entry.roster, fetchedAt: entry.fetchedAt, age, stale: age > ROSTER_TTL_MS };
+}
+
+async function getRoster(config, { force = false } = {}) {
+  if (!force) {
+    const cached = await readCache(config);
+    if (cached.roster && !cached.stale) {
+      console.log('Background: Roster cache hit for league', config.leagueId);
+      return { ...cached, fromCache: true };
+    }
+  }
+  return refreshRoster(config);
+}
+
+// Fetch the league, store it and push what changed to open dashboards
+function refreshRoster(config) {
+  const key = cacheKey(config);
+  if (inFlight.has(key)) return inFlight.get(key);
+  
+  const refresh = (async () => {
+    const data = await fetchESPNRoster(config);
+    const roster = parseRoster(data);
+    const fetchedAt = Date.now();
+    
+    const previous = (await chrome.storage.local.get(key))[key];
+    await chrome.storage.local.set({ [key]: { roster, fetchedAt } });
+    
+    if (previous) {
+      const delta = diffRoster(previous.roster, roster);
+      if (delta.added.length || delta.removed.length || delta.rosteredAdded.length || delta.rosteredRemoved.length) {
+        console.log(`Background: Roster changed (+${delta.added.length} / -${delta.removed.length}, ` +
+                    `league +${delta.rosteredAdded.length} / -${delta.rosteredRemoved.length})`);
+        await pushDelta(roster, delta);
+      }
+    }
+    return { roster, fetchedAt, age: 0, stale: false, fromCache: false };
+  })();
+  
+  inFlight.set(key, refresh);
+  refresh.finally(() => inFlight.delete(key)).catch(() => {});
+  return refresh;
+}
+
+function parseRoster(data) {
+  const teams = data.teams || [];
+  
+  if (teams.length === 0) {
+    throw new Error('No teams found in league');
+  }
+  
+  // For now, use the first team
+  // TODO: Let user select if multiple teams
+  const team = teams[0];
+  const teamName = `${team.location || ''} ${team.nickname || ''}`.trim();
+  
+  const entries = team.roster?.entries || [];
+  
+  const positionMap = {
+    1: 'QB',
+    2: 'RB',
+    3: 'WR',
+    4: 'TE',
+    5: 'K',
+    16: 'D/ST'
+  };
+  
+  const roster = entries.map(entry => {
+    const player = entry.playerPoolEntry?.player || {};
+    return {
+      name: player.fullName || 'Unknown',
+      position: positionMap[player.defaultPositionId] || 'FLEX',
+      espnId: entry.playerId,
+      lineupSlot: entry.lineupSlotId
+    };
+  });
+  
+  // mRoster returns every team, so league-wide availability costs no extra request.
+  // Names ride along for dashboards whose crosswalk lacks ESPN ids.
+  const allRostered = teams.flatMap(t => (t.roster?.entries || []).map(entry =>
+    [entry.playerId, entry.playerPoolEntry?.player?.fullName || null]));
+  
+  return {
+    teamName: teamName,
+    roster: roster,
+    allRostered: allRostered,   // [ESPN player id, name] for every player on any roster
+    totalTeams: teams.length,
+    leagueId: data.id,
+    season: data.seasonId,
+    fetchedAt: new Date().toISOString()
+  };
+}
+
+// Players added to / dropped from the roster and the league, matched on ESPN id
+function diffRoster(before, after) {
+  const beforeIds = new Set(before.roster.map(p => p.espnId));
+  const afterIds = new Set(after.roster.map(p => p.espnId));
+  const beforeLeague = leagueMap(before.allRostered);
+  const afterLeague = leagueMap(after.allRostered);
+  return {
+    added: after.roster.filter(p => !beforeIds.has(p.espnId)),
+    removed: before.roster.filter(p => !afterIds.has(p.espnId)),
+    rosteredAdded: [...afterLeague].filter(([id]) => !beforeLeague.has(id)),
+    rosteredRemoved: [...beforeLeague].filter(([id]) => !afterLeague.has(id))
+  };
+}
+
+// ESPN id -> name; rosters cached before names were kept hold bare ids
+function leagueMap(allRostered) {
+  return new Map((allRostered || []).map(entry => Array.isArray(entry) ? entry : [entry, null]));
+}
+
+// Send only the changes; content.js ignores leagues its page isn't showing
+async function pushDelta(roster, delta) {
+  const tabs = await chrome.tabs.query({ url: DASHBOARD_URLS });
+  const message = {
+    type: 'ESPN_ROSTER_DELTA',
+    delta: {
+      leagueId: roster.leagueId,
+      season: roster.season,
+      teamName: roster.teamName,
+      fetchedAt: roster.fetchedAt,
+      added: delta.added,
+      removed: delta.removed,
+      rosteredAdded: delta.rosteredAdded,
+      rosteredRemoved: delta.rosteredRemoved
+    }
+  };
+  await Promise.all(tabs.map(tab =>
+    chrome.tabs.sendMessage(tab.id, message).catch(() => {}) // Tab without content.js
+  ));
+}
+
+// Refresh every cached league; credentials come from the popup's saved settings
+async function refreshCachedRosters() {
+  const [stored, settings] = await Promise.all([
+    chrome.storage.local.get(null),
+    chrome.storage.sync.get(['swid', 'espnS2'])
+  ]);
+  const keys = Object.keys(stored).filter(key => key.startsWith(ROSTER_CACHE_PREFIX));
+  
+  for (const key of keys) {
+    const [leagueId, seasonYear] = key.slice(ROSTER_CACHE_PREFIX.length).split(':');
+    try {
+      await refreshRoster({ leagueId, seasonYear, swid: settings.swid, espnS2: settings.espnS2 });
+    } catch (error) {
+      console.warn('Background: Scheduled refresh failed for league', leagueId, error.message);
+    }
+  }
+}
+
+function scheduleRefresh() {
+  chrome.alarms.create(REFRESH_ALARM, { periodInMinutes: REFRESH_PERIOD_MINUTES });
+}
+
+chrome.alarms.onAlarm.addListener((alarm) => {
+  if (alarm.name === REFRESH_ALARM) {
+    refreshCachedRosters();
+  }
+});
+
+chrome.runtime.onStartup.addListener(scheduleRefresh);
+
 // Handle extension installation
 chrome.runtime.onInstalled.addListener((details) => {
+  scheduleRefresh();
+  
   if (details.reason === 'install') {
     console.log('ESPN Roster Connector installed!');
     
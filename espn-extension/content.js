@@ -3,6 +3,9 @@
 
 console.log('ESPN Roster Connector: Content script loaded');
 
+// Roster last injected into this page; deltas for other leagues are ignored
+let injectedRoster = null;
+
 // Listen for messages from popup
 chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
   if (message.type === 'INJECT_ESPN_ROSTER') {
@@ -18,38 +21,56 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
     
     return true; // Keep message channel open for async response
   }
+  
+  if (message.type === 'ESPN_ROSTER_DELTA') {
+    // Pushed by the background worker when a cached roster changes
+    applyRosterDelta(message.delta);
+    sendResponse({ success: true });
+  }
 });
 
 function injectRoster(rosterData) {
+  injectedRoster = rosterData;
+  
   // Create a custom event with roster data
   const event = new CustomEvent('espnRosterLoaded', {
     detail: rosterData
   });
   
-  // Dispatch to page
+  // Dispatch to page. The dashboard applies it itself and updates only the
+  // rows whose roster status changed, so nothing is re-rendered from here.
   window.dispatchEvent(event);
   
-  // Also try to inject directly if dashboard has global variables
-  if (typeof window.USER_ROSTER !== 'undefined') {
-    window.USER_ROSTER = rosterData.roster.map(p => p.name);
-    window.ROSTER_SOURCE = 'ESPN';
-    window.ESPN_ROSTER_DATA = rosterData;
-    
-    console.log('Injected roster into window.USER_ROSTER:', window.USER_ROSTER);
-    
-    // Trigger refresh if function exists
-    if (typeof window.renderProjectionsTable === 'function') {
-      window.renderProjectionsTable();
-      console.log('Refreshed projections table');
-    }
-    
-    // Show notification
+  if (isDashboard()) {
     showNotification(rosterData);
   } else {
     console.warn('Dashboard not detected. Roster data dispatched via event.');
   }
 }
 
+function applyRosterDelta(delta) {
+  if (!injectedRoster ||
+      String(injectedRoster.leagueId) !== String(delta.leagueId) ||
+      String(injectedRoster.season) !== String(delta.season)) {
+    return;
+  }
+  
+  const removedIds = new Set(delta.removed.map(p => p.espnId));
+  const unrostered = new Set(delta.rosteredRemoved.map(([id]) => id));
+  injectedRoster = {
+    ...injectedRoster,
+    roster: injectedRoster.roster.filter(p => !removedIds.has(p.espnId)).concat(delta.added),
+    allRostered: (injectedRoster.allRostered || []).filter(([id]) => !unrostered.has(id)).concat(delta.rosteredAdded),
+    fetchedAt: delta.fetchedAt
+  };
+  
+  // Only the changes go to the page; the full lists ride along for listeners that want them
+  window.dispatchEvent(new CustomEvent('espnRosterDelta', {
+    detail: { ...delta, roster: injectedRoster.roster, allRostered: injectedRoster.allRostered }
+  }));
+  console.log(`ESPN roster update: +${delta.added.length} / -${delta.removed.length}`);
+}
+
 function showNotification(rosterData) {
   // Create notification element
   const notification = document.createElement('div');
@@ -117,15 +138,17 @@ function showNotification(rosterData) {
   }, 3000);
 }
 
+// Look for dashboard indicators (page globals aren't visible from here)
+function isDashboard() {
+  return Boolean(
+    document.querySelector('[data-dashboard]') ||
+    document.querySelector('#projectionsTable')
+  );
+}
+
 // Check if page is a dashboard and notify extension
 function detectDashboard() {
-  // Look for dashboard indicators
-  const isDashboard = 
-    document.querySelector('[data-dashboard]') ||
-    document.querySelector('#projectionsTable') ||
-    typeof window.PROJECTIONS !== 'undefined';
-  
-  if (isDashboard) {
+  if (isDashboard()) {
     console.log('ESPN Roster Connector: Dashboard detected!');
   }
 }
@@ -14,11 +14,14 @@ document.addEventListener('DOMContentLoaded', async () => {
   if (settings.swid) document.getElementById('swid').value = settings.swid;
   if (settings.espnS2) document.getElementById('espnS2').value = settings.espnS2;
   
-  // Load cached roster if exists
-  const cached = await chrome.storage.local.get(['cachedRoster']);
-  if (cached.cachedRoster) {
-    currentRoster = cached.cachedRoster;
-    displayRoster(currentRoster);
+  // Show the background worker's cached roster right away; refresh it if stale
+  if (settings.leagueId) {
+    loadCachedRoster({
+      leagueId: settings.leagueId,
+      seasonYear: settings.seasonYear || document.getElementById('seasonYear').value,
+      swid: settings.swid,
+      espnS2: settings.espnS2
+    });
   }
   
   // Add event listeners
@@ -29,6 +32,21 @@ document.addEventListener('DOMContentLoaded', async () => {
   document.getElementById('autoDetectLeagueId').addEventListener('click', autoDetectLeagueId);
 });
 
+async function loadCachedRoster(config) {
+  const cached = await chrome.runtime.sendMessage({ type: 'GET_CACHED_ESPN_ROSTER', config });
+  if (!cached.success || !cached.roster) return;
+  
+  currentRoster = cached.roster;
+  displayRoster(currentRoster, cached.age);
+  if (!cached.stale) return;
+  
+  const response = await chrome.runtime.sendMessage({ type: 'GET_ESPN_ROSTER', config });
+  if (response.success) {
+    currentRoster = response.roster;
+    displayRoster(currentRoster, response.age);
+  }
+}
+
 async function autoDetectLeagueId() {
   const button = document.getElementById('autoDetectLeagueId');
   const leagueIdInput = document.getElementById('leagueId');
@@ -156,9 +174,11 @@ async function fetchRoster() {
     // Delegate to background script which has better cookie handling
     console.log('Popup: Sending fetch request to background script...');
     
+    // The background worker parses and caches it (and pushes changes to dashboards)
     const response = await chrome.runtime.sendMessage({
-      type: 'FETCH_ESPN_ROSTER',
-      config: { leagueId, seasonYear, swid, espnS2 }
+      type: 'GET_ESPN_ROSTER',
+      config: { leagueId, seasonYear, swid, espnS2 },
+      force: true
     });
     
     console.log('Popup: Got response from background:', response);
@@ -167,21 +187,11 @@ async function fetchRoster() {
       throw new Error(response.error);
     }
     
-    const data = response.roster;
-    
-    // Parse roster
-    const roster = parseRoster(data);
-    
-    if (!roster) {
-      throw new Error('Failed to parse roster data');
-    }
-    
-    // Save to cache
+    const roster = response.roster;
     currentRoster = roster;
-    await chrome.storage.local.set({ cachedRoster: roster });
     
     // Display
-    displayRoster(roster);
+    displayRoster(roster, response.age);
     showStatus('success', `✅ Found ${roster.roster.length} players!`);
     
   } catch (error) {
@@ -193,49 +203,7 @@ async function fetchRoster() {
   }
 }
 
-function parseRoster(data) {
-  const teams = data.teams || [];
-  
-  if (teams.length === 0) {
-    throw new Error('No teams found in league');
-  }
-  
-  // For now, use the first team
-  // TODO: Let user select if multiple teams
-  const team = teams[0];
-  const teamName = `${team.location || ''} ${team.nickname || ''}`.trim();
-  
-  const entries = team.roster?.entries || [];
-  
-  const positionMap = {
-    1: 'QB',
-    2: 'RB',
-    3: 'WR',
-    4: 'TE',
-    5: 'K',
-    16: 'D/ST'
-  };
-  
-  const roster = entries.map(entry => {
-    const player = entry.playerPoolEntry?.player || {};
-    return {
-      name: player.fullName || 'Unknown',
-      position: positionMap[player.defaultPositionId] || 'FLEX',
-      espnId: entry.playerId,
-      lineupSlot: entry.lineupSlotId
-    };
-  });
-  
-  return {
-    teamName: teamName,
-    roster: roster,
-    leagueId: data.id,
-    season: data.seasonId,
-    fetchedAt: new Date().toISOString()
-  };
-}
-
-function displayRoster(roster) {
+function displayRoster(roster, age = 0) {
   const section = document.getElementById('rosterSection');
   const info = document.getElementById('rosterInfo');
   
@@ -250,7 +218,11 @@ function displayRoster(roster) {
   });
   
   let html = `<strong>${roster.teamName}</strong><br>`;
-  html += `${roster.roster.length} players • ${roster.season}<br><br>`;
+  html += `${roster.roster.length} players • ${roster.season} • ${formatAge(age)}<br>`;
+  if (roster.allRostered) {
+    html += `League: ${roster.totalTeams} teams, ${roster.allRostered.length} rostered players<br>`;
+  }
+  html += '<br>';
   
   Object.keys(playersByPos).sort().forEach(pos => {
     html += `<strong>${pos}:</strong> ${playersByPos[pos].length}<br>`;
@@ -259,6 +231,13 @@ function displayRoster(roster) {
   info.innerHTML = html;
 }
 
+function formatAge(ms) {
+  const minutes = Math.floor(ms / 60000);
+  if (minutes < 1) return 'updated just now';
+  if (minutes < 60) return `updated ${minutes}m ago`;
+  return `updated ${Math.floor(minutes / 60)}h ago`;
+}
+
 async function injectRoster() {
   if (!currentRoster) {
     showStatus('error', 'No roster loaded. Fetch your roster first.');
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Headless export of the dashboard's projections, accuracy and rankings
+
+Produces the same tables calculateProjections(), calculateFPAccuracy() and
+renderRankingsTable() build in the page, for every scoring format and every
+week with an ECR file, without a browser:
+
+    EXPORT_DIR/projections.csv   season, format, week, rank, player, pos, proj, ...
+    EXPORT_DIR/accuracy.csv      season, week, player, position, games, mae, ...
+    EXPORT_DIR/rankings.csv      projections cut to the Rankings tab depth
+
+Each week is computed as of the start of that week: only scores and ECR from
+earlier weeks feed the player averages and accuracy, so the last week matches
+what the dashboard shows. Rows are written as they are produced, one open file
+per table, in CSV or JSON Lines (--to jsonl).
+
+Usage:
+    python3 generate_dashboard_fixed.py export
+    python3 generate_dashboard_fixed.py export --to jsonl --out-dir nightly/
+"""
+
+import csv
+import json
+import os
+import time
+from pathlib import Path
+
+import analytics
+import player_ids
+import profiler
+from generate_dashboard_fixed import log
+
+EXPORT_DIR = 'exports'
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+TABLE_FIELDS = {
+    'projections': ['season', 'format', 'week', 'rank', 'player', 'pos', 'proj', 'floor', 'ceiling',
+                    'tier', 'ecrRank', 'avgScore', 'games', 'correlation', 'mae', 'avgDiff', 'accuracy',
+                    'onBye'],
+    'accuracy': ['season', 'week', 'player', 'position', 'games', 'seasonGames', 'correlation', 'mae',
+                 'accuracy', 'avgDiff', 'avgScore', 'consistency', 'reliabilityScore'],
+    'rankings': ['season', 'format', 'week', 'pos', 'rank', 'player', 'avgScore', 'games', 'correlation',
+                 'proj'],
+}
+
+
+class TableWriter:
+    """Streams rows of one table to disk as CSV or JSON Lines."""
+
+    def __init__(self, path, fields, fmt):
+        self.path = path
+        self.fields = fields
+        self.rows = 0
+        self._tmp_path = f'{path}.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='')
+        if fmt == 'csv':
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(fields)
+        else:
+            self._csv = None
+
+    def write(self, row):
+        if self._csv:
+            self._csv.writerow([row[f] for f in self.fields])
+        else:
+            self._file.write(json.dumps({f: row[f] for f in self.fields}, separators=(',', ':')))
+            self._file.write('\n')
+        self.rows += 1
+
+    def close(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        self._file.close()
+        os.remove(self._tmp_path)
+
+
+def season_as_of(current, projections, week):
+    """Season rows and ECR weeks restricted to weeks before `week`."""
+    data = []
+    for player in current['data']:
+        weeks = {w: pts for w, pts in player['w'].items() if int(w) < week}
+        if weeks:
+            data.append({**player, 'w': weeks})
+    return data, {w: rows for w, rows in projections.items() if int(w) < week}
+
+
+def iter_rows(season, current, projections, baselines, prior=None):
+    """Yield (table, row) for every week with ECR and every scoring format."""
+    for week in sorted(projections, key=int):
+        week = int(week)
+        season_data, past_ecr = season_as_of(current, projections, week)
+        accuracy = analytics.fp_accuracy({'data': season_data}, past_ecr, prior)
+        pos_accuracy = analytics.position_accuracy(accuracy)
+
+        for name, stats in accuracy.items():
+            yield 'accuracy', {'season': season, 'week': week, 'player': name, **stats}
+
+        week_ecr = projections.get(week, projections.get(str(week), []))
+        for scoring_format, curves in baselines.items():
+            rows = analytics.project_week(season_data, week_ecr, curves['blend'], accuracy, pos_accuracy)
+            for p in rows:
+                row = {'season': season, 'format': scoring_format, 'week': week, 'player': p['p'], **p}
+                yield 'projections', row
+                if not p['onBye'] and p['rank'] <= analytics.RANKINGS_DEPTH[p['pos']]:
+                    yield 'rankings', row
+
+
+def export_tables(season, historical, current, projections, prior_accuracy=None, out_dir=EXPORT_DIR,
+                  fmt='csv'):
+    """Write every table to out_dir. Returns {table: rows written}.
+
+    prior_accuracy is analytics.pooled_accumulators() output for past seasons,
+    pooled into accuracy the same way the dashboard does.
+    """
+    if not current or not projections:
+        log("   ⚠️  Need current season points and weekly ECR to export")
+        return {}
+
+    start = time.perf_counter()
+    with profiler.stage('player ids') as s:
+        crosswalk = player_ids.build_crosswalk(current, projections)
+        current, projections = player_ids.attach_ids(crosswalk, current, projections)
+        s['rows'] = len(crosswalk['names'])
+    prior = {}
+    for norm, (_, acc) in (prior_accuracy or {}).items():
+        dense_id = crosswalk['ids'].get(norm)
+        if dense_id is not None:
+            prior[dense_id] = acc
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    writers = {table: TableWriter(str(Path(out_dir) / f'{table}.{fmt}'), fields, fmt)
+               for table, fields in TABLE_FIELDS.items()}
+    try:
+        with profiler.stage('baseline curves'):
+            baselines = analytics.baseline_curves(historical)
+        with profiler.stage('export rows') as s:
+            for table, row in iter_rows(season, current, projections, baselines, prior):
+                writers[table].write(row)
+            s['rows'] = sum(writer.rows for writer in writers.values())
+    except BaseException:
+        for writer in writers.values():
+            writer.discard()
+        raise
+    for writer in writers.values():
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    for writer in writers.values():
+        log(f"   ✅ {writer.path}: {writer.rows} rows")
+    log(f"   ⏱️  {elapsed:.2f}s")
+    return {table: writer.rows for table, writer in writers.items()}
@@ -4,11 +4,20 @@ Fantasy Truss - COMPLETE EDITION
 Generates a fully self-contained HTML with embedded data and full UI
 """
 
+import argparse
+import contextvars
 import csv
+import hashlib
 import json
+import os
 import re
+import time
+from contextlib import contextmanager
 from pathlib import Path
 
+import profiler
+from records import EcrRecord, PlayerRecord, to_json
+
 # ==================== CONFIGURATION ====================
 HISTORICAL_FILES = {
     'PPR': {
@@ -28,14 +37,72 @@ HISTORICAL_FILES = {
     }
 }
 
+CURRENT_SEASON = 2025
 CURRENT_SEASON_FILE = 'FantasyPros_Fantasy_Football_Points_PPR.csv'
 DATA_FOLDER = 'historical_data'
 OUTPUT_FILE = 'fantasy_dashboard_v34_complete.html'
+DB_FILE = 'fantasy_data.db'  # SQLite store written by `ingest`
+ACCURACY_EXPORT_FILE = 'player_scores_power_curve.csv'  # Written by `export-accuracy`
+PROFILE_FILE = 'profile_report.json'  # Written by --profile (see profiler.py)
+
+# Stands in for the page's build hash until the page around it is rendered
+BUILD_HASH_PLACEHOLDER = '__FANTASY_TRUSS_BUILD_HASH__'
+
+# Watch mode: how often DATA_FOLDER is polled, and how long it must stay
+# quiet after a change before we rebuild (a weekly drop is several files)
+WATCH_POLL_SECONDS = 0.25
+WATCH_DEBOUNCE_SECONDS = 0.5
+
+# Parsed CSVs keyed by path -> (mtime_ns, size, data); lets watch mode
+# reparse only the files that actually changed between rebuilds
+_PARSE_CACHE = {}
+
+# Progress messages go through log(); library users redirect or silence them
+# with logging_to() (see dataset.Dataset). A context variable rather than a
+# global, so concurrent loads in other threads keep their own logger.
+_LOGGER = contextvars.ContextVar('fantasy_truss_logger', default=print)
 
 # ==================== FUNCTIONS ====================
 
+def log(message=''):
+    """Report progress to the current logger."""
+    logger = _LOGGER.get()
+    if logger:
+        logger(message)
+
+
+@contextmanager
+def logging_to(logger):
+    """Send log() output to logger while the block runs.
+    
+    logger is a callable taking one string, a logging.Logger (messages go to
+    .info) or None to silence progress output. Only the calling thread (or
+    asyncio task) is redirected.
+    """
+    token = _LOGGER.set(logger.info if hasattr(logger, 'info') else logger)
+    try:
+        yield
+    finally:
+        _LOGGER.reset(token)
+
+
+def cached_parse(filepath, parser):
+    """Run parser on filepath, reusing the last result if the file is unchanged."""
+    stat = os.stat(filepath)
+    key = (str(filepath), parser.__name__)
+    cached = _PARSE_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    
+    with profiler.stage(f'parse {Path(filepath).name}', bytes=stat.st_size) as s:
+        data = parser(filepath)
+        s['rows'] = len(data)
+    _PARSE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
+
+
 def parse_csv_to_compact(filepath):
-    """Parse FantasyPros CSV and convert to compact format."""
+    """Parse FantasyPros CSV into PlayerRecords (p, pos, w)."""
     compact_data = []
     
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -52,16 +119,16 @@ def parse_csv_to_compact(filepath):
             if not player or pos not in ['QB', 'RB', 'WR', 'TE']:
                 continue
             
-            weeks = {}
+            record = PlayerRecord(player, pos)
             for week_num in range(1, 19):
                 week_val = (row.get(str(week_num), '') or '').strip()
                 if week_val and week_val not in ['-', 'BYE', '']:
                     try:
-                        weeks[week_num] = float(week_val)
+                        record.weeks[week_num - 1] = float(week_val)
                     except ValueError:
                         pass
             
-            compact_data.append({'p': player, 'pos': pos, 'w': weeks})
+            compact_data.append(record)
     
     return compact_data
 
@@ -95,20 +162,16 @@ def parse_projections_csv(filepath):
                 if ecr == 0:
                     continue
                 
-                # Store position-based ECR rank - JavaScript will convert to points
-                projections.append({
-                    'p': player,
-                    'pos': pos,
-                    'ecr': ecr,  # Position-based Expert Consensus Rank (QB1=1, not overall #2)
-                    'std': std_dev  # Standard deviation of ranks
-                })
+                # Position-based ECR rank (QB1=1, not overall #2) and the
+                # standard deviation of ranks - JavaScript converts to points
+                projections.append(EcrRecord(player, pos, ecr, std_dev))
             except (ValueError, TypeError):
                 continue
     
     return projections
 
 
-def load_all_historical_data():
+def load_all_historical_data(data_folder=DATA_FOLDER):
     """Load historical data."""
     all_data = {}
     
@@ -116,83 +179,182 @@ def load_all_historical_data():
         all_data[scoring_format] = {}
         
         for year, filename in years.items():
-            filepath = Path(DATA_FOLDER) / filename
+            filepath = Path(data_folder) / filename
             if not filepath.exists():
-                print(f"⚠️  WARNING: {filepath} not found")
+                log(f"⚠️  WARNING: {filepath} not found")
                 continue
             
-            print(f"📂 Loading {scoring_format} {year}...")
-            data = parse_csv_to_compact(filepath)
+            log(f"📂 Loading {scoring_format} {year}...")
+            data = cached_parse(filepath, parse_csv_to_compact)
             all_data[scoring_format][str(year)] = data
-            print(f"   ✅ {len(data)} players")
+            log(f"   ✅ {len(data)} players")
     
     return all_data
 
 
-def load_current_season():
+def load_current_season(data_folder=DATA_FOLDER):
     """Load 2025 current season data."""
-    filepath = Path(DATA_FOLDER) / CURRENT_SEASON_FILE
+    filepath = Path(data_folder) / CURRENT_SEASON_FILE
     if not filepath.exists():
-        print(f"⚠️  2025 results not found: {filepath}")
+        log(f"⚠️  2025 results not found: {filepath}")
         return None
     
-    print(f"\n📂 Loading 2025 season...")
-    data = parse_csv_to_compact(filepath)
+    log(f"\n📂 Loading 2025 season...")
+    data = cached_parse(filepath, parse_csv_to_compact)
     max_week = max([max(p['w'].keys()) for p in data if p['w']], default=0)
-    print(f"   ✅ {len(data)} players, Week {max_week}")
+    log(f"   ✅ {len(data)} players, Week {max_week}")
     
     return {'data': data, 'current_week': max_week}
 
 
-def load_weekly_projections():
-    """Auto-detect and load weekly projection files."""
+def parse_ecr_filename(name):
+    """Return (season, week) for a weekly ECR file name, or None.
+    
+    Handles '2025 - ALL - 3.csv' and 'FantasyPros_2023_Week_8_OP_Rankings.csv'.
+    """
+    points_files = {f for years in HISTORICAL_FILES.values() for f in years.values()}
+    if name == CURRENT_SEASON_FILE or name in points_files:
+        return None
+    
+    years = set(re.findall(r'20\d\d', name))
+    if len(years) != 1:
+        return None
+    season = int(years.pop())
+    
+    week_num = None
+    match1 = re.search(r'[\s_-](\d+)\.csv$', name, re.I)
+    if match1:
+        week_num = int(match1.group(1))
+    if not week_num:
+        match2 = re.search(r'week[\s_]*(\d+)', name, re.I)
+        if match2:
+            week_num = int(match2.group(1))
+    
+    if week_num and 1 <= week_num <= 18 and season <= CURRENT_SEASON:
+        return season, week_num
+    return None
+
+
+def load_weekly_projections(season=CURRENT_SEASON, quiet=False, data_folder=DATA_FOLDER):
+    """Auto-detect and load one season's weekly projection files."""
     projections = {}
-    data_folder = Path(DATA_FOLDER)
-    
-    print(f"\n📂 Scanning projections...")
-    all_csvs = list(data_folder.glob('*.csv'))
-    proj_csvs = [f for f in all_csvs if '2025' in f.name and 
-                 f.name != CURRENT_SEASON_FILE and
-                 not any(y in f.name for y in ['2022','2023','2024'])]
-    
-    for filepath in proj_csvs:
-        week_num = None
-        match1 = re.search(r'[\s_-](\d+)\.csv$', filepath.name, re.I)
-        if match1:
-            week_num = int(match1.group(1))
-        if not week_num:
-            match2 = re.search(r'week[\s_]*(\d+)', filepath.name, re.I)
-            if match2:
-                week_num = int(match2.group(1))
+    data_folder = Path(data_folder)
+    
+    if not quiet:
+        log(f"\n📂 Scanning projections...")
+    for filepath in data_folder.glob('*.csv'):
+        parsed = parse_ecr_filename(filepath.name)
+        if not parsed or parsed[0] != season:
+            continue
         
-        if week_num and 1 <= week_num <= 18:
-            proj_data = parse_projections_csv(filepath)
-            if proj_data:
-                projections[week_num] = proj_data
-                print(f"   📊 Week {week_num}: {len(proj_data)} players")
+        week_num = parsed[1]
+        proj_data = cached_parse(filepath, parse_projections_csv)
+        if proj_data:
+            projections[week_num] = proj_data
+            if not quiet:
+                log(f"   📊 Week {week_num}: {len(proj_data)} players")
     
-    if projections:
+    if projections and not quiet:
         weeks = sorted(projections.keys())
-        print(f"\n   ✅ {len(weeks)} weeks loaded: {', '.join(map(str, weeks))}")
+        log(f"\n   ✅ {len(weeks)} weeks loaded: {', '.join(map(str, weeks))}")
     
     return projections
 
 
-def generate_complete_html(historical_data, current_season, projections):
-    """Generate complete HTML with full V3.2 UI."""
+def ecr_seasons(data_folder=DATA_FOLDER):
+    """Seasons with at least one weekly ECR file in data_folder, oldest first."""
+    seasons = set()
+    for filepath in Path(data_folder).glob('*.csv'):
+        parsed = parse_ecr_filename(filepath.name)
+        if parsed:
+            seasons.add(parsed[0])
+    return sorted(seasons)
+
+
+def load_points(season, scoring_format='PPR', data_folder=DATA_FOLDER):
+    """Load one season/format of weekly points, or None if there is no file for it."""
+    if season == CURRENT_SEASON and scoring_format == 'PPR':
+        filename = CURRENT_SEASON_FILE
+    else:
+        filename = HISTORICAL_FILES.get(scoring_format, {}).get(season)
+    filepath = Path(data_folder) / filename if filename else None
+    if not filepath or not filepath.exists():
+        return None
+    return cached_parse(filepath, parse_csv_to_compact)
+
+
+def load_ecr_history(data_folder=DATA_FOLDER):
+    """Load weekly ECR files for every season before CURRENT_SEASON.
+    
+    Returns {season: {week: [...]}}. Files are parsed through the same
+    mtime-keyed cache, so only new or changed files cost anything on rebuild.
+    """
+    seasons = [season for season in ecr_seasons(data_folder) if season < CURRENT_SEASON]
+    history = {season: load_weekly_projections(season, quiet=True, data_folder=data_folder)
+               for season in seasons}
+    if history:
+        summary = ', '.join(f"{season} ({len(weeks)} wks)" for season, weeks in history.items())
+        log(f"\n📂 ECR history: {summary}")
+    return history
+
+
+def generate_complete_html(historical_data, current_season, projections, sleeper_players=None,
+                           prior_accuracy=None):
+    """Generate complete HTML with full V3.2 UI.
     
-    hist_json = json.dumps(historical_data, separators=(',', ':'))
-    season_json = json.dumps(current_season, separators=(',', ':'))
-    proj_json = json.dumps(projections, separators=(',', ':'))
+    prior_accuracy is analytics.pooled_accumulators() output for past seasons;
+    the page pools it with this season's weeks when grading reliability.
+    """
+    import player_ids
     
-    total_kb = (len(hist_json) + len(season_json) + len(proj_json)) / 1024
-    print(f"\n📊 Data: Historical {len(hist_json)/1024:.1f}KB + Season {len(season_json)/1024:.1f}KB + Proj {len(proj_json)/1024:.1f}KB = {total_kb:.1f}KB")
+    # Resolve player identity once here so the page can join by integer ID
+    with profiler.stage('player ids') as s:
+        crosswalk = player_ids.build_crosswalk(current_season, projections, sleeper_players)
+        current_season, projections = player_ids.attach_ids(crosswalk, current_season, projections)
+        s['rows'] = len(crosswalk['names'])
+    log(f"\n🪪 Player IDs: {len(crosswalk['names'])} players, {len(crosswalk['aliases'])} aliases, "
+          f"{len(crosswalk['sleeper'])} Sleeper / {len(crosswalk['espn'])} ESPN mapped")
+    
+    with profiler.stage('json historical') as s:
+        hist_json = json.dumps(historical_data, separators=(',', ':'), default=to_json)
+        s['bytes'] = len(hist_json)
+    with profiler.stage('json season') as s:
+        season_json = json.dumps(current_season, separators=(',', ':'), default=to_json)
+        s['bytes'] = len(season_json)
+    with profiler.stage('json projections') as s:
+        proj_json = json.dumps(projections, separators=(',', ':'), default=to_json)
+        s['bytes'] = len(proj_json)
+    with profiler.stage('json ids') as s:
+        ids_json = json.dumps(player_ids.embedded_crosswalk(crosswalk), separators=(',', ':'))
+        s['bytes'] = len(ids_json)
+    
+    # Past-season accuracy sums by player ID: [n, sum_x, ..., mean, m2]
+    prior = {}
+    for norm, (_, acc) in (prior_accuracy or {}).items():
+        dense_id = crosswalk['ids'].get(norm)
+        if dense_id is not None:
+            prior[dense_id] = acc.as_tuple()
+    with profiler.stage('json prior accuracy', rows=len(prior)) as s:
+        prior_json = json.dumps(prior, separators=(',', ':'))
+        s['bytes'] = len(prior_json)
+    
+    import analytics
+    with profiler.stage('baseline curves'):
+        baselines = analytics.baseline_curves(historical_data)
+    with profiler.stage('json baselines') as s:
+        baselines_json = json.dumps(baselines, separators=(',', ':'))
+        s['bytes'] = len(baselines_json)
+    
+    total_kb = (len(hist_json) + len(season_json) + len(proj_json) + len(ids_json) + len(baselines_json)) / 1024
+    payload_bytes = len(hist_json) + len(season_json) + len(proj_json) + len(ids_json) + len(prior_json) + len(baselines_json)
+    log(f"\n📊 Data: Historical {len(hist_json)/1024:.1f}KB + Season {len(season_json)/1024:.1f}KB + Proj {len(proj_json)/1024:.1f}KB + IDs {len(ids_json)/1024:.1f}KB + Baselines {len(baselines_json)/1024:.1f}KB = {total_kb:.1f}KB")
     
     cw = current_season.get('current_week', 7) if current_season else 7
     nw = cw + 1
     pw = f"{min(projections.keys())}-{max(projections.keys())}" if projections else "N/A"
     
-    html = f'''<!DOCTYPE html>
+    with profiler.stage('html assembly') as s:
+        html = f'''<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -311,6 +473,30 @@ button:active {{
   border: 1px solid #e74c3c;
 }}
 
+/* Diagnostics panel */
+.diagnostics {{
+  margin-top: 30px;
+  padding: 15px 20px;
+  border-radius: 10px;
+  background: rgba(255,255,255,0.05);
+  font-size: 0.9em;
+}}
+
+.diagnostics summary {{
+  cursor: pointer;
+  font-weight: 600;
+}}
+
+.diagnostics summary span {{
+  margin-left: 10px;
+  font-weight: normal;
+  color: #bdc3c7;
+}}
+
+.diagnostics table {{
+  min-width: 0;
+}}
+
 /* Tab Navigation */
 .tab-container {{
   background: rgba(255,255,255,0.05);
@@ -710,6 +896,7 @@ tbody tr:hover {{
 
 <div class="container">
   <h1>🏈 Fantasy Truss - Week {nw}</h1>
+  <div id="updateBanner" class="status success" style="display: none; max-width: 600px; margin: 0 auto 20px; text-align: center;"></div>
   
   <!-- ADD THIS SLEEPER CONNECTION WIDGET -->
     <div id="sleeperConnection" style="max-width: 600px; margin: 30px auto; padding: 25px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 15px; box-shadow: 0 8px 32px rgba(0,0,0,0.2);">
@@ -784,6 +971,8 @@ tbody tr:hover {{
       <button class="tab-btn" onclick="switchTab('rankings')">📈 Rankings</button>
       <button class="tab-btn" onclick="switchTab('waiver')">🔥 Waiver Targets</button>
       <button class="tab-btn" onclick="switchTab('lineups')">⚡ Lineup Optimizer</button>
+      <button class="tab-btn" onclick="switchTab('trades')">🤝 Trades</button>
+      <button class="tab-btn" onclick="switchTab('draft')">📋 Draft</button>
       <button class="tab-btn" onclick="switchTab('matchups')">⚔️ Matchups</button>
       <button class="tab-btn" onclick="switchTab('historical')">📚 Historical</button>
     </div>
@@ -827,6 +1016,7 @@ tbody tr:hover {{
               <th>Pos</th>
               <th>Rank</th>
               <th>Week {nw} Proj</th>
+              <th title="Projected points for weeks {nw}-18">ROS Proj</th>
               <th>Floor-Ceiling</th>
               <th>Tier</th>
               <th title="Rating score (0-100) based on prediction accuracy">Rating</th>
@@ -1050,6 +1240,8 @@ tbody tr:hover {{
               <th onclick="sortTable('waiver', 'pos', 'string')" style="cursor: pointer;" title="Click to sort">Pos</th>
               <th onclick="sortTable('waiver', 'rank', 'number')" style="cursor: pointer;" title="Click to sort">Rank</th>
               <th onclick="sortTable('waiver', 'proj', 'number')" style="cursor: pointer;" title="Click to sort">Week {nw} Proj</th>
+              <th onclick="sortTable('waiver', 'lineupGain', 'number')" style="cursor: pointer;" title="Click to sort - ROS points added to your optimal lineup">My Gain</th>
+              <th onclick="sortTable('waiver', 'rivalGain', 'number')" style="cursor: pointer;" title="Click to sort - Largest gain to any other team">Rival Gain</th>
               <th onclick="sortTable('waiver', 'range', 'number')" style="cursor: pointer;" title="Click to sort">Floor-Ceiling</th>
               <th onclick="sortTable('waiver', 'tier', 'string')" style="cursor: pointer;" title="Click to sort">Tier</th>
               <th onclick="sortTable('waiver', 'avgScore', 'number')" style="cursor: pointer;" title="Click to sort">Season Avg</th>
@@ -1066,6 +1258,8 @@ tbody tr:hover {{
       <div style="margin-top: 15px; padding: 15px; background: rgba(111,198,171,0.1); border-left: 3px solid #6fc6ab; border-radius: 5px;">
         <strong>💡 Tips:</strong>
         <ul style="margin: 10px 0 0 20px; color: #bdc3c7;">
+          <li>Priority follows <strong>My Gain</strong>: ROS points the player adds to your optimal lineup (Lineup Optimizer slots)</li>
+          <li><strong>Rival Gain:</strong> the most any other team's lineup would gain - high values are likely claims</li>
           <li>🔥 = Top 5 priority pickups</li>
           <li>⭐ = High value targets</li>
           <li>👀 = Watchlist candidates</li>
@@ -1114,6 +1308,92 @@ tbody tr:hover {{
       <div class="lineup-results" id="lineupResults"></div>
     </div>
     
+    <!-- Trades Tab -->
+    <div id="trades" class="tab-content">
+      <p style="color: #a0aec0; margin-bottom: 15px;">
+        Trades are scored by the change in each team's optimal lineup (ROS projection), using the slots set in the Lineup Optimizer.
+      </p>
+      <div class="lineup-config">
+        <div class="control-group">
+          <label>Team A:</label>
+          <select id="tradeTeamA" onchange="renderTradeRosters()">
+            <option value="">Connect to Sleeper first</option>
+          </select>
+        </div>
+        <div class="control-group">
+          <label>Team B:</label>
+          <select id="tradeTeamB" onchange="renderTradeRosters()">
+            <option value="">Connect to Sleeper first</option>
+          </select>
+        </div>
+      </div>
+      
+      <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0;">
+        <div><h4>Team A gives</h4><div id="tradeGiveList"></div></div>
+        <div><h4>Team B gives</h4><div id="tradeGetList"></div></div>
+      </div>
+      
+      <button onclick="evaluateSelectedTrade()">⚖️ Evaluate Trade</button>
+      <div id="tradeResult" style="margin-top: 15px;"></div>
+      
+      <h3 style="margin: 30px 0 15px;">💡 Suggested Trades</h3>
+      <div class="lineup-config">
+        <div class="control-group">
+          <label>Search:</label>
+          <select id="tradeScope">
+            <option value="mine">My team</option>
+            <option value="league">Whole league</option>
+          </select>
+        </div>
+      </div>
+      <button onclick="renderTradeSuggestions()">🔍 Find Trades</button>
+      <div id="tradeSuggestions" style="margin-top: 15px;"></div>
+    </div>
+    
+    <!-- Draft Tab -->
+    <div id="draft" class="tab-content">
+      <p style="color: #a0aec0; margin-bottom: 15px;">
+        VORP = projected points per game minus the replacement level for the position, read off the historical baseline curves
+        at the last rank a league this size starts (Lineup Optimizer slots, FLEX spots going to the deepest positions).
+      </p>
+      <div class="lineup-config">
+        <div class="control-group">
+          <label>Teams:</label>
+          <input type="number" id="draftTeams" value="12" min="2" max="20" onchange="resetDraft(true)" style="width: 70px;">
+        </div>
+        <div class="control-group">
+          <label>My Pick:</label>
+          <input type="number" id="draftSlot" value="1" min="1" max="20" onchange="renderDraftBoard()" style="width: 70px;">
+        </div>
+        <div class="control-group">
+          <label>🔍 Search:</label>
+          <input type="text" id="draftSearch" placeholder="Player name..." oninput="renderDraftBoard()">
+        </div>
+      </div>
+      <button onclick="undoDraftPick()">↩️ Undo Pick</button>
+      <button onclick="resetDraft(false)">🔄 New Draft</button>
+      
+      <div id="draftStatus" style="margin: 15px 0; font-weight: bold;"></div>
+      <div id="draftScarcity" style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 10px; margin-bottom: 20px;"></div>
+      
+      <div style="display: grid; grid-template-columns: 3fr 1fr; gap: 20px;">
+        <div class="table-container">
+          <table id="draftTable">
+            <thead>
+              <tr><th>#</th><th>Player</th><th>Pos</th><th>Pts/G</th><th>VORP</th><th></th></tr>
+            </thead>
+            <tbody></tbody>
+          </table>
+        </div>
+        <div>
+          <h4>My Team</h4>
+          <div id="draftMyTeam"></div>
+          <h4 style="margin-top: 15px;">Recent Picks</h4>
+          <div id="draftLog"></div>
+        </div>
+      </div>
+    </div>
+    
     <!-- Matchups Tab -->
     <div id="matchups" class="tab-content">
       <div style="text-align: center; padding: 40px; background: rgba(255,255,255,0.05); border-radius: 10px;">
@@ -1160,15 +1440,199 @@ tbody tr:hover {{
       
     </div>
   </div>
+  
+  <!-- Diagnostics -->
+  <details id="diagnosticsPanel" class="diagnostics">
+    <summary>🩺 Diagnostics<span id="diagnosticsSummary"></span></summary>
+    <p style="color: #a0aec0; margin: 10px 0;">
+      Time spent in this browser decoding the embedded data (parse), computing accuracy and projections (compute),
+      rendering tables (dom) and waiting on Sleeper (network). Kind totals count outermost work only.
+    </p>
+    <button onclick="downloadDiagnostics()">💾 Download JSON</button>
+    <button onclick="clearDiagnostics()">🧹 Clear</button>
+    <div class="table-container" style="margin-top: 15px;">
+      <table id="diagnosticsTable">
+        <thead>
+          <tr><th>Measure</th><th>Kind</th><th>Calls</th><th>Total ms</th><th>Max ms</th><th>Last ms</th></tr>
+        </thead>
+        <tbody></tbody>
+      </table>
+    </div>
+  </details>
 </div>
 
 <script>
+// ==================== DIAGNOSTICS ====================
+// Wall time of data decode, compute, rendering and Sleeper requests. Each is a
+// performance.measure (so it also shows in the DevTools Performance panel) and
+// an entry in PERF_ENTRIES, summarized in the Diagnostics panel. Measures nest;
+// only outermost ones count toward the per-kind totals.
+const PERF_KINDS = ['parse', 'compute', 'dom', 'network'];
+const PERF_MAX_ENTRIES = 2000;
+const PERF_SCRIPT_START = performance.now();
+let PERF_ENTRIES = [];
+let PERF_SEQ = 0;
+let PERF_DEPTH = 0;
+let PERF_READY = null;  // ms after navigation start when the first render finished
+let PERF_RENDER_PENDING = false;
+
+function perfBegin(name) {{
+  const mark = `${{name}} #${{++PERF_SEQ}}`;
+  performance.mark(mark);
+  return {{ mark, start: performance.now(), depth: PERF_DEPTH }};
+}}
+
+function perfEnd(name, kind, begun, extra = {{}}) {{
+  const ms = performance.now() - begun.start;
+  performance.measure(name, begun.mark);
+  performance.clearMarks(begun.mark);
+  recordPerf(name, kind, begun.start, ms, begun.depth, extra);
+}}
+
+function recordPerf(name, kind, start, ms, depth, extra = {{}}) {{
+  PERF_ENTRIES.push({{ name, kind, start: Math.round(start * 10) / 10, ms: Math.round(ms * 100) / 100, depth, ...extra }});
+  if (PERF_ENTRIES.length > PERF_MAX_ENTRIES) PERF_ENTRIES.shift();
+  if (!PERF_RENDER_PENDING) {{
+    PERF_RENDER_PENDING = true;
+    setTimeout(() => {{
+      PERF_RENDER_PENDING = false;
+      renderDiagnostics();
+    }}, 250);
+  }}
+}}
+
+function timed(name, kind, fn) {{
+  const begun = perfBegin(name);
+  PERF_DEPTH++;
+  try {{
+    return fn();
+  }} finally {{
+    PERF_DEPTH--;
+    perfEnd(name, kind, begun);
+  }}
+}}
+
+// Wrap a (synchronous) function so every call is measured under its own name
+function instrument(fn, kind) {{
+  return function(...args) {{
+    return timed(fn.name, kind, () => fn.apply(this, args));
+  }};
+}}
+
+// fetch() measured as network time, body included. The body is read here;
+// json() on the result parses it as a separate 'parse' measure.
+async function timedFetch(name, url) {{
+  const begun = {{ ...perfBegin(`fetch ${{name}}`), depth: 0 }};
+  let response = null;
+  let body = '';
+  try {{
+    response = await fetch(url);
+    body = await response.text();
+  }} finally {{
+    perfEnd(`fetch ${{name}}`, 'network', begun,
+            response ? {{ status: response.status, chars: body.length }} : {{ failed: true }});
+  }}
+  return {{
+    ok: response.ok,
+    status: response.status,
+    json: () => timed(`parse ${{name}}`, 'parse', () => JSON.parse(body)),
+  }};
+}}
+
+// Page download and HTML/script parsing, from the Navigation Timing entry
+function recordPageLoad() {{
+  const nav = performance.getEntriesByType ? performance.getEntriesByType('navigation')[0] : null;
+  if (!nav || !nav.responseEnd) return;
+  recordPerf('download page', 'network', nav.requestStart, nav.responseEnd - nav.requestStart, 0,
+             {{ bytes: nav.encodedBodySize || undefined }});
+  recordPerf('parse HTML + compile script', 'parse', nav.responseEnd,
+             Math.max(0, PERF_SCRIPT_START - nav.responseEnd), 0);
+}}
+
+function perfSummary() {{
+  const totals = Object.fromEntries(PERF_KINDS.map(kind => [kind, 0]));
+  const byName = new Map();
+  PERF_ENTRIES.forEach(e => {{
+    if (e.depth === 0) totals[e.kind] += e.ms;
+    let row = byName.get(e.name);
+    if (!row) byName.set(e.name, row = {{ name: e.name, kind: e.kind, calls: 0, total: 0, max: 0, last: 0 }});
+    row.calls++;
+    row.total += e.ms;
+    row.max = Math.max(row.max, e.ms);
+    row.last = e.ms;
+  }});
+  Object.keys(totals).forEach(kind => {{ totals[kind] = Math.round(totals[kind] * 10) / 10; }});
+  return {{ totals, measures: [...byName.values()].sort((a, b) => b.total - a.total) }};
+}}
+
+function renderDiagnostics() {{
+  const {{ totals, measures }} = perfSummary();
+  const ready = PERF_READY === null ? '' : `ready in ${{Math.round(PERF_READY)}}ms · `;
+  document.getElementById('diagnosticsSummary').textContent =
+    ready + PERF_KINDS.map(kind => `${{kind}} ${{Math.round(totals[kind])}}ms`).join(' · ');
+  
+  // The table is only built while the panel is open
+  if (!document.getElementById('diagnosticsPanel').open) return;
+  document.querySelector('#diagnosticsTable tbody').innerHTML = measures.map(m => `
+    <tr>
+      <td>${{m.name}}</td>
+      <td>${{m.kind}}</td>
+      <td>${{m.calls}}</td>
+      <td>${{m.total.toFixed(1)}}</td>
+      <td>${{m.max.toFixed(1)}}</td>
+      <td>${{m.last.toFixed(1)}}</td>
+    </tr>`).join('');
+}}
+
+function diagnosticsReport() {{
+  return {{
+    createdAt: new Date().toISOString(),
+    page: {{ build: BUILD_HASH, currentWeek: CURRENT_WEEK, scoring: CURRENT_SCORING, players: PLAYER_IDS.names.length }},
+    device: {{
+      userAgent: navigator.userAgent,
+      cores: navigator.hardwareConcurrency,
+      memoryGb: navigator.deviceMemory,
+      connection: navigator.connection ? navigator.connection.effectiveType : undefined,
+    }},
+    readyMs: PERF_READY === null ? null : Math.round(PERF_READY),
+    ...perfSummary(),
+    entries: PERF_ENTRIES,
+  }};
+}}
+
+function downloadDiagnostics() {{
+  const blob = new Blob([JSON.stringify(diagnosticsReport(), null, 2)], {{ type: 'application/json' }});
+  const link = document.createElement('a');
+  link.href = URL.createObjectURL(blob);
+  link.download = `fantasy-truss-diagnostics-${{new Date().toISOString().slice(0, 19).replace(/:/g, '')}}.json`;
+  link.click();
+  setTimeout(() => URL.revokeObjectURL(link.href), 0);
+}}
+
+function clearDiagnostics() {{
+  PERF_ENTRIES = [];
+  renderDiagnostics();
+}}
+
+window.addEventListener('DOMContentLoaded', () => {{
+  recordPageLoad();
+  document.getElementById('diagnosticsPanel').addEventListener('toggle', renderDiagnostics);
+}});
+
 // ==================== EMBEDDED DATA ====================
+const BUILD_HASH = '{BUILD_HASH_PLACEHOLDER}';  // sha256 of this page, see WARM START
+const DECODE_BEGUN = perfBegin('decode embedded data');
 const HISTORICAL_DATA = {hist_json};
 const SEASON_2025 = {season_json};
 const WEEKLY_PROJECTIONS = {proj_json};
+const PLAYER_IDS = {ids_json};
+const PRIOR_ACCURACY = {prior_json};
+// Rank -> points curves per format: years[year][pos] and a weighted multi-year blend[pos]
+const BASELINE_CURVES = {baselines_json};
 const CURRENT_WEEK = {cw};
 const NEXT_WEEK = {nw};
+const LAST_WEEK = 18;  // Final week of the regular season
+perfEnd('decode embedded data', 'parse', DECODE_BEGUN, {{ bytes: {payload_bytes} }});
 
 // ==================== GLOBAL STATE ====================
 let CURRENT_SCORING = 'PPR';
@@ -1180,10 +1644,38 @@ let USER_ROSTER = [];
 let ROSTER_SOURCE = 'None';
 let SLEEPER_DATA = null;
 
+// Roster membership by dense player ID (see PLAYER IDS below)
+const ROSTERED_FLAG = 1;
+const MY_ROSTER_FLAG = 2;
+let ROSTER_FLAGS = new Uint8Array(PLAYER_IDS.names.length);
+let PROJECTIONS_BY_ID = [];
+
 // Sleeper-specific variables
 let sleeperUserId = null;
 let sleeperLeagues = null;
 
+// ==================== OFFLINE CACHE ====================
+// Served over http(s) (`generate_dashboard_fixed.py serve`) the page registers
+// service_worker.js, which answers repeat loads and Sleeper requests from its
+// cache and refreshes them in the background. Opened from disk nothing changes.
+if ('serviceWorker' in navigator && location.protocol.startsWith('http')) {{
+  window.addEventListener('load', () => {{
+    navigator.serviceWorker.register('service_worker.js')
+      .then(reg => console.log('📦 Offline cache active, scope', reg.scope))
+      .catch(error => console.log('Service worker unavailable:', error.message));
+  }});
+  
+  // A background refresh found newer data than what was just shown
+  navigator.serviceWorker.addEventListener('message', (event) => {{
+    if (!event.data || event.data.type !== 'sw-updated') return;
+    const banner = document.getElementById('updateBanner');
+    banner.innerHTML = event.data.kind === 'dashboard'
+      ? '🔄 A newer dashboard build is available. <a href="" style="color: #6fc6ab;">Reload</a>'
+      : '🔄 Sleeper data changed since this copy was cached. Connect again to use it.';
+    banner.style.display = 'block';
+  }});
+}}
+
 // ==================== SLEEPER INTEGRATION ====================
 
 // Load saved roster on page load
@@ -1192,7 +1684,14 @@ window.addEventListener('DOMContentLoaded', () => {{
   if (savedUsername) {{
     document.getElementById('sleeperUsername').value = savedUsername;
   }}
-  loadSavedSleeperRoster();
+  // One roster source is active at a time; saves from before that rule may
+  // hold both, so restore the one fetched last
+  const fetchedAt = key => JSON.parse(localStorage.getItem(key) || 'null')?.fetchedAt || '';
+  if (fetchedAt('espn_roster') > fetchedAt('sleeper_roster')) {{
+    loadSavedEspnRoster();
+  }} else {{
+    loadSavedSleeperRoster();
+  }}
 }});
 
 async function loadSleeperLeagues() {{
@@ -1212,7 +1711,7 @@ async function loadSleeperLeagues() {{
   try {{
     localStorage.setItem('sleeper_username', username);
     
-    const userResponse = await fetch(`https://api.sleeper.app/v1/user/${{username}}`);
+    const userResponse = await timedFetch('sleeper user', `https://api.sleeper.app/v1/user/${{username}}`);
     if (!userResponse.ok) throw new Error('Username not found!');
     
     const user = await userResponse.json();
@@ -1220,8 +1719,8 @@ async function loadSleeperLeagues() {{
     console.log('Found user ID:', sleeperUserId);
     
     const currentYear = new Date().getFullYear();
-    const leaguesResponse = await fetch(
-      `https://api.sleeper.app/v1/user/${{sleeperUserId}}/leagues/nfl/${{currentYear}}`
+    const leaguesResponse = await timedFetch(
+      'sleeper leagues', `https://api.sleeper.app/v1/user/${{sleeperUserId}}/leagues/nfl/${{currentYear}}`
     );
     
     if (!leaguesResponse.ok) throw new Error('Could not fetch leagues');
@@ -1279,8 +1778,8 @@ async function connectSleeperLeague() {{
   try {{
     console.log('Connecting to league:', selectedLeague.name);
     
-    const rostersResponse = await fetch(
-      `https://api.sleeper.app/v1/league/${{selectedLeague.league_id}}/rosters`
+    const rostersResponse = await timedFetch(
+      'sleeper rosters', `https://api.sleeper.app/v1/league/${{selectedLeague.league_id}}/rosters`
     );
     const rosters = await rostersResponse.json();
 
@@ -1295,7 +1794,7 @@ async function connectSleeperLeague() {{
     console.log('Total league rosters:', rosters.length);
 
     // Fetch player data
-    const playersResponse = await fetch('https://api.sleeper.app/v1/players/nfl');
+    const playersResponse = await timedFetch('sleeper players', 'https://api.sleeper.app/v1/players/nfl');
     const allPlayers = await playersResponse.json();
 
     // Process USER roster
@@ -1332,18 +1831,13 @@ async function connectSleeperLeague() {{
     }};
 
     localStorage.setItem('sleeper_roster', JSON.stringify(rosterData));
+    localStorage.removeItem('espn_roster');  // Sleeper is the roster source now
     USER_ROSTER = playerNames;
     ALL_ROSTERED = allRosteredPlayers;  // Set global for availability checks
     ROSTER_SOURCE = 'Sleeper';
     
-    console.log('💾 Saved roster data:', {{
-      myTeam: USER_ROSTER.length,
-      allRostered: ALL_ROSTERED.size,
-      teams: rosterData.totalTeams
-    }});
-    
     // Fetch users for team names
-    const usersResponse = await fetch(`https://api.sleeper.app/v1/league/${{selectedLeague.league_id}}/users`);
+    const usersResponse = await timedFetch('sleeper users', `https://api.sleeper.app/v1/league/${{selectedLeague.league_id}}/users`);
     const users = await usersResponse.json();
     
     // Populate SLEEPER_DATA for lineup optimizer
@@ -1360,22 +1854,29 @@ async function connectSleeperLeague() {{
     // Populate team selector dropdown
     populateTeamSelector(rosters, users);
     
-    displayConnectedRoster(rosterData);
-    
-    // Refresh tables to highlight players
-    if (typeof renderProjectionsTable === 'function') {{
-      renderProjectionsTable();
-    }}
+    // Roster flags come straight from Sleeper IDs via the crosswalk
+    const flags = new Uint8Array(PLAYER_IDS.names.length);
+    rosters.forEach(roster => {{
+      (roster.players || []).forEach(pid => {{
+        const id = playerIdBySleeperId(pid, allPlayers);
+        if (id >= 0) flags[id] |= ROSTERED_FLAG;
+      }});
+    }});
+    userRoster.players.forEach(pid => {{
+      const id = playerIdBySleeperId(pid, allPlayers);
+      if (id >= 0) flags[id] |= MY_ROSTER_FLAG;
+    }});
+    // Roster views update from the change (see ROSTER EVENTS); waiver gains
+    // depend on SLEEPER_DATA too, so re-rank them when the flags didn't move
+    if (!setRosterFlags(flags).changed.length) renderWaiverTable();
     
-    // Refresh waiver table now that roster data is available
-    if (typeof renderWaiverTable === 'function') {{
-      renderWaiverTable();
-    }}
+    console.log('💾 Saved roster data:', {{
+      myTeam: USER_ROSTER.length,
+      allRostered: ALL_ROSTERED.size,
+      teams: rosterData.totalTeams
+    }});
     
-    // Update metrics to show roster count
-    if (typeof updateMetrics === 'function') {{
-      updateMetrics();
-    }}
+    displayConnectedRoster(rosterData);
     
     statusDiv.innerHTML = '<span style="color: #28a745;">✅ Roster loaded!</span>';
     
@@ -1406,6 +1907,16 @@ function populateTeamSelector(rosters, users) {{
     selector.appendChild(option);
   }});
   
+  // Trade analyzer team pickers share the same team list
+  ['tradeTeamA', 'tradeTeamB'].forEach((id, pick) => {{
+    const tradeSelector = document.getElementById(id);
+    if (!tradeSelector) return;
+    tradeSelector.innerHTML = selector.innerHTML;
+    const mine = rosters.findIndex(r => r === SLEEPER_DATA?.myRoster);
+    tradeSelector.value = pick === 0 ? Math.max(mine, 0) : (mine === 0 ? 1 : 0);
+  }});
+  if (typeof renderTradeRosters === 'function') renderTradeRosters();
+  
   console.log('✅ Populated', rosters.length, 'teams in selector');
 }}
 
@@ -1441,22 +1952,18 @@ function displayConnectedRoster(rosterData) {{
 function clearSleeperRoster() {{
   if (confirm('Clear your connected roster?')) {{
     localStorage.removeItem('sleeper_roster');
+    localStorage.removeItem('espn_roster');
     USER_ROSTER = [];
     ALL_ROSTERED.clear(); // Clear rostered players set
     ROSTER_SOURCE = 'None';
+    SLEEPER_DATA = null;  // No league for waiver gains or trade suggestions
     document.getElementById('usernameSection').style.display = 'block';
     document.getElementById('leagueSection').style.display = 'none';
     document.getElementById('connectedSection').style.display = 'none';
     document.getElementById('sleeperStatus').innerHTML = '';
     
-    if (typeof renderProjectionsTable === 'function') {{
-      renderProjectionsTable();
-    }}
-    
-    // Refresh waiver table to show "Connect Sleeper" message
-    if (typeof renderWaiverTable === 'function') {{
-      renderWaiverTable();
-    }}
+    // Unflags every rostered row; the waiver tab shows its "Connect Sleeper" message
+    setRosterFlags(new Uint8Array(PLAYER_IDS.names.length));
   }}
 }}
 
@@ -1474,26 +1981,137 @@ function loadSavedSleeperRoster() {{
       }}
       
       ROSTER_SOURCE = 'Sleeper';
+      rebuildRosterFlags();
       console.log('Loaded saved roster:', rosterData.leagueName, USER_ROSTER.length, 'players');
       displayConnectedRoster(rosterData);
-      
-      // Update metrics after loading
-      if (typeof updateMetrics === 'function') {{
-        updateMetrics();
-      }}
-      
-      // Refresh waiver table now that roster data is available
-      if (typeof renderWaiverTable === 'function') {{
-        renderWaiverTable();
-      }}
+      return true;
     }}
   }} catch (e) {{
     console.warn('Could not load saved roster:', e);
   }}
+  return false;
 }}
 
 // ==================== END SLEEPER INTEGRATION ====================
 
+// ==================== ESPN INTEGRATION ====================
+// The ESPN Roster Connector extension (espn-extension/) fetches the whole
+// league in one request and dispatches `espnRosterLoaded` with the user's
+// roster plus `allRostered`, [ESPN id, name] for every player on any team.
+// They map to dense IDs through the crosswalk like Sleeper IDs do (by name
+// when the crosswalk has no ESPN ids, e.g. no sleeper_players.json), so the waiver
+// tab and isRostered() work the same for ESPN leagues. `espnRosterDelta`
+// follows whenever the extension's periodic refresh finds adds or drops, and
+// only those players' flags change (see ROSTER EVENTS).
+
+window.addEventListener('espnRosterLoaded', event => {{
+  const espnData = event.detail;
+  const flags = new Uint8Array(PLAYER_IDS.names.length);
+  const allRostered = new Set();
+  let unmapped = 0;
+  (espnData.allRostered || []).forEach(([espnId, name]) => {{
+    const id = playerIdByEspnId(espnId, name);
+    if (id < 0) {{
+      unmapped++;
+      return;
+    }}
+    flags[id] |= ROSTERED_FLAG;
+    allRostered.add(PLAYER_IDS.names[id]);
+  }});
+  
+  const players = espnData.roster.map(p => {{
+    const id = playerIdByEspnId(p.espnId, p.name);
+    if (id < 0) return p.name;
+    flags[id] |= ROSTERED_FLAG | MY_ROSTER_FLAG;
+    allRostered.add(PLAYER_IDS.names[id]);
+    return PLAYER_IDS.names[id];
+  }});
+  console.log('ESPN roster:', players.length, 'players,', allRostered.size, 'rostered in league',
+              unmapped ? `(${{unmapped}} players not found)` : '');
+  
+  applyEspnRoster({{
+    leagueName: `${{espnData.teamName}} (ESPN)`,
+    leagueId: espnData.leagueId,
+    players: players,
+    allRostered: Array.from(allRostered),
+    totalTeams: espnData.totalTeams,
+    fetchedAt: espnData.fetchedAt || new Date().toISOString()
+  }}, flags);
+}});
+
+window.addEventListener('espnRosterDelta', event => {{
+  // The extension keeps refreshing after Sleeper takes over; its deltas don't apply then
+  if (ROSTER_SOURCE !== 'ESPN') return;
+  const delta = event.detail;
+  const saved = JSON.parse(localStorage.getItem('espn_roster') || 'null');
+  if (!saved || String(saved.leagueId) !== String(delta.leagueId)) return;
+  
+  const flags = ROSTER_FLAGS.slice();
+  const allRostered = new Set(saved.allRostered);
+  const name = (id, p) => id >= 0 ? PLAYER_IDS.names[id] : p.name;
+  delta.rosteredRemoved.forEach(([espnId, name]) => {{
+    const id = playerIdByEspnId(espnId, name);
+    if (id < 0) return;
+    flags[id] &= ~ROSTERED_FLAG;
+    allRostered.delete(PLAYER_IDS.names[id]);
+  }});
+  delta.rosteredAdded.forEach(([espnId, name]) => {{
+    const id = playerIdByEspnId(espnId, name);
+    if (id < 0) return;
+    flags[id] |= ROSTERED_FLAG;
+    allRostered.add(PLAYER_IDS.names[id]);
+  }});
+  
+  // Dropped players stay rostered if another team picked them up (rosteredRemoved says otherwise)
+  const dropped = new Set(delta.removed.map(p => {{
+    const id = playerIdByEspnId(p.espnId, p.name);
+    if (id >= 0) flags[id] &= ~MY_ROSTER_FLAG;
+    return name(id, p);
+  }}));
+  const players = saved.players.filter(n => !dropped.has(n));
+  delta.added.forEach(p => {{
+    const id = playerIdByEspnId(p.espnId, p.name);
+    if (id >= 0) {{
+      flags[id] |= ROSTERED_FLAG | MY_ROSTER_FLAG;
+      allRostered.add(PLAYER_IDS.names[id]);
+    }}
+    players.push(name(id, p));
+  }});
+  
+  applyEspnRoster({{ ...saved, players, allRostered: Array.from(allRostered), fetchedAt: delta.fetchedAt }}, flags);
+}});
+
+// Set the roster globals and save them (same shape as sleeper_roster)
+function applyEspnRoster(rosterData, flags) {{
+  USER_ROSTER = rosterData.players;
+  ALL_ROSTERED = new Set(rosterData.allRostered);
+  ROSTER_SOURCE = 'ESPN';
+  SLEEPER_DATA = null;  // The Sleeper league is no longer the one connected
+  localStorage.setItem('espn_roster', JSON.stringify(rosterData));
+  localStorage.removeItem('sleeper_roster');  // ESPN is the roster source now
+  displayConnectedRoster(rosterData);
+  setRosterFlags(flags);
+}}
+
+function loadSavedEspnRoster() {{
+  try {{
+    const rosterData = JSON.parse(localStorage.getItem('espn_roster') || 'null');
+    if (!rosterData) return false;
+    USER_ROSTER = rosterData.players;
+    ALL_ROSTERED = new Set(rosterData.allRostered);
+    ROSTER_SOURCE = 'ESPN';
+    rebuildRosterFlags();
+    console.log('Loaded saved ESPN roster:', rosterData.leagueName, USER_ROSTER.length, 'players');
+    displayConnectedRoster(rosterData);
+    return true;
+  }} catch (e) {{
+    console.warn('Could not load saved ESPN roster:', e);
+    return false;
+  }}
+}}
+
+// ==================== END ESPN INTEGRATION ====================
+
 // ==================== UTILITY FUNCTIONS ====================
 function normalizePlayerName(name) {{
   if (!name) return '';
@@ -1506,6 +2124,77 @@ function normalizePlayerName(name) {{
     .trim();
 }}
 
+// ==================== PLAYER IDS ====================
+// Every season/ECR record carries a dense integer ID `i` from the generator's
+// crosswalk, so joins are array lookups. Names are only normalized here for
+// data arriving from outside (saved rosters, Sleeper players missing from the crosswalk).
+const INDEX_BEGUN = perfBegin('index embedded data');
+const ID_BY_NORM_NAME = new Map(PLAYER_IDS.names.map((name, id) => [normalizePlayerName(name), id]));
+// Spelling variants the generator resolved by fuzzy match ("Mitchell" -> "Mitch")
+Object.entries(PLAYER_IDS.aliases).forEach(([alias, id]) => {{
+  if (!ID_BY_NORM_NAME.has(alias)) ID_BY_NORM_NAME.set(alias, id);
+}});
+const SLEEPER_TO_ID = new Map(Object.entries(PLAYER_IDS.sleeper));
+const ESPN_TO_ID = new Map(Object.entries(PLAYER_IDS.espn));
+
+function playerIdByName(name) {{
+  const id = ID_BY_NORM_NAME.get(normalizePlayerName(name));
+  return id === undefined ? -1 : id;
+}}
+
+function playerIdBySleeperId(sleeperId, allPlayers) {{
+  const key = String(sleeperId);
+  let id = SLEEPER_TO_ID.get(key);
+  if (id === undefined) {{
+    const player = allPlayers && allPlayers[sleeperId];
+    id = player ? playerIdByName(player.full_name) : -1;
+    SLEEPER_TO_ID.set(key, id);
+  }}
+  return id;
+}}
+
+// ESPN ids missing from the crosswalk fall back to the name when there is one
+function playerIdByEspnId(espnId, name) {{
+  const key = String(espnId);
+  let id = ESPN_TO_ID.get(key);
+  if (id === undefined) {{
+    if (!name) return -1;
+    id = playerIdByName(name);
+    ESPN_TO_ID.set(key, id);
+  }}
+  return id;
+}}
+
+// ECR rows per week, indexed by player ID (first row wins, like Array.find)
+const ECR_BY_WEEK = {{}};
+Object.entries(WEEKLY_PROJECTIONS).forEach(([week, rows]) => {{
+  const byId = [];
+  rows.forEach(row => {{
+    if (row.i >= 0 && byId[row.i] === undefined) byId[row.i] = row;
+  }});
+  ECR_BY_WEEK[week] = byId;
+}});
+
+// Season rows indexed by player ID
+const SEASON_BY_ID = [];
+(SEASON_2025 ? SEASON_2025.data : []).forEach(player => {{
+  if (player.i >= 0 && SEASON_BY_ID[player.i] === undefined) SEASON_BY_ID[player.i] = player;
+}});
+perfEnd('index embedded data', 'parse', INDEX_BEGUN);
+
+function rebuildRosterFlags() {{
+  const flags = new Uint8Array(PLAYER_IDS.names.length);
+  ALL_ROSTERED.forEach(name => {{
+    const id = playerIdByName(name);
+    if (id >= 0) flags[id] |= ROSTERED_FLAG;
+  }});
+  USER_ROSTER.forEach(name => {{
+    const id = playerIdByName(name);
+    if (id >= 0) flags[id] |= MY_ROSTER_FLAG;
+  }});
+  setRosterFlags(flags);
+}}
+
 // Convert percentile (0-1) to grade (0-100) using anchor points
 // Based on statistical best practices for skewed data
 function percentileToGrade(percentile) {{
@@ -1542,6 +2231,68 @@ function percentileToGrade(percentile) {{
   return percentile * 100;
 }}
 
+// Tie-aware percentile ranks in one sort: 0 = worst, 1 = best.
+// Tied values share the average of their positions, so equal metrics get equal grades.
+function percentileRanks(values, higherIsBetter) {{
+  const n = values.length;
+  const percentiles = new Float64Array(n);
+  if (n === 0) return percentiles;
+  if (n === 1) {{
+    percentiles[0] = 0.5;
+    return percentiles;
+  }}
+  
+  // Missing values sort as the worst
+  const worst = higherIsBetter ? -Infinity : Infinity;
+  const keys = Float64Array.from(values, v => Number.isNaN(v) ? worst : v);
+  const order = new Uint32Array(n);
+  for (let i = 0; i < n; i++) order[i] = i;
+  order.sort(higherIsBetter ? (a, b) => keys[a] - keys[b] : (a, b) => keys[b] - keys[a]);
+  
+  let start = 0;
+  while (start < n) {{
+    let end = start;
+    while (end + 1 < n && keys[order[end + 1]] === keys[order[start]]) end++;
+    const percentile = (start + end) / 2 / (n - 1);
+    for (let k = start; k <= end; k++) percentiles[order[k]] = percentile;
+    start = end + 1;
+  }}
+  return percentiles;
+}}
+
+// Pool this season's ranks with past-season running sums from PRIOR_ACCURACY
+// (same layout and math as analytics.AccuracyAccumulator)
+function pooledAccuracy(prior, projectedRanks, actualRanks) {{
+  let [n, sumX, sumY, sumXY, sumX2, sumY2, within3, sumDiff, sumAbs, mean, m2] = prior;
+  projectedRanks.forEach((x, i) => {{
+    const y = actualRanks[i];
+    const d = Math.abs(x - y);
+    n++;
+    sumX += x;
+    sumY += y;
+    sumXY += x * y;
+    sumX2 += x * x;
+    sumY2 += y * y;
+    if (d <= 3) within3++;
+    sumDiff += y - x;
+    sumAbs += d;
+    const delta = d - mean;
+    mean += delta / n;
+    m2 += delta * (d - mean);
+  }});
+  
+  const spread = (n * sumX2 - sumX * sumX) * (n * sumY2 - sumY * sumY);
+  const denominator = spread > 0 ? Math.sqrt(spread) : 0;
+  return {{
+    games: n,
+    correlation: denominator ? (n * sumXY - sumX * sumY) / denominator : 0,
+    mae: sumAbs / n,
+    accuracy: within3 / n,
+    avgDiff: sumDiff / n,
+    consistency: Math.max(0, 1 - Math.sqrt(m2 / n) / 15)
+  }};
+}}
+
 function pearsonCorrelation(x, y) {{
   if (x.length !== y.length || x.length === 0) return 0;
   
@@ -1674,27 +2425,17 @@ function applySorting(data, tableId) {{
 // ==================== END TABLE SORTING ====================
 
 // ==================== CORE CALCULATIONS ====================
+// Accuracy score from MAE: max(0, 100 - (MAE × scale)^exponent), constants from analytics.py
+function powerCurveScore(mae) {{
+  return Math.max(0, 100 - Math.pow(mae * {analytics.POWER_CURVE_SCALE}, {analytics.POWER_CURVE_EXPONENT}));
+}}
+
 function calculatePositionalBaselines() {{
-  const baselines = {{}};
-  
-  ['QB', 'RB', 'WR', 'TE'].forEach(pos => {{
-    const historicalPlayers = HISTORICAL_DATA[CURRENT_SCORING]['2024'] || [];
-    const posPlayers = historicalPlayers
-      .filter(p => p.pos === pos)
-      .map(p => {{
-        const weeks = Object.values(p.w);
-        const avg = weeks.length > 0 ? weeks.reduce((a,b) => a+b, 0) / weeks.length : 0;
-        return avg;
-      }})
-      .filter(avg => avg > 0)
-      .sort((a,b) => b - a);
-    
-    // Store top 100 averages for each position
-    baselines[pos] = posPlayers.slice(0, 100);
-  }});
-  
-  return baselines;
+  // Precomputed by the generator: blended per-game averages by positional rank (top 100)
+  const curves = BASELINE_CURVES[CURRENT_SCORING];
+  return curves ? curves.blend : {{}};
 }}
+
 function calculateFPAccuracy() {{
   FP_ACCURACY = {{}};
   const POSITION_ACCURACY = {{ QB: [], RB: [], WR: [], TE: [] }};
@@ -1704,22 +2445,29 @@ function calculateFPAccuracy() {{
   const seasonData = SEASON_2025.data;
   const weekNums = Object.keys(WEEKLY_PROJECTIONS).map(Number).sort((a,b) => a-b);
   
-  // First pass: Calculate positional ranks for each week's actual scores
+  // First pass: Calculate positional ranks for each week's actual scores,
+  // stored as weeklyRanks[week][pos][playerId] = rank
   const weeklyRanks = {{}};
   weekNums.forEach(weekNum => {{
-    weeklyRanks[weekNum] = {{ QB: [], RB: [], WR: [], TE: [] }};
+    const byPos = {{ QB: [], RB: [], WR: [], TE: [] }};
     
     // Collect all scores by position
     seasonData.forEach(player => {{
       const score = player.w[weekNum];
       if (score !== undefined && score > 0) {{
-        weeklyRanks[weekNum][player.pos].push({{ name: player.p, score: score }});
+        byPos[player.pos].push({{ id: player.i, score: score }});
       }}
     }});
     
     // Sort and assign ranks
+    weeklyRanks[weekNum] = {{}};
     ['QB', 'RB', 'WR', 'TE'].forEach(pos => {{
-      weeklyRanks[weekNum][pos].sort((a, b) => b.score - a.score);
+      byPos[pos].sort((a, b) => b.score - a.score);
+      const rankById = [];
+      byPos[pos].forEach((p, idx) => {{
+        if (p.id >= 0 && rankById[p.id] === undefined) rankById[p.id] = idx + 1;
+      }});
+      weeklyRanks[weekNum][pos] = rankById;
     }});
   }});
   
@@ -1737,15 +2485,13 @@ function calculateFPAccuracy() {{
     
     weekNums.forEach(weekNum => {{
       if (weeks[weekNum] !== undefined && weeks[weekNum] > 0) {{
-        const projData = WEEKLY_PROJECTIONS[weekNum];
+        const projData = ECR_BY_WEEK[weekNum];
         if (projData) {{
-          const normName = normalizePlayerName(name);
-          const proj = projData.find(p => normalizePlayerName(p.p) === normName);
+          const proj = projData[player.i];
           
           if (proj && proj.ecr > 0) {{
             // Find actual rank for this player this week
-            const posPlayers = weeklyRanks[weekNum][pos];
-            const actualRank = posPlayers.findIndex(p => normalizePlayerName(p.name) === normName) + 1;
+            const actualRank = weeklyRanks[weekNum][pos][player.i] || 0;
             
             if (actualRank > 0) {{
               projectedRanks.push(proj.ecr);
@@ -1763,11 +2509,11 @@ function calculateFPAccuracy() {{
     }});
     
     if (projectedRanks.length >= 3) {{
-      const correlation = pearsonCorrelation(projectedRanks, actualRanks);
+      let correlation = pearsonCorrelation(projectedRanks, actualRanks);
       const rankDiffs = projectedRanks.map((p, i) => Math.abs(p - actualRanks[i]));
-      const mae = rankDiffs.reduce((a, b) => a + b, 0) / rankDiffs.length;
-      const within3 = rankDiffs.filter(d => d <= 3).length / rankDiffs.length;  // Within 3 ranks (stricter)
-      const avgDiff = projectedRanks.reduce((sum, p, i) => sum + (actualRanks[i] - p), 0) / projectedRanks.length;
+      let mae = rankDiffs.reduce((a, b) => a + b, 0) / rankDiffs.length;
+      let within3 = rankDiffs.filter(d => d <= 3).length / rankDiffs.length;  // Within 3 ranks (stricter)
+      let avgDiff = projectedRanks.reduce((sum, p, i) => sum + (actualRanks[i] - p), 0) / projectedRanks.length;
       
       // ✅ Calculate average score from all weeks played
       const allScores = Object.values(weeks).filter(score => score !== undefined && score > 0);
@@ -1776,12 +2522,22 @@ function calculateFPAccuracy() {{
       // ✅ Calculate consistency (inverse of standard deviation of rank differences)
       const variance = rankDiffs.reduce((sum, d) => sum + Math.pow(d - mae, 2), 0) / rankDiffs.length;
       const stdDev = Math.sqrt(variance);
-      const consistency = Math.max(0, 1 - (stdDev / 15)); // Normalize to 0-1 (15 ranks = 0 consistency)
+      let consistency = Math.max(0, 1 - (stdDev / 15)); // Normalize to 0-1 (15 ranks = 0 consistency)
+      let games = projectedRanks.length;
+      
+      // ✅ Pool with past seasons' ECR accuracy when we have it
+      const prior = PRIOR_ACCURACY[player.i];
+      if (prior) {{
+        ({{ games, correlation, mae, accuracy: within3, avgDiff, consistency }} =
+          pooledAccuracy(prior, projectedRanks, actualRanks));
+      }}
       
       // Store raw metrics for later percentile calculation
       FP_ACCURACY[name] = {{
+        id: player.i,
         position: pos,
-        games: projectedRanks.length,
+        games: games,
+        seasonGames: projectedRanks.length,
         weeks: weekDetails,
         correlation: correlation,
         mae: mae,
@@ -1812,27 +2568,16 @@ function calculateFPAccuracy() {{
     const players = playersByPosition[pos];
     if (players.length === 0) return;
     
-    // Extract and sort metrics for percentile calculation
-    const maes = players.map(p => p.mae).sort((a, b) => a - b); // Lower is better
-    const correlations = players.map(p => p.correlation).sort((a, b) => b - a); // Higher is better
-    const consistencies = players.map(p => p.consistency).sort((a, b) => b - a); // Higher is better
-    
-    // Calculate percentile ranks and convert to grades for each player
-    players.forEach(player => {{
-      // MAE Grade: Lower MAE = Higher Grade (inverted percentile)
-      const maeRank = maes.indexOf(player.mae);
-      const maePercentile = (maes.length - 1 - maeRank) / (maes.length - 1); // Inverted
-      const maeGrade = percentileToGrade(maePercentile);
-      
-      // Correlation Grade: Higher correlation = Higher Grade
-      const corrRank = correlations.indexOf(player.correlation);
-      const corrPercentile = (correlations.length - 1 - corrRank) / (correlations.length - 1);
-      const corrGrade = percentileToGrade(corrPercentile);
-      
-      // Consistency Grade: Higher consistency = Higher Grade
-      const consRank = consistencies.indexOf(player.consistency);
-      const consPercentile = (consistencies.length - 1 - consRank) / (consistencies.length - 1);
-      const consGrade = percentileToGrade(consPercentile);
+    // Percentile ranks for each metric (one sort per metric)
+    const maePercentiles = percentileRanks(players.map(p => p.mae), false); // Lower is better
+    const corrPercentiles = percentileRanks(players.map(p => p.correlation), true); // Higher is better
+    const consPercentiles = percentileRanks(players.map(p => p.consistency), true); // Higher is better
+    
+    // Convert percentile ranks to grades for each player
+    players.forEach((player, idx) => {{
+      const maeGrade = percentileToGrade(maePercentiles[idx]);
+      const corrGrade = percentileToGrade(corrPercentiles[idx]);
+      const consGrade = percentileToGrade(consPercentiles[idx]);
       
       // Sample Size Bonus (same as before)
       const sampleBonus = Math.min(100, (player.games / 8) * 100);
@@ -1879,27 +2624,147 @@ function calculateFPAccuracy() {{
   return POSITION_ACCURACY;
 }}
 
-function calculateProjections() {{
-  if (!SEASON_2025 || !SEASON_2025.data) return [];
+// ECR rank -> points on the positional baseline curve, extrapolating past its end
+function ecrToPoints(ecr, posBaseline, avgScore) {{
+  const ecrIndex = Math.floor(ecr) - 1;  // Rank 1 = index 0
   
-  const projections = [];
-  const nextWeekECR = WEEKLY_PROJECTIONS[NEXT_WEEK] || [];
-  const baselines = calculatePositionalBaselines();  // ✅ Get positional averages
+  if (ecrIndex < posBaseline.length) {{
+    return posBaseline[ecrIndex];
+  }}
+  // Extrapolate for ranks beyond our data
+  const lastKnown = posBaseline[posBaseline.length - 1] || avgScore;
+  const dropPerRank = 0.3;  // Points decrease per rank
+  return Math.max(lastKnown - (ecrIndex - posBaseline.length) * dropPerRank, 3);  // Minimum 3 points
+}}
+
+// Blend an ECR-based projection with the player's average, weighted by
+// position reliability and (with 5+ games) the player's own ECR correlation
+function blendWithReliability(proj, avgScore, pos, accuracy) {{
+  // ✅ Apply position-level reliability
+  const posReliability = POSITION_ACCURACY[pos]?.avgCorrelation || 0.5;
   
-  SEASON_2025.data.forEach(player => {{
-    const name = player.p;
-    const pos = player.pos;
-    const weeks = player.w;
-    
-    if (!weeks || Object.keys(weeks).length === 0) return;
-    
-    const scores = Object.values(weeks);
-    const avgScore = scores.reduce((a, b) => a + b, 0) / scores.length;
+  // Weight ECR projection by position reliability
+  // High reliability (e.g., RB) = trust ECR more
+  // Low reliability (e.g., QB) = blend more with player average
+  let reliabilityWeight = Math.max(0.3, Math.min(0.9, posReliability));
+  
+  // ⚠️ If position has negative correlation, trust player avg more than ECR
+  if (posReliability < 0) {{
+    reliabilityWeight = 0.3;  // Only 30% weight to ECR if position reliability is broken
+  }}
+  
+  // ✅ Apply player-specific correlation adjustment
+  if (accuracy && accuracy.games >= 5) {{  // ⬆️ Increased from 3 to 5 games minimum
+    // If player has strong personal correlation, use it
+    if (accuracy.correlation > 0.7) {{
+      const playerWeight = 0.7 + (accuracy.correlation - 0.7) * 0.3;
+      return playerWeight * proj + (1 - playerWeight) * avgScore;
+    }}
+    if (accuracy.correlation < 0) {{
+      // Negative correlation - heavily favor player average
+      return 0.3 * proj + 0.7 * avgScore;
+    }}
+    // Otherwise blend using position reliability
+    // (Rank-bias adjustment via accuracy.avgDiff stays disabled: experts already
+    // adjust ECR for recent performance, so it double-penalized players)
+    return reliabilityWeight * proj + (1 - reliabilityWeight) * avgScore;
+  }}
+  
+  // No player history OR not enough games - use position reliability only
+  return reliabilityWeight * proj + (1 - reliabilityWeight) * avgScore;
+}}
+
+// ==================== REST-OF-SEASON PROJECTIONS ====================
+// players × weeks matrix for NEXT_WEEK..LAST_WEEK, built in one pass with the same
+// ECR -> points conversion and reliability blend as calculateProjections().
+// Weeks with an ECR file use it (no ranking that week = bye, 0 points); weeks
+// without one carry the player's latest ECR rank forward.
+let ROS_CACHE = {{}};
+
+function calculateROSProjections() {{
+  if (ROS_CACHE[CURRENT_SCORING]) return ROS_CACHE[CURRENT_SCORING];
+  const started = performance.now();
+  
+  const weeks = [];
+  for (let w = NEXT_WEEK; w <= LAST_WEEK; w++) weeks.push(w);
+  const nWeeks = weeks.length;
+  const ecrWeeks = Object.keys(ECR_BY_WEEK).map(Number).sort((a, b) => a - b);
+  const baselines = calculatePositionalBaselines();
+  
+  const players = (SEASON_2025 ? SEASON_2025.data : []).filter(p => p.w && Object.keys(p.w).length > 0);
+  const ids = new Int32Array(players.length);
+  const matrix = new Float32Array(players.length * nWeeks);
+  const totals = new Float32Array(players.length);
+  const rowById = new Int32Array(PLAYER_IDS.names.length).fill(-1);
+  
+  players.forEach((player, row) => {{
+    ids[row] = player.i;
+    if (player.i >= 0 && rowById[player.i] < 0) rowById[player.i] = row;
+    
+    const scores = Object.values(player.w);
+    const avgScore = scores.reduce((a, b) => a + b, 0) / scores.length;
+    const posBaseline = baselines[player.pos] || [];
+    const accuracy = FP_ACCURACY[player.p];
+    
+    // Latest ECR rank before the ROS window, carried into weeks without rankings
+    let latestRank = 0;
+    for (const w of ecrWeeks) {{
+      if (w >= NEXT_WEEK) break;
+      const r = ECR_BY_WEEK[w][player.i];
+      if (r && r.ecr > 0) latestRank = r.ecr;
+    }}
+    
+    const offset = row * nWeeks;
+    let total = 0;
+    for (let k = 0; k < nWeeks; k++) {{
+      const weekECR = ECR_BY_WEEK[weeks[k]];
+      let rank = latestRank;
+      if (weekECR) {{
+        const r = weekECR[player.i];
+        rank = r && r.ecr > 0 ? r.ecr : 0;
+        if (rank) latestRank = rank;
+      }}
+      const proj = rank ? blendWithReliability(ecrToPoints(rank, posBaseline, avgScore), avgScore, player.pos, accuracy) : 0;
+      matrix[offset + k] = proj;
+      total += proj;
+    }}
+    totals[row] = total;
+  }});
+  
+  const ros = {{ format: CURRENT_SCORING, weeks, ids, rowById, matrix, totals }};
+  ROS_CACHE[CURRENT_SCORING] = ros;
+  console.log(`ROS projections: ${{players.length}} players × ${{nWeeks}} weeks in ${{(performance.now() - started).toFixed(1)}}ms`);
+  return ros;
+}}
+
+// One player's ROS row: {{ weeks, values (Float32Array view), total }}, or null
+function rosForPlayer(playerId, ros = calculateROSProjections()) {{
+  const row = playerId >= 0 ? ros.rowById[playerId] : -1;
+  if (row < 0) return null;
+  const n = ros.weeks.length;
+  return {{ weeks: ros.weeks, values: ros.matrix.subarray(row * n, (row + 1) * n), total: ros.totals[row] }};
+}}
+
+function calculateProjections() {{
+  if (!SEASON_2025 || !SEASON_2025.data) return [];
+  
+  const projections = [];
+  const nextWeekECR = ECR_BY_WEEK[NEXT_WEEK] || [];
+  const baselines = calculatePositionalBaselines();  // ✅ Get positional averages
+  
+  SEASON_2025.data.forEach(player => {{
+    const name = player.p;
+    const pos = player.pos;
+    const weeks = player.w;
+    
+    if (!weeks || Object.keys(weeks).length === 0) return;
+    
+    const scores = Object.values(weeks);
+    const avgScore = scores.reduce((a, b) => a + b, 0) / scores.length;
     const games = scores.length;
     
     // Find ECR for this player
-    const normName = normalizePlayerName(name);
-    const ecrData = nextWeekECR.find(p => normalizePlayerName(p.p) === normName);
+    const ecrData = nextWeekECR[player.i];
     
     // Check if player is on bye (no ECR data for this week)
     let onBye = false;
@@ -1907,6 +2772,7 @@ function calculateProjections() {{
       onBye = true;
       // Still include bye players with basic info
       projections.push({{
+        i: player.i,
         p: name,
         pos: pos,
         proj: 0,
@@ -1937,18 +2803,7 @@ function calculateProjections() {{
     // Now continue with the ECR conversion code below...
       
       // ✅ Convert ECR to points using baseline
-      const posBaseline = baselines[pos] || [];
-      const ecrIndex = Math.floor(ecrData.ecr) - 1;  // Rank 1 = index 0
-      
-      if (ecrIndex < posBaseline.length) {{
-        proj = posBaseline[ecrIndex];
-      }} else {{
-        // Extrapolate for ranks beyond our data
-        const lastKnown = posBaseline[posBaseline.length - 1] || avgScore;
-        const dropPerRank = 0.3;  // Points decrease per rank
-        proj = lastKnown - (ecrIndex - posBaseline.length) * dropPerRank;
-        proj = Math.max(proj, 3);  // Minimum 3 points
-      }}
+      proj = ecrToPoints(ecrData.ecr, baselines[pos] || [], avgScore);
       
       // ✅ Calculate floor/ceiling from std deviation
       const stdDev = ecrData.std || 5;
@@ -1956,52 +2811,11 @@ function calculateProjections() {{
       floor = Math.max(proj - stdPoints, proj * 0.5);
       ceiling = proj + stdPoints;
       
-      // ✅ Apply position-level reliability
-      const posReliability = POSITION_ACCURACY[pos]?.avgCorrelation || 0.5;
-      const posMAE = POSITION_ACCURACY[pos]?.avgMAE || 10;
-      
-      // Weight ECR projection by position reliability
-      // High reliability (e.g., RB) = trust ECR more
-      // Low reliability (e.g., QB) = blend more with player average
-      let reliabilityWeight = Math.max(0.3, Math.min(0.9, posReliability));
-      
-      // ⚠️ If position has negative correlation, trust player avg more than ECR
-      if (posReliability < 0) {{
-        reliabilityWeight = 0.3;  // Only 30% weight to ECR if position reliability is broken
-      }}
-      
-      // ✅ Apply player-specific correlation adjustment
-      const accuracy = FP_ACCURACY[name];
-      if (accuracy && accuracy.games >= 5) {{  // ⬆️ Increased from 3 to 5 games minimum
-        // If player has strong personal correlation, use it
-        if (accuracy.correlation > 0.7) {{
-          const playerWeight = 0.7 + (accuracy.correlation - 0.7) * 0.3;
-          proj = playerWeight * proj + (1 - playerWeight) * avgScore;
-        }} else if (accuracy.correlation < 0) {{
-          // Negative correlation - heavily favor player average
-          proj = 0.3 * proj + 0.7 * avgScore;
-        }} else {{
-          // Otherwise blend using position reliability
-          proj = reliabilityWeight * proj + (1 - reliabilityWeight) * avgScore;
-        }}
-        
-        // ⚠️ DISABLED - Bias adjustment was too aggressive and double-penalized players
-        // Experts already adjust ECR based on recent performance, so we don't need to
-        /*
-        // Adjust for consistent rank bias (over/under-ranking)
-        if (Math.abs(accuracy.avgDiff) > 3) {{
-          // Convert rank difference to approximate point adjustment
-          const pointsPerRank = proj / (ecrData.ecr || 10);
-          const adjustment = -accuracy.avgDiff * pointsPerRank * 0.3;
-          proj += adjustment;
-        }}
-        */
-      }} else {{
-        // No player history OR not enough games - use position reliability only
-        proj = reliabilityWeight * proj + (1 - reliabilityWeight) * avgScore;
-      }}
+      // ✅ Blend with player average by position/player reliability
+      proj = blendWithReliability(proj, avgScore, pos, FP_ACCURACY[name]);
     
     projections.push({{
+      i: player.i,
       p: name,
       pos: pos,
       proj: proj,
@@ -2019,9 +2833,17 @@ function calculateProjections() {{
     }});
   }});
   
+  // Rest-of-season totals (memoized per scoring format)
+  const ros = calculateROSProjections();
+  projections.forEach(p => {{
+    p.ros = rosForPlayer(p.i, ros)?.total || 0;
+  }});
+  
   // Sort by projection (bye weeks will be at bottom with 0 proj)
   projections.sort((a, b) => b.proj - a.proj);
   
+  indexProjections(projections);
+  
   // Assign ranks and tiers (skip bye weeks for rank counting)
   const posCounts = {{ QB: 0, RB: 0, WR: 0, TE: 0 }};
   projections.forEach(p => {{
@@ -2063,6 +2885,106 @@ function calculateProjections() {{
   return projections;
 }}
 
+// Index by player ID for lineup/roster lookups
+function indexProjections(projections) {{
+  PROJECTIONS_BY_ID = [];
+  projections.forEach(p => {{
+    if (p.i >= 0 && PROJECTIONS_BY_ID[p.i] === undefined) PROJECTIONS_BY_ID[p.i] = p;
+  }});
+}}
+
+// ==================== WARM START ====================
+// FP_ACCURACY, POSITION_ACCURACY, PROJECTIONS and the ROS matrix depend only on
+// this page's embedded data and the scoring format. After computing them the
+// page saves them to IndexedDB under `${{BUILD_HASH}}:${{format}}`, and a reload
+// of the same build restores them instead of recomputing. A new build (data or
+// code) has a new hash, misses, and its first save drops the old entries.
+const WARM_DB_NAME = 'fantasy-truss';
+const WARM_STORE = 'computed';
+let WARM_DB = null;          // Promise of the open database (null if unavailable)
+let WARM_DB_HANDLE = null;   // The database once open, for synchronous saves
+
+function openWarmDb() {{
+  if (!WARM_DB) {{
+    WARM_DB = new Promise(resolve => {{
+      if (typeof indexedDB === 'undefined') return resolve(null);
+      const request = indexedDB.open(WARM_DB_NAME, 1);
+      request.onupgradeneeded = () => request.result.createObjectStore(WARM_STORE);
+      request.onsuccess = () => resolve(WARM_DB_HANDLE = request.result);
+      request.onerror = () => resolve(null);  // e.g. blocked by privacy settings: always compute
+    }});
+  }}
+  return WARM_DB;
+}}
+
+function warmKey(format) {{
+  return `${{BUILD_HASH}}:${{format}}`;
+}}
+
+// Saved state for `format`, or null
+async function loadWarmStart(format) {{
+  const begun = {{ ...perfBegin('warm start lookup'), depth: 0 }};
+  const db = await openWarmDb();
+  const snapshot = db && await new Promise(resolve => {{
+    try {{
+      const request = db.transaction(WARM_STORE).objectStore(WARM_STORE).get(warmKey(format));
+      request.onsuccess = () => resolve(request.result || null);
+      request.onerror = () => resolve(null);
+    }} catch (error) {{
+      resolve(null);
+    }}
+  }});
+  perfEnd('warm start lookup', 'parse', begun, {{ hit: !!snapshot }});
+  return snapshot;
+}}
+
+function applyWarmStart(snapshot, format) {{
+  FP_ACCURACY = snapshot.fpAccuracy;
+  POSITION_ACCURACY = snapshot.positionAccuracy;
+  PROJECTIONS = snapshot.projections;
+  ROS_CACHE[format] = snapshot.ros;
+  indexProjections(PROJECTIONS);
+}}
+
+// Save the state just computed for `format`. Synchronous, so the snapshot is
+// taken before any render annotates the projection objects.
+function saveWarmStart(format) {{
+  if (!WARM_DB_HANDLE) return;
+  try {{
+    const store = WARM_DB_HANDLE.transaction(WARM_STORE, 'readwrite').objectStore(WARM_STORE);
+    store.put({{
+      fpAccuracy: FP_ACCURACY,
+      positionAccuracy: POSITION_ACCURACY,
+      projections: PROJECTIONS,
+      ros: ROS_CACHE[format],
+      savedAt: new Date().toISOString()
+    }}, warmKey(format));
+    store.getAllKeys().onsuccess = (event) => {{
+      event.target.result
+        .filter(key => !String(key).startsWith(`${{BUILD_HASH}}:`))
+        .forEach(key => store.delete(key));
+    }};
+  }} catch (error) {{
+    console.warn('Warm start not saved:', error);  // e.g. storage quota
+  }}
+}}
+
+// Restore `format` from the snapshot or compute (and save) it. Returns false if
+// the format was switched again meanwhile; that newer switch takes over.
+async function loadComputedState(format) {{
+  const snapshot = await loadWarmStart(format);
+  if (format !== CURRENT_SCORING) return false;
+  if (snapshot) {{
+    applyWarmStart(snapshot, format);
+    console.log(`⚡ Warm start: restored ${{format}} results for build ${{BUILD_HASH}}`);
+  }} else {{
+    POSITION_ACCURACY = calculateFPAccuracy();
+    PROJECTIONS = calculateProjections();
+    saveWarmStart(format);
+  }}
+  return true;
+}}
+
 // ==================== RENDERING FUNCTIONS ====================
 function updateMetrics() {{
   const cards = [
@@ -2070,7 +2992,7 @@ function updateMetrics() {{
     {{ label: 'With FP Data', value: PROJECTIONS.filter(p => p.hasECR).length }},
     {{ label: 'High Accuracy', value: Object.values(FP_ACCURACY).filter(a => a.correlation > 0.7).length }},
     {{ label: 'My Roster', value: USER_ROSTER.length }},
-    {{ label: 'Available', value: PROJECTIONS.filter(p => !isRostered(p.p)).length }}
+    {{ label: 'Available', value: PROJECTIONS.filter(p => !isRostered(p.i)).length }}
   ];
   
   const html = cards.map(card => `
@@ -2083,52 +3005,60 @@ function updateMetrics() {{
   document.getElementById('statsCards').innerHTML = html;
 }}
 
-function renderProjectionsTable() {{
+// Predicate for the projections table's current filters
+function projectionsFilter() {{
   const posFilter = document.getElementById('posFilter').value;
   const rosterFilter = document.getElementById('rosterFilter').value;
   const searchTerm = document.getElementById('searchBox').value.toLowerCase();
   
-  let filtered = PROJECTIONS.filter(p => {{
+  return p => {{
     if (posFilter !== 'ALL' && p.pos !== posFilter) return false;
-    if (rosterFilter === 'MY_ROSTER' && !isOnRoster(p.p)) return false;
-    if (rosterFilter === 'AVAILABLE' && isRostered(p.p)) return false;
+    if (rosterFilter === 'MY_ROSTER' && !isOnRoster(p.i)) return false;
+    if (rosterFilter === 'AVAILABLE' && isRostered(p.i)) return false;
     if (searchTerm && !p.p.toLowerCase().includes(searchTerm)) return false;
     return true;
-  }});
+  }};
+}}
+
+function renderProjectionsTable() {{
+  let filtered = PROJECTIONS.filter(projectionsFilter());
   
   // ✅ APPLY SORTING
   filtered = applySorting(filtered, 'projections');
   
   const tbody = document.getElementById('projectionsTable').querySelector('tbody');
-  tbody.innerHTML = filtered.map(p => {{
-    // Calculate rating score from MAE
-    const rating = p.mae > 0 ? Math.max(0, 100 - Math.pow(p.mae * 0.5, 1.3)) : 0;
-    const ratingClass = rating >= 90 ? 'high-acc' : rating >= 75 ? 'med-acc' : 'low-acc';
-    
-    // Trend display with value
-    const trendIcon = p.avgDiff < -2 ? '📈' : p.avgDiff > 2 ? '📉' : '➡️';
-    const trendClass = p.avgDiff < -2 ? 'trend-up' : p.avgDiff > 2 ? 'trend-down' : 'trend-stable';
-    const trendText = p.avgDiff !== 0 ? (p.avgDiff > 0 ? '+' : '') + p.avgDiff.toFixed(1) : '0.0';
-    
-    const roster = isOnRoster(p.p) ? '🏠' : '';
-    const rowClass = isOnRoster(p.p) ? 'my-roster' : isRostered(p.p) ? 'rostered' : '';
-    
-    // Check if player is on bye (has no ECR for this week but exists in season data)
-    const byeIndicator = p.onBye ? ' 🚫 BYE' : '';
-    
-    return `
-      <tr class="pos-${{p.pos}} ${{rowClass}}">
-        <td>${{roster}} ${{p.p}}${{byeIndicator}}</td>
-        <td>${{p.pos}}</td>
-        <td>${{p.rank}}</td>
-        <td><strong>${{p.onBye ? '-' : p.proj.toFixed(1)}}</strong></td>
-        <td>${{p.onBye ? '-' : p.floor.toFixed(1) + ' - ' + p.ceiling.toFixed(1)}}</td>
-        <td><span class="badge ${{p.tier.toLowerCase()}}">${{p.tier}}</span></td>
-        <td class="${{ratingClass}}" title="MAE: ${{p.mae.toFixed(1)}} ranks">${{rating > 0 ? rating.toFixed(0) : '-'}}</td>
-        <td class="${{trendClass}}" title="Avg rank difference">${{trendIcon}} ${{trendText}}</td>
-      </tr>
-    `;
-  }}).join('');
+  tbody.innerHTML = filtered.map(projectionRowHtml).join('');
+}}
+
+function projectionRowHtml(p) {{
+  // Calculate rating score from MAE
+  const rating = p.mae > 0 ? powerCurveScore(p.mae) : 0;
+  const ratingClass = rating >= 90 ? 'high-acc' : rating >= 75 ? 'med-acc' : 'low-acc';
+  
+  // Trend display with value
+  const trendIcon = p.avgDiff < -2 ? '📈' : p.avgDiff > 2 ? '📉' : '➡️';
+  const trendClass = p.avgDiff < -2 ? 'trend-up' : p.avgDiff > 2 ? 'trend-down' : 'trend-stable';
+  const trendText = p.avgDiff !== 0 ? (p.avgDiff > 0 ? '+' : '') + p.avgDiff.toFixed(1) : '0.0';
+  
+  const roster = isOnRoster(p.i) ? '🏠' : '';
+  const rowClass = rosterRowClass(p.i);
+  
+  // Check if player is on bye (has no ECR for this week but exists in season data)
+  const byeIndicator = p.onBye ? ' 🚫 BYE' : '';
+  
+  return `
+    <tr class="pos-${{p.pos}} ${{rowClass}}" data-id="${{p.i}}">
+      <td><span class="roster-mark">${{roster}}</span> ${{p.p}}${{byeIndicator}}</td>
+      <td>${{p.pos}}</td>
+      <td>${{p.rank}}</td>
+      <td><strong>${{p.onBye ? '-' : p.proj.toFixed(1)}}</strong></td>
+      <td>${{p.ros > 0 ? p.ros.toFixed(1) : '-'}}</td>
+      <td>${{p.onBye ? '-' : p.floor.toFixed(1) + ' - ' + p.ceiling.toFixed(1)}}</td>
+      <td><span class="badge ${{p.tier.toLowerCase()}}">${{p.tier}}</span></td>
+      <td class="${{ratingClass}}" title="MAE: ${{p.mae.toFixed(1)}} ranks">${{rating > 0 ? rating.toFixed(0) : '-'}}</td>
+      <td class="${{trendClass}}" title="Avg rank difference">${{trendIcon}} ${{trendText}}</td>
+    </tr>
+  `;
 }}
 
 function renderReliabilityTable() {{
@@ -2145,7 +3075,7 @@ function renderReliabilityTable() {{
       if (stats.games < minGames) return false;
       
       // Get avgScore
-      const playerData = SEASON_2025.data.find(pd => pd.p === name);
+      const playerData = SEASON_BY_ID[stats.id];
       let avgScore = 0;
       if (playerData && playerData.w) {{
         const scores = Object.values(playerData.w);
@@ -2167,13 +3097,13 @@ function renderReliabilityTable() {{
       if (searchTerm && !name.toLowerCase().includes(searchTerm)) return false;
       
       // Filter by roster status
-      if (rosterFilter === 'ROSTERED' && !isRostered(name)) return false;
-      if (rosterFilter === 'AVAILABLE' && isRostered(name)) return false;
+      if (rosterFilter === 'ROSTERED' && !isRostered(stats.id)) return false;
+      if (rosterFilter === 'AVAILABLE' && isRostered(stats.id)) return false;
       
       return true;
     }})
     .map(([name, stats]) => {{
-      const playerData = SEASON_2025.data.find(pd => pd.p === name);
+      const playerData = SEASON_BY_ID[stats.id];
       let avgScore = 0;
       if (playerData && playerData.w) {{
         const scores = Object.values(playerData.w);
@@ -2181,6 +3111,7 @@ function renderReliabilityTable() {{
       }}
       
       return {{
+        id: stats.id,
         name: name,
         position: stats.position,
         games: stats.games,
@@ -2230,11 +3161,11 @@ function renderReliabilityTable() {{
     const consistencyPct = (p.consistency * 100).toFixed(0);
     
     // Add roster indicator
-    const rosterIcon = isRostered(p.name) ? '⭐' : '';
+    const rosterIcon = isRostered(p.id) ? '⭐' : '';
     
     return `
-      <tr class="pos-${{p.position}}">
-        <td>${{rosterIcon}} ${{p.name}}</td>
+      <tr class="pos-${{p.position}}" data-id="${{p.id}}">
+        <td><span class="roster-mark">${{rosterIcon}}</span> ${{p.name}}</td>
         <td>${{p.position}}</td>
         <td>${{p.games}}</td>
         <td class="${{reliabilityClass}}"><strong>${{reliabilityIcon}} ${{reliability.toFixed(0)}}</strong></td>
@@ -2261,7 +3192,7 @@ function renderTop20Visualization() {{
       if (stats.games < minGames) return false;
       
       // Get avgScore
-      const playerData = SEASON_2025.data.find(pd => pd.p === name);
+      const playerData = SEASON_BY_ID[stats.id];
       let avgScore = 0;
       if (playerData && playerData.w) {{
         const scores = Object.values(playerData.w);
@@ -2280,12 +3211,12 @@ function renderTop20Visualization() {{
       }}
       
       // Apply roster status based on top20Mode
-      if (top20Mode === 'available' && isRostered(name)) return false;
+      if (top20Mode === 'available' && isRostered(stats.id)) return false;
       
       return true;
     }})
     .map(([name, stats]) => {{
-      const playerData = SEASON_2025.data.find(pd => pd.p === name);
+      const playerData = SEASON_BY_ID[stats.id];
       let avgScore = 0;
       if (playerData && playerData.w) {{
         const scores = Object.values(playerData.w);
@@ -2293,6 +3224,7 @@ function renderTop20Visualization() {{
       }}
       
       return {{
+        id: stats.id,
         name: name,
         position: stats.position,
         reliabilityScore: stats.reliabilityScore || 0,
@@ -2343,7 +3275,7 @@ function renderTop20Visualization() {{
       TE: '#e683bf'
     }};
     
-    const rosterIcon = isRostered(p.name) ? ' ⭐' : '';
+    const rosterIcon = isRostered(p.id) ? ' ⭐' : '';
     
     return `
       <div style="
@@ -2354,9 +3286,9 @@ function renderTop20Visualization() {{
         position: relative;
         transition: transform 0.2s;
         cursor: pointer;
-      " onmouseover="this.style.transform='scale(1.05)'" onmouseout="this.style.transform='scale(1)'">
+      " data-id="${{p.id}}" onmouseover="this.style.transform='scale(1.05)'" onmouseout="this.style.transform='scale(1)'">
         <div style="position: absolute; top: 8px; right: 8px; font-size: 1.2em;">${{icon}}</div>
-        <div style="font-weight: bold; font-size: 1.1em; margin-bottom: 5px; padding-right: 25px;">#${{idx + 1}}${{rosterIcon}} ${{p.name}}</div>
+        <div style="font-weight: bold; font-size: 1.1em; margin-bottom: 5px; padding-right: 25px;">#${{idx + 1}}<span class="roster-mark">${{rosterIcon}}</span> ${{p.name}}</div>
         <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
           <span style="background: ${{posColors[p.position] || '#7f8c8d'}}; padding: 2px 8px; border-radius: 3px; font-size: 0.85em; font-weight: bold;">${{p.position}}</span>
           <span style="font-size: 0.9em; color: #bdc3c7;">${{p.avgScore.toFixed(1)}} PPG</span>
@@ -2424,12 +3356,12 @@ function renderWaiverTable() {{
   if (ALL_ROSTERED.size === 0) {{
     tbody.innerHTML = `
       <tr>
-        <td colspan="11" style="text-align: center; padding: 40px;">
+        <td colspan="13" style="text-align: center; padding: 40px;">
           <div style="background: rgba(231,76,60,0.1); border: 2px solid #e74c3c; border-radius: 10px; padding: 30px; max-width: 600px; margin: 0 auto;">
             <div style="font-size: 2em; margin-bottom: 15px;">⚠️</div>
             <h3 style="margin-bottom: 15px; color: #e74c3c;">No Roster Data Available</h3>
             <p style="color: #bdc3c7; margin-bottom: 20px;">
-              To see waiver targets, you need to connect to Sleeper so we can filter out rostered players.
+              To see waiver targets, you need to connect to Sleeper (or send your ESPN roster from the extension) so we can filter out rostered players.
             </p>
             <button onclick="document.getElementById('connectBtn').click()" style="padding: 12px 24px; background: #27ae60; border: none; border-radius: 8px; color: white; font-size: 1.1em; cursor: pointer; font-weight: bold;">
               📱 Connect to Sleeper
@@ -2461,7 +3393,7 @@ function renderWaiverTable() {{
   // Filter available players
   let available = PROJECTIONS.filter(p => {{
     // Must not be rostered
-    if (isRostered(p.p)) return false;
+    if (isRostered(p.i)) return false;
     
     // Search filter
     if (searchTerm && !p.p.toLowerCase().includes(searchTerm)) return false;
@@ -2482,7 +3414,13 @@ function renderWaiverTable() {{
     return true;
   }});
   
-  // Apply sorting
+  // Rank by lineup impact when we know the league's rosters, then any column sort.
+  // Gains belong to this league and render, so they go on copies of the rows.
+  const gains = computeWaiverGains(available);
+  if (gains) {{
+    available = available.map(p => ({{ ...p, ...gains.get(p) }}));
+    available.sort((a, b) => b.lineupGain - a.lineupGain || b.rivalGain - a.rivalGain || b.proj - a.proj);
+  }}
   available = applySorting(available, 'waiver');
   
   // Limit results
@@ -2495,7 +3433,7 @@ function renderWaiverTable() {{
   if (limitedResults.length === 0) {{
     tbody.innerHTML = `
       <tr>
-        <td colspan="11" style="text-align: center; padding: 40px; color: #95a5a6;">
+        <td colspan="13" style="text-align: center; padding: 40px; color: #95a5a6;">
           <div style="font-size: 1.2em; margin-bottom: 10px;">No players found</div>
           <div>Try adjusting your filters or lowering the minimum projection</div>
         </td>
@@ -2555,6 +3493,8 @@ function renderWaiverTable() {{
         <td>${{p.pos}}</td>
         <td>${{p.rank}}</td>
         <td><strong style="color: #6fc6ab;">${{p.proj.toFixed(1)}}</strong></td>
+        <td><strong>${{p.lineupGain != null ? '+' + p.lineupGain.toFixed(1) : '-'}}</strong></td>
+        <td title="${{p.rivalTeam || ''}}">${{p.rivalGain != null ? '+' + p.rivalGain.toFixed(1) : '-'}}</td>
         <td style="font-size: 0.9em; color: #bdc3c7;">${{floorCeiling}}</td>
         <td><span class="badge ${{p.tier.toLowerCase()}}">${{p.tier}}</span></td>
         <td>${{seasonAvg}}</td>
@@ -2593,47 +3533,25 @@ function renderPositionalBaselines() {{
   const positions = ['QB', 'RB', 'WR', 'TE'];
   const container = document.getElementById('baselineTables');
   
+  const curves = BASELINE_CURVES[CURRENT_SCORING] || {{ years: {{}} }};
+  const years = Object.keys(curves.years).sort();
+  
   const html = positions.map(pos => {{
-    const posData = {{}};
-    
-    // Calculate averages for each rank across years
-    ['2022', '2023', '2024'].forEach(year => {{
-      const yearData = HISTORICAL_DATA[CURRENT_SCORING][year] || [];
-      const posPlayers = yearData.filter(p => p.pos === pos);
-      
-      // ✅ Calculate averages first, then sort by average score
-      const playersWithAvg = posPlayers.map(player => {{
-        const weeks = Object.values(player.w);
-        const avg = weeks.length > 0 ? weeks.reduce((a, b) => a + b, 0) / weeks.length : 0;
-        return {{ player, avg }};
-      }}).sort((a, b) => b.avg - a.avg);  // Sort by average score descending
+    // Precomputed curves: curves.years[year][pos][rank - 1] = per-game average
+    const depth = Math.min(24, Math.max(0, ...years.map(year => curves.years[year][pos].length)));
+    const rows = Array.from({{ length: depth }}, (_, idx) => {{
+      const vals = years.map(year => curves.years[year][pos][idx]);
+      const present = vals.filter(v => v !== undefined);
+      const avgAll = present.length > 0 ? present.reduce((a, b) => a + b, 0) / present.length : 0;
       
-      playersWithAvg.forEach(({{ player, avg }}, idx) => {{
-        const rank = idx + 1;
-        if (rank > 24) return;
-        
-        if (!posData[rank]) posData[rank] = {{}};
-        posData[rank][year] = avg;
-      }});
-    }});
-    
-    // Calculate 3-year averages
-    const rows = Object.entries(posData)
-      .sort((a, b) => parseInt(a[0]) - parseInt(b[0]))
-      .map(([rank, years]) => {{
-        const vals = Object.values(years);
-        const avg3yr = vals.length > 0 ? vals.reduce((a,b) => a+b, 0) / vals.length : 0;
-        
-        return `
+      return `
           <tr class="pos-${{pos}}">
-            <td><strong>${{rank}}</strong></td>
-            <td>${{years['2022']?.toFixed(1) || '-'}}</td>
-            <td>${{years['2023']?.toFixed(1) || '-'}}</td>
-            <td>${{years['2024']?.toFixed(1) || '-'}}</td>
-            <td><strong>${{avg3yr.toFixed(1)}}</strong></td>
+            <td><strong>${{idx + 1}}</strong></td>
+            ${{vals.map(v => `<td>${{v?.toFixed(1) || '-'}}</td>`).join('')}}
+            <td><strong>${{avgAll.toFixed(1)}}</strong></td>
           </tr>
         `;
-      }}).join('');
+    }}).join('');
     
     return `
       <div class="historical-section">
@@ -2643,10 +3561,8 @@ function renderPositionalBaselines() {{
             <thead>
               <tr>
                 <th>Rank</th>
-                <th>2022</th>
-                <th>2023</th>
-                <th>2024</th>
-                <th>3-Yr Avg</th>
+                ${{years.map(year => `<th>${{year}}</th>`).join('')}}
+                <th>${{years.length}}-Yr Avg</th>
               </tr>
             </thead>
             <tbody>${{rows}}</tbody>
@@ -2684,7 +3600,7 @@ function renderHistoricalTable() {{
       // Fallback to PROJECTIONS if needed
       let pos = acc.position || '?';
       if (pos === '?' || !pos) {{
-        const playerProj = PROJECTIONS.find(p => p.p === name);
+        const playerProj = PROJECTIONS_BY_ID[acc.id];
         pos = playerProj?.pos || '?';
       }}
       
@@ -2717,9 +3633,8 @@ function renderHistoricalTable() {{
     else if (p.correlation >= 0.5) corrClass = 'med-acc';
     
     // Calculate accuracy score from MAE (0-100 scale)
-    // Formula: max(0, 100 - (MAE × 0.5)^1.3)
     // Power curve that rewards excellence: Best (MAE 3.6) = 98, Median (MAE 17) = 84, Worst (MAE 63) = 12
-    const accuracyScore = Math.max(0, 100 - Math.pow((p.mae || 0) * 0.5, 1.3));
+    const accuracyScore = powerCurveScore(p.mae || 0);
     
     // Determine accuracy class for color coding (adjusted for power curve distribution)
     let accClass = 'low-acc';
@@ -2753,37 +3668,119 @@ function renderHistoricalTable() {{
   console.log('✅ Historical table rendered with', data.length, 'players');
 }}
 
-function isOnRoster(playerName) {{
-  if (!playerName) return false;
-  if (!USER_ROSTER || USER_ROSTER.length === 0) return false;
-  
-  const normalizedPlayer = normalizePlayerName(playerName);
-  if (!normalizedPlayer) return false;
-  
-  return USER_ROSTER.some(rosterName => {{
-    if (!rosterName) return false;
-    const normalizedRoster = normalizePlayerName(rosterName);
-    return normalizedRoster === normalizedPlayer;
-  }});
+// Accept a dense player ID (fast path) or a name from outside the crosswalk
+function isOnRoster(player) {{
+  const id = typeof player === 'number' ? player : playerIdByName(player);
+  return id >= 0 && (ROSTER_FLAGS[id] & MY_ROSTER_FLAG) !== 0;
 }}
 
-function isRostered(playerName) {{
-  if (!playerName) return false;
-  if (ALL_ROSTERED.size === 0) return false;
-  
-  const normalized = normalizePlayerName(playerName);
-  if (!normalized) return false;
+function isRostered(player) {{
+  const id = typeof player === 'number' ? player : playerIdByName(player);
+  return id >= 0 && (ROSTER_FLAGS[id] & ROSTERED_FLAG) !== 0;
+}}
+
+function rosterRowClass(id) {{
+  return isOnRoster(id) ? 'my-roster' : isRostered(id) ? 'rostered' : '';
+}}
+
+// ==================== ROSTER EVENTS ====================
+// Every roster sync (Sleeper connect, the ESPN extension, saved rosters,
+// clearing) hands its new flags to setRosterFlags(), which tells listeners
+// which player IDs were added to or removed from rosters. Views patch just
+// those players' rows, so a sync doesn't re-render the 700-row tables.
+const ROSTER_LISTENERS = [];
+
+function onRosterChange(listener) {{
+  ROSTER_LISTENERS.push(listener);
+}}
+
+// Replace ROSTER_FLAGS; listeners get {{ changed, added, removed, myAdded, myRemoved }}
+function setRosterFlags(flags) {{
+  const change = {{ changed: [], added: [], removed: [], myAdded: [], myRemoved: [] }};
+  for (let id = 0; id < flags.length; id++) {{
+    const diff = ROSTER_FLAGS[id] ^ flags[id];
+    if (!diff) continue;
+    change.changed.push(id);
+    if (diff & ROSTERED_FLAG) (flags[id] & ROSTERED_FLAG ? change.added : change.removed).push(id);
+    if (diff & MY_ROSTER_FLAG) (flags[id] & MY_ROSTER_FLAG ? change.myAdded : change.myRemoved).push(id);
+  }}
+  ROSTER_FLAGS = flags;
+  if (change.changed.length) {{
+    console.log(`Roster change: +${{change.added.length}} / -${{change.removed.length}} rostered,`,
+                `+${{change.myAdded.length}} / -${{change.myRemoved.length}} mine`);
+    ROSTER_LISTENERS.forEach(listener => listener(change));
+  }}
+  return change;
+}}
+
+// Restyle, drop or insert the changed players' projections rows in place
+function patchProjectionRows(ids) {{
+  const tbody = document.getElementById('projectionsTable').querySelector('tbody');
+  const visible = projectionsFilter();
+  const inserts = new Set();
+  ids.forEach(id => {{
+    const p = PROJECTIONS_BY_ID[id];
+    if (!p) return;
+    const row = tbody.querySelector(`tr[data-id="${{id}}"]`);
+    if (!visible(p)) {{
+      if (row) row.remove();
+    }} else if (row) {{
+      row.className = `pos-${{p.pos}} ${{rosterRowClass(id)}}`;
+      row.querySelector('.roster-mark').textContent = isOnRoster(id) ? '🏠' : '';
+    }} else {{
+      inserts.add(p);
+    }}
+  }});
+  if (inserts.size === 0) return;
   
-  // Check if player is on ANY roster in the league
-  for (const rosteredPlayer of ALL_ROSTERED) {{
-    if (normalizePlayerName(rosteredPlayer) === normalized) {{
-      return true;
+  // Rows now match the sorted, filtered list minus the inserts: walk both
+  // and put each new row before the row that follows it
+  let row = tbody.firstElementChild;
+  applySorting(PROJECTIONS.filter(visible), 'projections').forEach(p => {{
+    if (!inserts.has(p)) {{
+      row = row && row.nextElementSibling;
+    }} else if (row) {{
+      row.insertAdjacentHTML('beforebegin', projectionRowHtml(p));
+    }} else {{
+      tbody.insertAdjacentHTML('beforeend', projectionRowHtml(p));
     }}
+  }});
+}}
+
+// Reliability rows and Top 20 cards only show a ⭐; rows come and go only
+// under a roster filter, which re-renders that view instead
+function patchReliabilityRows(ids) {{
+  const rosterFilter = document.getElementById('reliabilityRosterFilter')?.value || 'ALL';
+  if (rosterFilter !== 'ALL') {{
+    renderReliabilityTable();
+  }} else {{
+    patchRosterMarks('#reliabilityTable tbody', ids, '⭐');
   }}
   
-  return false;
+  if (top20Mode === 'available') {{
+    renderTop20Visualization();
+  }} else {{
+    patchRosterMarks('#top20Grid', ids, ' ⭐');
+  }}
+}}
+
+function patchRosterMarks(containerSelector, ids, mark) {{
+  const container = document.querySelector(containerSelector);
+  if (!container) return;
+  ids.forEach(id => {{
+    container.querySelectorAll(`[data-id="${{id}}"] .roster-mark`).forEach(el => {{
+      el.textContent = isRostered(id) ? mark : '';
+    }});
+  }});
 }}
 
+onRosterChange(change => {{
+  patchProjectionRows(change.changed);
+  patchReliabilityRows(change.changed);
+  renderWaiverTable();  // Availability is its whole filter, and it only shows the top few
+  updateMetrics();
+}});
+
 // ==================== LINEUP OPTIMIZER ====================
 function generateOptimalLineup() {{
   const teamIdx = parseInt(document.getElementById('teamSelector').value);
@@ -2800,16 +3797,18 @@ function generateOptimalLineup() {{
     const p = players[pid];
     if (!p || !p.full_name) return null;
     
-    const proj = PROJECTIONS.find(pr => normalizePlayerName(pr.p) === normalizePlayerName(p.full_name));
+    const id = playerIdBySleeperId(pid, players);
+    const proj = id >= 0 ? PROJECTIONS_BY_ID[id] : undefined;
     return proj ? {{ ...proj, sleeperPos: p.position }} : null;
   }}).filter(Boolean);
   
   // Get slot counts
-  const qbSlots = parseInt(document.getElementById('qbSlots').value) || 0;
-  const rbSlots = parseInt(document.getElementById('rbSlots').value) || 0;
-  const wrSlots = parseInt(document.getElementById('wrSlots').value) || 0;
-  const teSlots = parseInt(document.getElementById('teSlots').value) || 0;
-  const flexSlots = parseInt(document.getElementById('flexSlots').value) || 0;
+  const slots = getLineupSlots();
+  const qbSlots = slots.QB;
+  const rbSlots = slots.RB;
+  const wrSlots = slots.WR;
+  const teSlots = slots.TE;
+  const flexSlots = slots.FLEX;
   
   // Separate by position
   const byPos = {{
@@ -2891,6 +3890,478 @@ function generateOptimalLineup() {{
   `;
 }}
 
+// ==================== LINEUP ENGINE ====================
+// Shared by the trade analyzer and waiver engine. A team is its player values
+// sorted per position; the optimal lineup is the top N per position plus the
+// best remaining RB/WR/TE for FLEX (greedy is exact for this slot layout).
+const LINEUP_POSITIONS = ['QB', 'RB', 'WR', 'TE'];
+const FLEX_POSITIONS = new Set(['RB', 'WR', 'TE']);
+
+function getLineupSlots() {{
+  const read = id => parseInt(document.getElementById(id)?.value) || 0;
+  return {{ QB: read('qbSlots'), RB: read('rbSlots'), WR: read('wrSlots'), TE: read('teSlots'), FLEX: read('flexSlots') }};
+}}
+
+// Roster decisions use ROS points when we have them, otherwise next week
+function lineupValue(p) {{
+  return p.ros > 0 ? p.ros : p.proj;
+}}
+
+// {{ QB: [values desc], ... }} for a list of player IDs
+function buildTeamValues(playerIds) {{
+  const byPos = {{ QB: [], RB: [], WR: [], TE: [] }};
+  playerIds.forEach(id => {{
+    const p = PROJECTIONS_BY_ID[id];
+    if (p && byPos[p.pos]) byPos[p.pos].push(lineupValue(p));
+  }});
+  LINEUP_POSITIONS.forEach(pos => byPos[pos].sort((a, b) => b - a));
+  return byPos;
+}}
+
+function lineupTotal(byPos, slots) {{
+  let total = 0;
+  const flexPool = [];
+  LINEUP_POSITIONS.forEach(pos => {{
+    const vals = byPos[pos];
+    const starters = Math.min(slots[pos], vals.length);
+    for (let i = 0; i < starters; i++) total += vals[i];
+    if (FLEX_POSITIONS.has(pos)) {{
+      for (let i = starters; i < vals.length; i++) flexPool.push(vals[i]);
+    }}
+  }});
+  flexPool.sort((a, b) => b - a);
+  for (let i = 0; i < Math.min(slots.FLEX, flexPool.length); i++) total += flexPool[i];
+  return total;
+}}
+
+// Cutoffs of the current optimal lineup, so adding one player is O(1)
+function lineupSummary(byPos, slots) {{
+  const open = {{}};
+  const starterMin = {{}};
+  const flexPool = [];
+  LINEUP_POSITIONS.forEach(pos => {{
+    const vals = byPos[pos];
+    const k = slots[pos];
+    open[pos] = vals.length < k;
+    starterMin[pos] = k === 0 ? Infinity : (open[pos] ? -Infinity : vals[k - 1]);
+    if (FLEX_POSITIONS.has(pos)) {{
+      for (let i = Math.min(k, vals.length); i < vals.length; i++) flexPool.push(vals[i]);
+    }}
+  }});
+  flexPool.sort((a, b) => b - a);
+  const flexMin = slots.FLEX === 0 ? Infinity :
+    (flexPool.length >= slots.FLEX ? flexPool[slots.FLEX - 1] : -Infinity);
+  return {{ open, starterMin, flexMin, flexSlots: slots.FLEX }};
+}}
+
+function flexGain(summary, value) {{
+  if (summary.flexSlots === 0) return 0;
+  return summary.flexMin === -Infinity ? value : Math.max(0, value - summary.flexMin);
+}}
+
+// Lineup gain from adding one player, without re-optimizing
+function addGain(summary, pos, value) {{
+  if (summary.open[pos]) return value;  // Fills an empty starting slot
+  const flexible = FLEX_POSITIONS.has(pos);
+  if (value > summary.starterMin[pos]) {{
+    // Starts; the displaced starter drops into the FLEX pool
+    const displaced = summary.starterMin[pos];
+    return value - displaced + (flexible ? flexGain(summary, displaced) : 0);
+  }}
+  return flexible ? flexGain(summary, value) : 0;
+}}
+
+// Teams from the connected Sleeper league: [{{ index, name, ids }}]
+function leagueTeams() {{
+  if (!SLEEPER_DATA) return [];
+  const users = SLEEPER_DATA.users || [];
+  return SLEEPER_DATA.rosters.map((roster, index) => {{
+    const user = users.find(u => u.user_id === roster.owner_id);
+    const name = user ? (user.metadata?.team_name || user.display_name || `Team ${{index + 1}}`) : `Team ${{index + 1}}`;
+    const ids = (roster.players || [])
+      .map(pid => playerIdBySleeperId(pid, SLEEPER_DATA.players))
+      .filter(id => id >= 0 && PROJECTIONS_BY_ID[id]);
+    return {{ index, name, ids, mine: roster === SLEEPER_DATA.myRoster }};
+  }});
+}}
+
+// ==================== TRADE ANALYZER ====================
+// Change in each side's optimal lineup for team A sending `give` and receiving `get`
+function evaluateTrade(teamA, give, teamB, get, slots = getLineupSlots()) {{
+  const giveSet = new Set(give);
+  const getSet = new Set(get);
+  const beforeA = lineupTotal(buildTeamValues(teamA.ids), slots);
+  const beforeB = lineupTotal(buildTeamValues(teamB.ids), slots);
+  const afterA = lineupTotal(buildTeamValues(teamA.ids.filter(id => !giveSet.has(id)).concat(get)), slots);
+  const afterB = lineupTotal(buildTeamValues(teamB.ids.filter(id => !getSet.has(id)).concat(give)), slots);
+  return {{ beforeA, afterA, gainA: afterA - beforeA, beforeB, afterB, gainB: afterB - beforeB }};
+}}
+
+// Best mutually beneficial 1-for-1, 2-for-1, 1-for-2 and 2-for-2 trades, ranked
+// by the smaller side's gain. Branch and bound: lineups are submodular, so what
+// a team gains from a package is at most the sum of each player's standalone
+// addGain(); packages whose bound can't beat the current top results are skipped.
+function suggestTrades(teams, {{ onlyTeam = null, limit = 10, slots = getLineupSlots() }} = {{}}) {{
+  const started = performance.now();
+  const values = teams.map(t => buildTeamValues(t.ids));
+  const summaries = values.map(v => lineupSummary(v, slots));
+  const totals = values.map(v => lineupTotal(v, slots));
+  const results = [];
+  let threshold = 0;  // A package must beat this to make the list
+  let evaluated = 0;
+  
+  const keep = trade => {{
+    results.push(trade);
+    results.sort((a, b) => b.score - a.score);
+    if (results.length > limit) results.pop();
+    if (results.length === limit) threshold = results[limit - 1].score;
+  }};
+  
+  // Singles and pairs of `ids` that `receiver` could use, with their upper bound
+  const packages = (ids, receiver) => {{
+    const singles = ids
+      .map(id => {{
+        const p = PROJECTIONS_BY_ID[id];
+        return {{ ids: [id], bound: addGain(summaries[receiver], p.pos, lineupValue(p)) }};
+      }})
+      .filter(pkg => pkg.bound > 0)
+      .sort((a, b) => b.bound - a.bound);
+    const pairs = [];
+    for (let i = 0; i < singles.length; i++) {{
+      for (let j = i + 1; j < singles.length; j++) {{
+        pairs.push({{ ids: [singles[i].ids[0], singles[j].ids[0]], bound: singles[i].bound + singles[j].bound }});
+      }}
+    }}
+    return {{ singles, pairs: pairs.sort((a, b) => b.bound - a.bound) }};
+  }};
+  
+  const exact = (a, b, give, get) => {{
+    evaluated++;
+    const giveSet = new Set(give);
+    const getSet = new Set(get);
+    const afterA = lineupTotal(buildTeamValues(teams[a].ids.filter(id => !giveSet.has(id)).concat(get)), slots);
+    const afterB = lineupTotal(buildTeamValues(teams[b].ids.filter(id => !getSet.has(id)).concat(give)), slots);
+    return {{ gainA: afterA - totals[a], gainB: afterB - totals[b] }};
+  }};
+  
+  for (let a = 0; a < teams.length; a++) {{
+    for (let b = a + 1; b < teams.length; b++) {{
+      if (onlyTeam !== null && a !== onlyTeam && b !== onlyTeam) continue;
+      const fromA = packages(teams[a].ids, b);  // What B would want from A
+      const fromB = packages(teams[b].ids, a);  // What A would want from B
+      
+      [[fromA.singles, fromB.singles], [fromA.pairs, fromB.singles],
+       [fromA.singles, fromB.pairs], [fromA.pairs, fromB.pairs]].forEach(([gives, gets]) => {{
+        for (const give of gives) {{
+          if (give.bound <= threshold) break;  // Sorted: nothing further can qualify
+          for (const get of gets) {{
+            if (get.bound <= threshold) break;
+            const {{ gainA, gainB }} = exact(a, b, give.ids, get.ids);
+            const score = Math.min(gainA, gainB);
+            if (score > threshold) {{
+              keep({{ a, b, give: give.ids, get: get.ids, gainA, gainB, score }});
+            }}
+          }}
+        }}
+      }});
+    }}
+  }}
+  
+  console.log(`Trade search: ${{teams.length}} teams, ${{evaluated}} trades evaluated in ${{(performance.now() - started).toFixed(0)}}ms`);
+  return results;
+}}
+
+function tradeCheckboxes(team, containerId) {{
+  const container = document.getElementById(containerId);
+  if (!container) return;
+  const players = team.ids.map(id => PROJECTIONS_BY_ID[id]).sort((x, y) => lineupValue(y) - lineupValue(x));
+  container.innerHTML = players.map(p => `
+    <label style="display: block; padding: 4px 0;">
+      <input type="checkbox" value="${{p.i}}"> ${{p.p}} (${{p.pos}}) - ${{lineupValue(p).toFixed(1)}}
+    </label>
+  `).join('') || '<p style="color: #95a5a6;">No projected players</p>';
+}}
+
+function renderTradeRosters() {{
+  const teams = leagueTeams();
+  const a = teams[parseInt(document.getElementById('tradeTeamA')?.value)];
+  const b = teams[parseInt(document.getElementById('tradeTeamB')?.value)];
+  if (a) tradeCheckboxes(a, 'tradeGiveList');
+  if (b) tradeCheckboxes(b, 'tradeGetList');
+}}
+
+function tradeSummaryHtml(teams, trade) {{
+  const names = ids => ids.map(id => PROJECTIONS_BY_ID[id]?.p || PLAYER_IDS.names[id]).join(' + ');
+  const fmt = v => (v >= 0 ? '+' : '') + v.toFixed(1);
+  return `
+    <tr>
+      <td><strong>${{teams[trade.a].name}}</strong> gives ${{names(trade.give)}}</td>
+      <td><strong>${{teams[trade.b].name}}</strong> gives ${{names(trade.get)}}</td>
+      <td class="${{trade.gainA >= 0 ? 'trend-up' : 'trend-down'}}">${{fmt(trade.gainA)}}</td>
+      <td class="${{trade.gainB >= 0 ? 'trend-up' : 'trend-down'}}">${{fmt(trade.gainB)}}</td>
+    </tr>
+  `;
+}}
+
+function evaluateSelectedTrade() {{
+  const resultDiv = document.getElementById('tradeResult');
+  const teams = leagueTeams();
+  const a = parseInt(document.getElementById('tradeTeamA').value);
+  const b = parseInt(document.getElementById('tradeTeamB').value);
+  if (!teams[a] || !teams[b] || a === b) {{
+    resultDiv.innerHTML = '<p style="color: #95a5a6;">Pick two different teams (connect to Sleeper first).</p>';
+    return;
+  }}
+  const checked = id => Array.from(document.querySelectorAll(`#${{id}} input:checked`)).map(el => parseInt(el.value));
+  const give = checked('tradeGiveList');
+  const get = checked('tradeGetList');
+  const result = evaluateTrade(teams[a], give, teams[b], get);
+  resultDiv.innerHTML = `
+    <div class="table-container"><table>
+      <thead><tr><th>Team A</th><th>Team B</th><th>A lineup Δ</th><th>B lineup Δ</th></tr></thead>
+      <tbody>${{tradeSummaryHtml(teams, {{ a, b, give, get, ...result }})}}</tbody>
+    </table></div>
+  `;
+}}
+
+function renderTradeSuggestions() {{
+  const container = document.getElementById('tradeSuggestions');
+  const teams = leagueTeams();
+  if (teams.length < 2) {{
+    container.innerHTML = '<p style="color: #95a5a6;">Connect to Sleeper first.</p>';
+    return;
+  }}
+  const mine = teams.findIndex(t => t.mine);
+  const onlyTeam = document.getElementById('tradeScope').value === 'mine' && mine >= 0 ? mine : null;
+  const trades = suggestTrades(teams, {{ onlyTeam }});
+  container.innerHTML = trades.length === 0 ? '<p style="color: #95a5a6;">No trades help both sides.</p>' : `
+    <div class="table-container"><table>
+      <thead><tr><th>Side 1</th><th>Side 2</th><th>Side 1 Δ</th><th>Side 2 Δ</th></tr></thead>
+      <tbody>${{trades.map(t => tradeSummaryHtml(teams, t)).join('')}}</tbody>
+    </table></div>
+  `;
+}}
+
+// ==================== WAIVER ENGINE ====================
+// Marginal value of each free agent to every roster in the league. Each team's
+// lineup is summarized once; every (player, team) pair is then an O(1) addGain().
+// Returns Map(projection row -> {{ lineupGain, rivalGain, rivalTeam }}) (rows,
+// not IDs, since unmapped players share ID -1), or null with no league connected.
+function computeWaiverGains(available, slots = getLineupSlots()) {{
+  const teams = leagueTeams();
+  if (teams.length === 0) return null;
+  const started = performance.now();
+  
+  const summaries = teams.map(t => lineupSummary(buildTeamValues(t.ids), slots));
+  const mine = teams.findIndex(t => t.mine);
+  
+  const gains = new Map();
+  available.forEach(p => {{
+    const value = lineupValue(p);
+    const gain = {{ lineupGain: mine >= 0 ? addGain(summaries[mine], p.pos, value) : 0, rivalGain: 0, rivalTeam: '' }};
+    for (let t = 0; t < summaries.length; t++) {{
+      if (t === mine) continue;
+      const rival = addGain(summaries[t], p.pos, value);
+      if (rival > gain.rivalGain) {{
+        gain.rivalGain = rival;
+        gain.rivalTeam = teams[t].name;
+      }}
+    }}
+    gains.set(p, gain);
+  }});
+  
+  console.log(`Waiver engine: ${{available.length}} players x ${{teams.length}} teams in ${{(performance.now() - started).toFixed(1)}}ms`);
+  return gains;
+}}
+
+// ==================== DRAFT ASSISTANT ====================
+// Replacement levels are fixed by league size and slots, so a pick only
+// touches the drafted player's position: its cursor into the VORP-sorted
+// position list advances past taken players and its starter count drops.
+// Picks and undos are O(1) (amortized for the cursor).
+let DRAFT = null;
+
+// Rank of the first non-starter per position once FLEX spots are handed to
+// whichever position has the most valuable next player on the baseline curve
+function replacementRanks(teams, slots, curves) {{
+  const ranks = {{}};
+  LINEUP_POSITIONS.forEach(pos => {{ ranks[pos] = teams * slots[pos]; }});
+  const curveAt = (pos, rank) => {{
+    const curve = curves[pos] || [];
+    return curve.length ? curve[Math.min(rank, curve.length - 1)] : 0;
+  }};
+  for (let f = 0; f < teams * slots.FLEX; f++) {{
+    let best = null;
+    FLEX_POSITIONS.forEach(pos => {{
+      if (best === null || curveAt(pos, ranks[pos]) > curveAt(best, ranks[best])) best = pos;
+    }});
+    ranks[best]++;
+  }}
+  const levels = {{}};
+  LINEUP_POSITIONS.forEach(pos => {{ levels[pos] = curveAt(pos, ranks[pos]); }});
+  return {{ ranks, levels }};
+}}
+
+function initDraft(picks = []) {{
+  const teams = Math.max(2, parseInt(document.getElementById('draftTeams')?.value) || 12);
+  const slots = getLineupSlots();
+  const {{ ranks, levels }} = replacementRanks(teams, slots, calculatePositionalBaselines());
+  const ros = calculateROSProjections();
+  const nWeeks = ros.weeks.length;
+  
+  const nIds = PLAYER_IDS.names.length;
+  const rate = new Float32Array(nIds);
+  const vorp = new Float32Array(nIds).fill(-Infinity);
+  const byPos = {{ QB: [], RB: [], WR: [], TE: [] }};
+  PROJECTIONS.forEach(p => {{
+    if (p.i < 0 || !byPos[p.pos] || vorp[p.i] !== -Infinity) return;
+    rate[p.i] = nWeeks > 0 && p.ros > 0 ? p.ros / nWeeks : p.proj;
+    vorp[p.i] = rate[p.i] - levels[p.pos];
+    byPos[p.pos].push(p.i);
+  }});
+  
+  const cursor = {{}};
+  const starters = {{}};
+  LINEUP_POSITIONS.forEach(pos => {{
+    byPos[pos].sort((a, b) => vorp[b] - vorp[a]);
+    cursor[pos] = 0;
+    starters[pos] = byPos[pos].filter(id => vorp[id] > 0).length;
+  }});
+  const order = LINEUP_POSITIONS.flatMap(pos => byPos[pos]).sort((a, b) => vorp[b] - vorp[a]);
+  const slotOf = new Int32Array(nIds).fill(-1);  // Index of each player in byPos[pos]
+  LINEUP_POSITIONS.forEach(pos => byPos[pos].forEach((id, k) => {{ slotOf[id] = k; }}));
+  
+  DRAFT = {{
+    format: CURRENT_SCORING, teams, slots, ranks, levels, rate, vorp, byPos, order, slotOf,
+    cursor, starters, drafted: new Int16Array(nIds).fill(-1), picks: []
+  }};
+  // Picks are made in snake order, so replaying them under a new league size
+  // reassigns each to the team on the clock for its pick number
+  picks.forEach(pick => applyDraftPick(pick.id, draftTeamForPick(DRAFT.picks.length, teams)));
+}}
+
+// Team on the clock for a pick number (snake order)
+function draftTeamForPick(pickNo, teams) {{
+  const round = Math.floor(pickNo / teams);
+  const inRound = pickNo % teams;
+  return round % 2 === 0 ? inRound : teams - 1 - inRound;
+}}
+
+function advanceCursor(pos) {{
+  const list = DRAFT.byPos[pos];
+  while (DRAFT.cursor[pos] < list.length && DRAFT.drafted[list[DRAFT.cursor[pos]]] >= 0) DRAFT.cursor[pos]++;
+}}
+
+function applyDraftPick(id, team) {{
+  const pos = PROJECTIONS_BY_ID[id]?.pos;
+  if (!pos || DRAFT.drafted[id] >= 0) return false;
+  DRAFT.drafted[id] = team;
+  DRAFT.picks.push({{ id, team }});
+  if (DRAFT.vorp[id] > 0) DRAFT.starters[pos]--;
+  advanceCursor(pos);
+  return true;
+}}
+
+function draftPlayer(id) {{
+  if (!DRAFT) initDraft();
+  applyDraftPick(id, draftTeamForPick(DRAFT.picks.length, DRAFT.teams));
+  renderDraftBoard();
+}}
+
+function undoDraftPick() {{
+  if (!DRAFT || DRAFT.picks.length === 0) return;
+  const {{ id }} = DRAFT.picks.pop();
+  const pos = PROJECTIONS_BY_ID[id].pos;
+  DRAFT.drafted[id] = -1;
+  if (DRAFT.vorp[id] > 0) DRAFT.starters[pos]++;
+  DRAFT.cursor[pos] = Math.min(DRAFT.cursor[pos], DRAFT.slotOf[id]);
+  renderDraftBoard();
+}}
+
+// keepPicks re-values the board (new league size, slots or format) and replays the picks
+function resetDraft(keepPicks) {{
+  const picks = keepPicks && DRAFT ? DRAFT.picks : [];
+  initDraft(picks);
+  renderDraftBoard();
+}}
+
+// Best available per position, with the drop to the next one: O(1) per position
+function draftPositionSummary(pos) {{
+  const list = DRAFT.byPos[pos];
+  const best = list[DRAFT.cursor[pos]];
+  let next;
+  for (let k = DRAFT.cursor[pos] + 1; k < list.length; k++) {{
+    if (DRAFT.drafted[list[k]] < 0) {{ next = list[k]; break; }}
+  }}
+  return {{
+    best,
+    vorp: best === undefined ? 0 : DRAFT.vorp[best],
+    dropoff: best === undefined ? 0 : DRAFT.vorp[best] - (next === undefined ? 0 : DRAFT.vorp[next]),
+    starters: DRAFT.starters[pos]
+  }};
+}}
+
+function renderDraftBoard() {{
+  if (!document.getElementById('draftTable')) return;
+  if (!DRAFT || DRAFT.format !== CURRENT_SCORING) initDraft(DRAFT ? DRAFT.picks : []);
+  
+  const mySlot = Math.min(Math.max(parseInt(document.getElementById('draftSlot')?.value) || 1, 1), DRAFT.teams) - 1;
+  const onClock = draftTeamForPick(DRAFT.picks.length, DRAFT.teams);
+  const round = Math.floor(DRAFT.picks.length / DRAFT.teams) + 1;
+  
+  const summaries = {{}};
+  LINEUP_POSITIONS.forEach(pos => {{ summaries[pos] = draftPositionSummary(pos); }});
+  const recommended = LINEUP_POSITIONS
+    .filter(pos => summaries[pos].best !== undefined)
+    .sort((a, b) => summaries[b].vorp - summaries[a].vorp)[0];
+  const rec = recommended ? PROJECTIONS_BY_ID[summaries[recommended].best] : null;
+  
+  document.getElementById('draftStatus').innerHTML =
+    `Round ${{round}}, pick ${{DRAFT.picks.length + 1}} - ${{onClock === mySlot ? '🟢 You are on the clock' : `Team ${{onClock + 1}} on the clock`}}` +
+    (rec ? ` · Best available: ${{rec.p}} (${{rec.pos}}, VORP ${{DRAFT.vorp[rec.i].toFixed(1)}})` : '');
+  
+  document.getElementById('draftScarcity').innerHTML = LINEUP_POSITIONS.map(pos => {{
+    const sum = summaries[pos];
+    const best = sum.best !== undefined ? PROJECTIONS_BY_ID[sum.best] : null;
+    return `
+      <div class="stat-card" style="padding: 15px;">
+        <h4 style="margin: 0; font-size: 0.9em; color: #bdc3c7;">${{pos}} · ${{sum.starters}} starters left</h4>
+        <div style="font-size: 1.1em; font-weight: bold;">${{best ? best.p : 'None'}}</div>
+        <div style="font-size: 0.85em; color: #bdc3c7;">Replacement ${{DRAFT.levels[pos].toFixed(1)}} (${{pos}}${{DRAFT.ranks[pos] + 1}}) · drop-off ${{sum.dropoff.toFixed(1)}}</div>
+      </div>
+    `;
+  }}).join('');
+  
+  const searchTerm = (document.getElementById('draftSearch')?.value || '').toLowerCase();
+  const rows = [];
+  for (const id of DRAFT.order) {{
+    if (rows.length >= 100) break;
+    if (DRAFT.drafted[id] >= 0) continue;
+    const p = PROJECTIONS_BY_ID[id];
+    if (searchTerm && !p.p.toLowerCase().includes(searchTerm)) continue;
+    rows.push(`
+      <tr class="pos-${{p.pos}}">
+        <td>${{rows.length + 1}}</td>
+        <td><strong>${{p.p}}</strong></td>
+        <td>${{p.pos}}</td>
+        <td>${{DRAFT.rate[id].toFixed(1)}}</td>
+        <td><strong>${{DRAFT.vorp[id].toFixed(1)}}</strong></td>
+        <td><button onclick="draftPlayer(${{id}})">Draft</button></td>
+      </tr>
+    `);
+  }}
+  document.getElementById('draftTable').querySelector('tbody').innerHTML = rows.join('');
+  
+  const pickLine = pick => {{
+    const p = PROJECTIONS_BY_ID[pick.id];
+    return `<div style="padding: 3px 0;">${{p.p}} (${{p.pos}}) <span style="color: #95a5a6;">${{DRAFT.vorp[pick.id].toFixed(1)}}</span></div>`;
+  }};
+  const mine = DRAFT.picks.filter(pick => pick.team === mySlot);
+  document.getElementById('draftMyTeam').innerHTML = mine.map(pickLine).join('') || '<p style="color: #95a5a6;">No picks yet</p>';
+  document.getElementById('draftLog').innerHTML = DRAFT.picks.slice(-8).reverse()
+    .map(pick => `<div style="padding: 3px 0;">T${{pick.team + 1}}: ${{PROJECTIONS_BY_ID[pick.id].p}}</div>`).join('');
+}}
+
 // ==================== TAB SWITCHING ====================
 function switchTab(tabName) {{
   // Update buttons
@@ -2943,22 +4414,43 @@ function sortReliability(column) {{
   sortTable('reliability', column);
 }}
 
+// ==================== INSTRUMENTATION ====================
+// Rebind the heavy functions to measured wrappers (see DIAGNOSTICS). Callers,
+// including inline onclick handlers, look the names up at call time.
+calculateFPAccuracy = instrument(calculateFPAccuracy, 'compute');
+calculateProjections = instrument(calculateProjections, 'compute');
+computeWaiverGains = instrument(computeWaiverGains, 'compute');
+suggestTrades = instrument(suggestTrades, 'compute');
+updateMetrics = instrument(updateMetrics, 'dom');
+renderProjectionsTable = instrument(renderProjectionsTable, 'dom');
+patchProjectionRows = instrument(patchProjectionRows, 'dom');
+patchReliabilityRows = instrument(patchReliabilityRows, 'dom');
+renderReliabilityTable = instrument(renderReliabilityTable, 'dom');
+renderTop20Visualization = instrument(renderTop20Visualization, 'dom');
+renderRankingsTable = instrument(renderRankingsTable, 'dom');
+renderWaiverTable = instrument(renderWaiverTable, 'dom');
+renderPositionalBaselines = instrument(renderPositionalBaselines, 'dom');
+renderHistoricalTable = instrument(renderHistoricalTable, 'dom');
+generateOptimalLineup = instrument(generateOptimalLineup, 'dom');
+renderTradeRosters = instrument(renderTradeRosters, 'dom');
+renderTradeSuggestions = instrument(renderTradeSuggestions, 'dom');
+renderDraftBoard = instrument(renderDraftBoard, 'dom');
+
 // ==================== INITIALIZATION ====================
-document.addEventListener('DOMContentLoaded', () => {{
+document.addEventListener('DOMContentLoaded', async () => {{
   console.log('🏈 Fantasy Truss Loaded');
   console.log('Data:', {{
-    historical: Object.keys(HISTORICAL_DATA.PPR).length,
+    historical: Object.keys(BASELINE_CURVES.PPR?.years || {{}}).length,
     season: SEASON_2025.data.length,
     projections: Object.keys(WEEKLY_PROJECTIONS).length
   }});
   
-  // Calculate everything
-  POSITION_ACCURACY = calculateFPAccuracy();
+  // Calculate everything (or restore it from an earlier load of this build)
+  await loadComputedState(CURRENT_SCORING);
   console.log('📊 ECR Accuracy Stats:');
   console.log(`  Players with ECR history: ${{Object.keys(FP_ACCURACY).length}}`);
   console.log('  Position reliability:', POSITION_ACCURACY);
   
-  PROJECTIONS = calculateProjections();
   console.log(`📈 Generated ${{PROJECTIONS.length}} projections`);
   console.log(`  With ECR: ${{PROJECTIONS.filter(p => p.hasECR).length}}`);
   
@@ -2980,20 +4472,21 @@ document.addEventListener('DOMContentLoaded', () => {{
   renderWaiverTable();
   renderHistoricalTable();        // ← Player reliability
   renderPositionalBaselines();     // ← Your baseline data
+  renderDraftBoard();
   
+  PERF_READY = performance.now();
   console.log('✅ Dashboard ready!');
 }});
 
 // Scoring format change handler
 const scoringFormatEl = document.getElementById('scoringFormat');
 if (scoringFormatEl) {{
-  scoringFormatEl.addEventListener('change', (e) => {{
+  scoringFormatEl.addEventListener('change', async (e) => {{
     CURRENT_SCORING = e.target.value;
     console.log('Switched to', CURRENT_SCORING);
     
-    // Recalculate with new scoring
-    calculateFPAccuracy();
-    PROJECTIONS = calculateProjections();
+    // Recalculate with new scoring (or restore it)
+    if (!(await loadComputedState(CURRENT_SCORING))) return;
     
     // Re-render everything
     updateMetrics();
@@ -3002,32 +4495,334 @@ if (scoringFormatEl) {{
     renderRankingsTable('QB');
     renderWaiverTable();
     renderHistoricalTable();
+    resetDraft(true);
   }});
 }}
 </script>
 
 </body>
 </html>'''
+        s['bytes'] = len(html)
+    
+    # Hash of the whole page (data and code) keys the page's warm-start
+    # snapshot, so any change to either invalidates it
+    with profiler.stage('build hash'):
+        build_hash = hashlib.sha256(html.encode('utf-8')).hexdigest()[:16]
+        html = html.replace(BUILD_HASH_PLACEHOLDER, build_hash, 1)
     
     return html
 
 
+def load_data(db_path=None, data_folder=DATA_FOLDER):
+    """Return (historical, current, projections, ecr_history).
+    
+    With db_path the data comes from the SQLite store built by `ingest`
+    instead of the CSVs in DATA_FOLDER.
+    """
+    conn = None
+    if db_path:
+        import data_store
+        log(f"📂 Loading data from {db_path}...")
+        conn = data_store.connect(db_path)
+    
+    with profiler.stage('load historical') as s:
+        historical = data_store.load_all_historical_data(conn) if conn else load_all_historical_data(data_folder)
+        s['rows'] = sum(len(data) for years in historical.values() for data in years.values())
+    with profiler.stage('load current season') as s:
+        current = data_store.load_current_season(conn) if conn else load_current_season(data_folder)
+        s['rows'] = len(current['data']) if current else 0
+    with profiler.stage('load weekly ECR') as s:
+        projections = (data_store.load_weekly_projections(conn) if conn
+                       else load_weekly_projections(data_folder=data_folder))
+        s['rows'] = sum(len(rows) for rows in projections.values())
+    with profiler.stage('load ECR history') as s:
+        ecr_history = data_store.load_ecr_history(conn) if conn else load_ecr_history(data_folder)
+        s['rows'] = sum(len(rows) for weeks in ecr_history.values() for rows in weeks.values())
+    
+    if conn:
+        conn.close()
+    return historical, current, projections, ecr_history
+
+
+def past_accuracy(historical, ecr_history):
+    """Pool ECR accuracy from past seasons that have both ECR and PPR points."""
+    import analytics
+    past_seasons = [(historical['PPR'][str(season)], weeks) for season, weeks in ecr_history.items()
+                    if str(season) in historical.get('PPR', {})]
+    prior_accuracy = analytics.pooled_accumulators(past_seasons)
+    if prior_accuracy:
+        log(f"   📈 {len(prior_accuracy)} players with past-season ECR accuracy")
+    return prior_accuracy
+
+
+def build_dashboard(db_path=None):
+    """Load all data, render the dashboard and write OUTPUT_FILE."""
+    historical, current, projections, ecr_history = load_data(db_path)
+    
+    with profiler.stage('past accuracy') as s:
+        prior_accuracy = past_accuracy(historical, ecr_history)
+        s['rows'] = len(prior_accuracy)
+    
+    import snapshot
+    with profiler.stage('write snapshot') as s:
+        s['bytes'] = snapshot.write_snapshot(historical, current, projections, ecr_history)
+    log(f"\n💾 Snapshot: {snapshot.SNAPSHOT_FILE} ({s['bytes'] / 1024:.1f}KB)")
+    
+    import player_ids
+    with profiler.stage('load sleeper players') as s:
+        sleeper_players = player_ids.load_sleeper_players()
+        s['rows'] = len(sleeper_players or {})
+    
+    log("\n🔨 Generating complete HTML with full UI...")
+    with profiler.stage('generate html') as s:
+        html = generate_complete_html(historical, current, projections, sleeper_players, prior_accuracy)
+        s['bytes'] = len(html)
+    
+    # Write via a temp file so a browser refresh never sees a half-written page
+    with profiler.stage('write html') as s:
+        tmp_file = OUTPUT_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_file, OUTPUT_FILE)
+        s['bytes'] = Path(OUTPUT_FILE).stat().st_size
+    
+    return Path(OUTPUT_FILE).stat().st_size / (1024 * 1024)
+
+
+def accuracy_datasets(historical, current, projections, ecr_history):
+    """Yield (season, format, season_data, ecr_weeks) for every season and
+    scoring format that has both weekly points and weekly ECR."""
+    for season, weeks in sorted(ecr_history.items()):
+        for scoring_format, years in historical.items():
+            if str(season) in years:
+                yield season, scoring_format, years[str(season)], weeks
+    if current and projections:
+        yield CURRENT_SEASON, 'PPR', current['data'], projections
+
+
+def export_accuracy(output_file=ACCURACY_EXPORT_FILE, seasons=None, formats=None, db_path=None):
+    """Write the power-curve accuracy report (player_scores_power_curve.csv).
+    
+    Defaults to the current season in PPR, in the original column layout.
+    Selecting several seasons or formats adds `season` and `format` columns.
+    Returns the number of rows written.
+    """
+    import analytics
+    import player_ids
+    
+    seasons = seasons or [CURRENT_SEASON]
+    formats = formats or ['PPR']
+    data = load_data(db_path)
+    
+    start = time.perf_counter()
+    selected = [(season, scoring_format, season_data, weeks)
+                for season, scoring_format, season_data, weeks in accuracy_datasets(*data)
+                if season in seasons and scoring_format in formats]
+    multi = len(seasons) > 1 or len(formats) > 1
+    
+    fields = ['position', 'games', 'mae', 'avg_score', 'accuracy_score']
+    header = [''] + (['season', 'format'] if multi else []) + fields
+    rows_written = 0
+    tmp_file = output_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for season, scoring_format, season_data, weeks in selected:
+            with profiler.stage(f'accuracy {season} {scoring_format}') as s:
+                # Same name resolution as the dashboard, so aliased ECR names still join
+                crosswalk = player_ids.build_crosswalk({'data': season_data}, weeks)
+                stamped, weeks = player_ids.attach_ids(crosswalk, {'data': season_data}, weeks)
+                rows = analytics.accuracy_table(stamped['data'], weeks)
+                for row in rows:
+                    writer.writerow([row['player']] + ([season, scoring_format] if multi else [])
+                                    + [row[field] for field in fields])
+                s['rows'] = len(rows)
+            rows_written += len(rows)
+            log(f"   ✅ {season} {scoring_format}: {len(rows)} players")
+    os.replace(tmp_file, output_file)
+    
+    missing = [(season, f) for season in seasons for f in formats
+               if not any(s == season and fmt == f for s, fmt, _, _ in selected)]
+    for season, scoring_format in missing:
+        log(f"   ⚠️  No points + ECR for {season} {scoring_format}")
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    log(f"\n📄 {output_file}: {rows_written} rows ({elapsed_ms:.0f}ms)")
+    return rows_written
+
+
+def export_dashboard_tables(db_path=None, out_dir='exports', fmt='csv'):
+    """Load the data and write the exporter tables for CURRENT_SEASON."""
+    import exporter
+    historical, current, projections, ecr_history = load_data(db_path)
+    prior_accuracy = past_accuracy(historical, ecr_history)
+    log(f"\n📤 Exporting tables to {out_dir}/...")
+    return exporter.export_tables(CURRENT_SEASON, historical, current, projections, prior_accuracy, out_dir, fmt)
+
+
+def run_profiled(command, func, *args, report_path=PROFILE_FILE, with_cprofile=False):
+    """Call func(*args) with per-stage timing and memory recorded; write the JSON report.
+    
+    with_cprofile runs the command a second time, quietly and with a cold
+    parse cache, with cProfile around the slowest stage of the first run.
+    """
+    first = profiler.Profiler()
+    with profiler.profiling(first, command):
+        result = func(*args)
+    report = first.report(command)
+    
+    slowest = first.slowest()
+    stats_file = str(Path(report_path).with_suffix('.prof'))
+    if with_cprofile and slowest:
+        _PARSE_CACHE.clear()
+        second = profiler.Profiler(cprofile_stage=slowest['name'])
+        with logging_to(None), profiler.profiling(second, command):
+            func(*args)
+        report['cprofile'] = second.cprofile_summary(stats_file)
+    profiler.write_report(report, report_path)
+    
+    total = first.stages[0]
+    log(f"\n⏱️  Profile: {total['wall_ms']:.0f}ms wall, {total['cpu_ms']:.0f}ms CPU, "
+        f"{total['peak_kb'] / 1024:.1f}MB peak -> {report_path}")
+    for node in sorted(first.leaves(), key=lambda n: n['wall_ms'], reverse=True)[:5]:
+        log(f"   {node['wall_ms']:8.1f}ms {node['peak_kb'] / 1024:7.1f}MB  {node['name']}")
+    if report.get('cprofile'):
+        log(f"   🔬 cProfile of '{slowest['name']}': {stats_file}")
+    return result
+
+
+def snapshot_data_folder():
+    """Return {filename: (mtime_ns, size)} for every CSV in DATA_FOLDER."""
+    snapshot = {}
+    if not os.path.isdir(DATA_FOLDER):
+        return snapshot
+    
+    with os.scandir(DATA_FOLDER) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith('.csv'):
+                stat = entry.stat()
+                snapshot[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def watch_data_folder(db_path=None):
+    """Poll DATA_FOLDER and rebuild the dashboard whenever CSVs change.
+    
+    With db_path the changed files are ingested into that store first and the
+    dashboard is rebuilt from it, like `--db` builds.
+    """
+    print(f"\n👀 Watching {DATA_FOLDER}/ for changes (Ctrl+C to stop)...")
+    last = snapshot_data_folder()
+    
+    try:
+        while True:
+            time.sleep(WATCH_POLL_SECONDS)
+            current = snapshot_data_folder()
+            if current == last:
+                continue
+            
+            # Debounce: wait until the folder stops changing before rebuilding
+            settled = current
+            while True:
+                time.sleep(WATCH_DEBOUNCE_SECONDS)
+                current = snapshot_data_folder()
+                if current == settled:
+                    break
+                settled = current
+            
+            changed = sorted(name for name in set(last) | set(settled)
+                             if last.get(name) != settled.get(name))
+            last = settled
+            
+            # Forget parses of files that were removed
+            live = {str(Path(DATA_FOLDER) / name) for name in settled}
+            for key in [k for k in _PARSE_CACHE if k[0] not in live]:
+                del _PARSE_CACHE[key]
+            
+            print("\n" + "=" * 60)
+            print(f"🔄 {len(changed)} file(s) changed: {', '.join(changed)}")
+            start = time.perf_counter()
+            try:
+                if db_path:
+                    import data_store
+                    data_store.ingest(DATA_FOLDER, db_path)
+                size_mb = build_dashboard(db_path)
+            except Exception as e:
+                print(f"❌ Rebuild failed: {e}")
+                continue
+            elapsed = time.perf_counter() - start
+            print(f"\n✅ Rebuilt {OUTPUT_FILE} ({size_mb:.2f} MB) in {elapsed:.2f}s")
+            print(f"👀 Watching {DATA_FOLDER}/ for changes...")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate the Fantasy Truss dashboard")
+    parser.add_argument('command', nargs='?', default='generate',
+                        choices=['generate', 'serve', 'ingest', 'export-accuracy', 'export'],
+                        help="generate the dashboard (default), generate and serve it over HTTP with an offline "
+                             f"cache, ingest CSVs into the SQLite store, write {ACCURACY_EXPORT_FILE}, "
+                             "or export projections/accuracy/rankings")
+    parser.add_argument('--watch', action='store_true',
+                        help=f"keep running and regenerate when CSVs in {DATA_FOLDER}/ change")
+    parser.add_argument('--db', nargs='?', const=DB_FILE, default=None,
+                        help="read data from the SQLite store instead of the CSVs")
+    parser.add_argument('--season', type=int, action='append',
+                        help=f"export-accuracy: season to include, repeatable (default: {CURRENT_SEASON})")
+    parser.add_argument('--format', dest='formats', action='append', choices=list(HISTORICAL_FILES),
+                        help="export-accuracy: scoring format to include, repeatable (default: PPR)")
+    parser.add_argument('--output', default=ACCURACY_EXPORT_FILE, help="export-accuracy: output CSV")
+    parser.add_argument('--to', dest='export_format', choices=['csv', 'jsonl'], default='csv',
+                        help="export: file format (default: csv)")
+    parser.add_argument('--out-dir', default='exports', help="export: output directory (default: exports)")
+    parser.add_argument('--host', default='127.0.0.1', help="serve: address to listen on (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="serve: port (default: 8000)")
+    parser.add_argument('--profile', nargs='?', const=PROFILE_FILE, default=None, metavar='REPORT',
+                        help=f"write per-stage time/memory to a JSON report (default: {PROFILE_FILE})")
+    parser.add_argument('--cprofile', action='store_true',
+                        help="with --profile, also cProfile the slowest stage (REPORT with .prof suffix)")
+    args = parser.parse_args()
+    if args.cprofile and not args.profile:
+        args.profile = PROFILE_FILE
+    if args.profile and args.watch:
+        parser.error("--profile can't be combined with --watch")
+    if args.cprofile and args.command == 'ingest':
+        parser.error("--cprofile reruns the command, and a second ingest skips every file")
+    
+    def run(func, *func_args):
+        if not args.profile:
+            return func(*func_args)
+        return run_profiled(args.command, func, *func_args, report_path=args.profile, with_cprofile=args.cprofile)
+    
     print("=" * 60)
     print("🏈 Fantasy Truss - COMPLETE EDITION")
     print("=" * 60)
     
-    historical = load_all_historical_data()
-    current = load_current_season()
-    projections = load_weekly_projections()
+    if args.command == 'ingest':
+        import data_store
+        db_path = args.db or DB_FILE
+        print(f"\n📥 Ingesting {DATA_FOLDER}/ into {db_path}...")
+        result = run(data_store.ingest, DATA_FOLDER, db_path)
+        print(f"\n✅ {len(result['ingested'])} ingested, {len(result['skipped'])} unchanged")
+        for name in result['unknown']:
+            print(f"   ⚠️  Not recognised: {name}")
+        print("=" * 60)
+        return
     
-    print("\n🔨 Generating complete HTML with full UI...")
-    html = generate_complete_html(historical, current, projections)
+    if args.command == 'export-accuracy':
+        print(f"\n📐 Exporting power-curve accuracy to {args.output}...")
+        run(export_accuracy, args.output, args.season, args.formats, args.db)
+        print("=" * 60)
+        return
     
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html)
+    if args.command == 'export':
+        run(export_dashboard_tables, args.db, args.out_dir, args.export_format)
+        print("=" * 60)
+        return
+    
+    size_mb = run(build_dashboard, args.db)
     
-    size_mb = Path(OUTPUT_FILE).stat().st_size / (1024 * 1024)
     print(f"\n✅ SUCCESS!")
     print(f"📄 {OUTPUT_FILE} ({size_mb:.2f} MB)")
     print("\n🎯 Features included:")
@@ -3039,7 +4834,13 @@ def main():
     print("  ✅ Reliability tracking")
     print("  ✅ Historical averages")
     print("=" * 60)
+    
+    if args.command == 'serve':
+        import server
+        server.serve(args.host, args.port, args.watch, args.db)
+    elif args.watch:
+        watch_data_folder(args.db)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
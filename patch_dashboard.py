@@ -8,29 +8,17 @@ This script patches the generated HTML to fix:
 3. Rankings tab bug
 4. Historical tab rendering
 
+Patches are declared in DASHBOARD_PATCHES and applied in one pass by
+patch_engine.py, which also reports which of them matched.
+
 Usage: python3 patch_dashboard.py fantasy_dashboard_v34_complete.html
 """
 
 import sys
-import re
 
-def patch_html(input_file, output_file=None):
-    if output_file is None:
-        output_file = input_file.replace('.html', '_patched.html')
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        html = f.read()
-    
-    # Find the script section
-    script_start = html.find('// ==================== CORE CALCULATIONS ====================')
-    script_end = html.find('// ==================== TAB SWITCHING ====================')
-    
-    if script_start == -1 or script_end == -1:
-        print("❌ Could not find script section to patch")
-        return False
-    
-    # Create the fixed JavaScript
-    fixed_js = '''// ==================== CORE CALCULATIONS ====================
+from patch_engine import literal, plan_patches, print_report, section, write_patched
+
+FIXED_CORE_JS = '''// ==================== CORE CALCULATIONS ====================
 function calculatePositionalBaselines() {
   const baselines = {};
   
@@ -229,17 +217,13 @@ function calculateProjections() {
 }
 
 '''
-    
-    # Replace the old functions
-    html = html[:script_start] + fixed_js + html[script_end:]
-    
-    # Fix the renderRankingsTable function
-    old_rankings = '''function renderRankingsTable(position) {{
+
+OLD_RANKINGS = '''function renderRankingsTable(position) {{
   // Update button states
   document.querySelectorAll('.pos-btn').forEach(btn => btn.classList.remove('active'));
   event.target.classList.add('active');'''
-    
-    new_rankings = '''function renderRankingsTable(position) {{
+
+NEW_RANKINGS = '''function renderRankingsTable(position) {{
   document.querySelectorAll('.pos-btn').forEach(btn => btn.classList.remove('active'));
   const buttons = document.querySelectorAll('.pos-btn');
   buttons.forEach(btn => {{
@@ -247,33 +231,44 @@ function calculateProjections() {
       btn.classList.add('active');
     }}
   }});'''
-    
-    html = html.replace(old_rankings, new_rankings)
-    
-    # Fix renderReliabilityTable to calculate avgScore
-    old_reliability_avgScore = '''const avgScoreWeeks = Object.values(p.weeks).map(w => w.actual);
+
+OLD_RELIABILITY_AVG_SCORE = '''const avgScoreWeeks = Object.values(p.weeks).map(w => w.actual);
     const avgScore = avgScoreWeeks.reduce((a,b) => a+b, 0) / avgScoreWeeks.length;'''
-    
-    new_reliability_avgScore = '''const playerData = SEASON_2025.data.find(pd => pd.p === p.name);
+
+NEW_RELIABILITY_AVG_SCORE = '''const playerData = SEASON_2025.data.find(pd => pd.p === p.name);
     let avgScore = 0;
     if (playerData && playerData.w) {{
       const scores = Object.values(playerData.w);
       avgScore = scores.reduce((a,b) => a+b, 0) / scores.length;
     }}'''
+
+DASHBOARD_PATCHES = [
+    section("Replaced core calculations (baselines, FP accuracy, ECR projections)",
+            'CORE CALCULATIONS', 'TAB SWITCHING', FIXED_CORE_JS),
+    literal("Fixed renderRankingsTable() event bug", OLD_RANKINGS, NEW_RANKINGS),
+    literal("Fixed renderReliabilityTable() avgScore calculation",
+            OLD_RELIABILITY_AVG_SCORE, NEW_RELIABILITY_AVG_SCORE),
+]
+
+
+def patch_html(input_file, output_file=None):
+    if output_file is None:
+        output_file = input_file.replace('.html', '_patched.html')
+    
+    with open(input_file, 'r', encoding='utf-8') as f:
+        html = f.read()
+    
+    edits, report = plan_patches(html, DASHBOARD_PATCHES)
     
-    html = html.replace(old_reliability_avgScore, new_reliability_avgScore)
+    if not report[DASHBOARD_PATCHES[0]['name']]:
+        print("❌ Could not find script section to patch")
+        return False
     
-    # Write the patched file
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html)
+        write_patched(html, edits, f)
     
     print(f"✅ Patched dashboard saved to: {output_file}")
-    print("\n📋 Changes applied:")
-    print("  ✅ Added calculatePositionalBaselines() function")
-    print("  ✅ Fixed calculateFPAccuracy() to use rank correlation")
-    print("  ✅ Fixed calculateProjections() to convert ECR to points")
-    print("  ✅ Fixed renderRankingsTable() event bug")
-    print("  ✅ Fixed renderReliabilityTable() avgScore calculation")
+    print_report(input_file, output_file, report)
     return True
 
 if __name__ == "__main__":
@@ -3,40 +3,29 @@
 ECR Fix Patcher v2 - Fixes the .proj vs .ecr field issue
 
 This fixes the critical bug where JavaScript looks for .proj but Python stores .ecr
+
+The fixes are declared in ECR_PATCHES and applied in one pass by patch_engine.py.
 """
 
 import sys
-import re
 
-def patch_ecr_fields(html_content):
-    """Fix all instances where JavaScript checks for .proj instead of .ecr"""
-    
-    changes = []
-    
-    # Fix 1: calculateFPAccuracy - check for .ecr not .proj
-    old1 = "if (proj && proj.proj > 0) {"
-    new1 = "if (proj && proj.ecr > 0) {"
-    if old1 in html_content:
-        html_content = html_content.replace(old1, new1)
-        changes.append("✅ Fixed calculateFPAccuracy() to check for .ecr field")
-    
-    # Fix 2: Alternative check for proj.proj
-    old2 = "if (ecrData && ecrData.proj > 0) {"
-    new2 = "if (ecrData && ecrData.ecr > 0) {"
-    if old2 in html_content:
-        html_content = html_content.replace(old2, new2)
-        changes.append("✅ Fixed calculateProjections() to check for .ecr field")
-    
-    # Fix 3: hasFP should be hasECR
-    old3 = "p.hasFP"
-    new3 = "p.hasECR"
-    if old3 in html_content:
-        html_content = html_content.replace(old3, new3)
-        changes.append("✅ Fixed hasFP references to hasECR")
-    
-    # Fix 4: Add console logging to calculateProjections
-    old_calc_start = "function calculateProjections() {\n  if (!SEASON_2025 || !SEASON_2025.data) return [];"
-    new_calc_start = """function calculateProjections() {
+from patch_engine import apply_patches, literal
+
+# Fix 1: calculateFPAccuracy - check for .ecr not .proj
+OLD_PROJ_FIELD_CHECK = "if (proj && proj.proj > 0) {"
+NEW_PROJ_FIELD_CHECK = "if (proj && proj.ecr > 0) {"
+
+# Fix 2: Alternative check for proj.proj
+OLD_ECR_DATA_FIELD_CHECK = "if (ecrData && ecrData.proj > 0) {"
+NEW_ECR_DATA_FIELD_CHECK = "if (ecrData && ecrData.ecr > 0) {"
+
+# Fix 3: hasFP should be hasECR
+OLD_HAS_FP = "p.hasFP"
+NEW_HAS_FP = "p.hasECR"
+
+# Fix 4: Add console logging to calculateProjections
+OLD_CALC_PROJECTIONS_START = "function calculateProjections() {\n  if (!SEASON_2025 || !SEASON_2025.data) return [];"
+NEW_CALC_PROJECTIONS_START = """function calculateProjections() {
   if (!SEASON_2025 || !SEASON_2025.data) return [];
   
   const projections = [];
@@ -51,14 +40,10 @@ def patch_ecr_fields(html_content):
   }
   
   let ecrMatchCount = 0;"""
-    
-    if old_calc_start in html_content:
-        html_content = html_content.replace(old_calc_start, new_calc_start)
-        changes.append("✅ Added debug logging to calculateProjections()")
-    
-    # Fix 5: Add console logging to calculateFPAccuracy
-    old_acc_start = "function calculateFPAccuracy() {\n  FP_ACCURACY = {};"
-    new_acc_start = """function calculateFPAccuracy() {
+
+# Fix 5: Add console logging to calculateFPAccuracy
+OLD_CALC_ACCURACY_START = "function calculateFPAccuracy() {\n  FP_ACCURACY = {};"
+NEW_CALC_ACCURACY_START = """function calculateFPAccuracy() {
   FP_ACCURACY = {};
   
   if (!SEASON_2025 || !SEASON_2025.data) {
@@ -72,17 +57,12 @@ def patch_ecr_fields(html_content):
   console.log(`Checking ${seasonData.length} players against ${weekNums.length} weeks of ECR data`);
   
   let matchCount = 0;"""
-    
-    if old_acc_start in html_content:
-        html_content = html_content.replace(old_acc_start, new_acc_start)
-        changes.append("✅ Added debug logging to calculateFPAccuracy()")
-    
-    # Fix 6: Update reliability table empty state
-    old_reliability = """tbody.innerHTML = data.map(p => {
+
+# Fix 6: Update reliability table empty state
+OLD_RELIABILITY_AVG_SCORE = """tbody.innerHTML = data.map(p => {
     const avgScoreWeeks = Object.values(p.weeks).map(w => w.actual);
     const avgScore = avgScoreWeeks.reduce((a,b) => a+b, 0) / avgScoreWeeks.length;"""
-    
-    new_reliability = """if (data.length === 0) {
+NEW_RELIABILITY_AVG_SCORE = """if (data.length === 0) {
     tbody.innerHTML = '<tr><td colspan="8" style="text-align:center;padding:40px;color:#95a5a6;">No reliability data available. Check console for ECR matching issues.</td></tr>';
     return;
   }
@@ -94,11 +74,20 @@ def patch_ecr_fields(html_content):
       const scores = Object.values(playerData.w);
       avgScore = scores.reduce((a,b) => a+b, 0) / scores.length;
     }"""
-    
-    if old_reliability in html_content:
-        html_content = html_content.replace(old_reliability, new_reliability)
-        changes.append("✅ Fixed renderReliabilityTable() avgScore calculation")
-    
+
+ECR_PATCHES = [
+    literal("Fixed calculateFPAccuracy() to check for .ecr field", OLD_PROJ_FIELD_CHECK, NEW_PROJ_FIELD_CHECK),
+    literal("Fixed calculateProjections() to check for .ecr field", OLD_ECR_DATA_FIELD_CHECK, NEW_ECR_DATA_FIELD_CHECK),
+    literal("Fixed hasFP references to hasECR", OLD_HAS_FP, NEW_HAS_FP),
+    literal("Added debug logging to calculateProjections()", OLD_CALC_PROJECTIONS_START, NEW_CALC_PROJECTIONS_START),
+    literal("Added debug logging to calculateFPAccuracy()", OLD_CALC_ACCURACY_START, NEW_CALC_ACCURACY_START),
+    literal("Fixed renderReliabilityTable() avgScore calculation", OLD_RELIABILITY_AVG_SCORE, NEW_RELIABILITY_AVG_SCORE),
+]
+
+def patch_ecr_fields(html_content):
+    """Fix all instances where JavaScript checks for .proj instead of .ecr"""
+    html_content, report = apply_patches(html_content, ECR_PATCHES)
+    changes = [f"✅ {name}" for name, count in report.items() if count]
     return html_content, changes
 
 def main():
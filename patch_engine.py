@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Single-pass patch engine for generated dashboards
+
+Patches are declared as plain dicts (see literal() and section()) and applied
+to the HTML in one pass:
+
+1. One regex scan indexes every section marker, e.g.
+   `// ==================== CORE CALCULATIONS ====================`
+2. One combined regex scan finds every literal patch at once
+3. The output is streamed to disk chunk by chunk from the original text
+
+Compared with a chain of `str.replace` calls this never rescans or copies the
+full document per patch, and it reports how many times each patch matched.
+Literal patches only see the original document, never text inserted by another
+patch, and matches inside a replaced section are dropped.
+
+Usage:
+    python3 patch_engine.py <html_file> [<html_file> ...]
+    python3 patch_engine.py --set dashboard --workers 4 dist/*.html
+"""
+
+import argparse
+import io
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+MARKER_PATTERN = re.compile(r'// ={4,} (.+?) ={4,}')
+
+
+def literal(name, find, replace):
+    """Declare a patch that replaces every occurrence of `find`."""
+    return {'name': name, 'kind': 'literal', 'find': find, 'replace': replace}
+
+
+def section(name, start, end, replace):
+    """Declare a patch that replaces everything from marker `start` up to marker `end`."""
+    return {'name': name, 'kind': 'section', 'start': start, 'end': end, 'replace': replace}
+
+
+def index_markers(html):
+    """Map each section marker name to the offset of its first occurrence."""
+    markers = {}
+    for match in MARKER_PATTERN.finditer(html):
+        markers.setdefault(match.group(1).strip(), match.start())
+    return markers
+
+
+def plan_patches(html, patches):
+    """Work out every edit as (start, end, replacement, name) plus a match report."""
+    report = {p['name']: 0 for p in patches}
+    edits = []
+
+    # Section patches resolve against the marker index
+    markers = index_markers(html)
+    for patch in patches:
+        if patch['kind'] != 'section':
+            continue
+        start = markers.get(patch['start'])
+        end = markers.get(patch['end'])
+        if start is None or end is None or end <= start:
+            continue
+        if any(start < e_end and e_start < end for e_start, e_end, _, _ in edits):
+            continue  # Overlaps a section already claimed
+        edits.append((start, end, patch['replace'], patch['name']))
+        report[patch['name']] += 1
+
+    # Literal patches share one alternation; longest first so that a patch
+    # which extends another one wins at the same position
+    literals = {}
+    for patch in patches:
+        if patch['kind'] == 'literal' and patch['find']:
+            literals.setdefault(patch['find'], patch)
+
+    if literals:
+        finds = sorted(literals, key=len, reverse=True)
+        combined = re.compile('|'.join(re.escape(f) for f in finds))
+        sections = sorted((s, e) for s, e, _, _ in edits)
+
+        for match in combined.finditer(html):
+            pos = match.start()
+            if any(s <= pos < e for s, e in sections):
+                continue
+            patch = literals[match.group(0)]
+            edits.append((pos, match.end(), patch['replace'], patch['name']))
+            report[patch['name']] += 1
+
+    edits.sort(key=lambda e: e[0])
+    return edits, report
+
+
+def write_patched(html, edits, out):
+    """Stream the original text with edits spliced in to a writable file object."""
+    pos = 0
+    for start, end, replacement, _ in edits:
+        out.write(html[pos:start])
+        out.write(replacement)
+        pos = end
+    out.write(html[pos:])
+
+
+def apply_patches(html, patches):
+    """Apply patches in memory. Returns (patched_html, report)."""
+    edits, report = plan_patches(html, patches)
+    buffer = io.StringIO()
+    write_patched(html, edits, buffer)
+    return buffer.getvalue(), report
+
+
+def patch_file(input_file, patches, output_file=None, suffix='_patched'):
+    """Patch one HTML file on disk. Returns (output_file, report)."""
+    input_path = Path(input_file)
+    if output_file is None:
+        output_file = input_path.with_name(f"{input_path.stem}{suffix}{input_path.suffix}")
+
+    html = input_path.read_text(encoding='utf-8')
+    edits, report = plan_patches(html, patches)
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        write_patched(html, edits, f)
+
+    return str(output_file), report
+
+
+def _patch_file_job(args):
+    input_file, patches, suffix = args
+    return input_file, patch_file(input_file, patches, suffix=suffix)
+
+
+def patch_files(input_files, patches, suffix='_patched', workers=None):
+    """Patch a batch of dashboards in parallel. Yields (input, output, report)."""
+    jobs = [(str(f), patches, suffix) for f in input_files]
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            input_file, (output_file, report) = _patch_file_job(job)
+            yield input_file, output_file, report
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for input_file, (output_file, report) in pool.map(_patch_file_job, jobs):
+            yield input_file, output_file, report
+
+
+def print_report(input_file, output_file, report):
+    """Print which patches matched for one file."""
+    print(f"\n📂 {input_file} -> {output_file}")
+    for name, count in report.items():
+        if count:
+            print(f"  ✅ {name} ({count} match{'es' if count != 1 else ''})")
+        else:
+            print(f"  ⚠️  {name} (no match)")
+
+
+def load_patch_set(name):
+    """Return the declared patches for a named set."""
+    if name == 'dashboard':
+        from patch_dashboard import DASHBOARD_PATCHES
+        return DASHBOARD_PATCHES
+    if name == 'ecr':
+        from patch_ecr_fix import ECR_PATCHES
+        return ECR_PATCHES
+
+    from patch_dashboard import DASHBOARD_PATCHES
+    from patch_ecr_fix import ECR_PATCHES
+    return DASHBOARD_PATCHES + ECR_PATCHES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply declarative patches to generated dashboards")
+    parser.add_argument('files', nargs='+', help="HTML files to patch")
+    parser.add_argument('--set', dest='patch_set', choices=['dashboard', 'ecr', 'all'], default='all',
+                        help="which patch set to apply (default: all)")
+    parser.add_argument('--suffix', default='_patched', help="suffix for output files")
+    parser.add_argument('--workers', type=int, default=None, help="parallel worker processes")
+    args = parser.parse_args()
+
+    patches = load_patch_set(args.patch_set)
+
+    print("=" * 60)
+    print(f"🔧 Patch Engine - {len(patches)} patches, {len(args.files)} file(s)")
+    print("=" * 60)
+
+    failed = False
+    try:
+        for input_file, output_file, report in patch_files(args.files, patches, args.suffix, args.workers):
+            print_report(input_file, output_file, report)
+    except FileNotFoundError as e:
+        print(f"❌ Error: File not found: {e.filename}")
+        failed = True
+
+    print("\n" + "=" * 60)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Player-ID crosswalk built at generation time
+
+Every player in the current season and weekly ECR files gets a dense integer
+ID (0, 1, 2, ...), keyed by the same normalized name the dashboard uses. The
+generator stamps that ID onto each record as `i` and embeds the crosswalk as
+PLAYER_IDS, so the page joins players by array index instead of comparing
+normalized name strings:
+
+    PLAYER_IDS = {
+      names:   ["Lamar Jackson", ...],        // dense ID -> display name
+      sleeper: {"4881": 0, ...},              // Sleeper player_id -> dense ID
+      espn:    {"3916387": 0, ...},           // ESPN player id -> dense ID
+      aliases: {"gabe davis": 12, ...}        // normalized alias -> dense ID
+    }
+
+Names that differ between sources beyond what normalization handles ("Gabe
+Davis" vs "Gabriel Davis") are resolved once here by fuzzy matching: a
+character trigram inverted index per position yields candidates, and a match
+must share the surname, have compatible first names (prefix or close
+spelling), clear MIN_SIMILARITY (Dice coefficient) and beat the runner-up. Resolved names are embedded as aliases,
+so lookups in the page stay a single Map.get().
+
+The Sleeper and ESPN columns are filled from a Sleeper player dump saved as
+DATA_FOLDER/sleeper_players.json (Sleeper's player records carry `espn_id`).
+Fetch or refresh it with:
+
+    python3 player_ids.py
+"""
+
+import json
+import re
+import time
+import urllib.request
+from pathlib import Path
+
+from generate_dashboard_fixed import DATA_FOLDER, log
+
+SLEEPER_PLAYERS_FILE = 'sleeper_players.json'
+SLEEPER_PLAYERS_URL = 'https://api.sleeper.app/v1/players/nfl'
+POSITIONS = ('QB', 'RB', 'WR', 'TE')
+NGRAM = 3
+MIN_SIMILARITY = 0.5
+MIN_FIRST_NAME_SIMILARITY = 0.4
+
+
+def normalize_player_name(name):
+    """Python twin of normalizePlayerName() in the dashboard."""
+    if not name or not isinstance(name, str):
+        return ''
+    name = re.sub(r'\s+(jr|sr|ii|iii|iv|v)\.?\Z', '', name.lower())
+    name = re.sub(r'[^a-z0-9\s]', '', name)
+    return re.sub(r'\s+', ' ', name).strip()
+
+
+def load_sleeper_players(data_folder=DATA_FOLDER):
+    """Return the saved Sleeper player dump, or None if it hasn't been fetched."""
+    filepath = Path(data_folder) / SLEEPER_PLAYERS_FILE
+    if not filepath.exists():
+        return None
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# ==================== FUZZY MATCHING ====================
+
+def _ngrams(norm):
+    padded = f'  {norm} '
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+def _dice(a, b):
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def _first_names_agree(a, b):
+    """Nicknames ("Mitch"/"Mitchell") or near-spellings ("Jacksin"/"Jackson")."""
+    return a.startswith(b) or b.startswith(a) or _dice(_ngrams(a), _ngrams(b)) >= MIN_FIRST_NAME_SIMILARITY
+
+
+class NameIndex:
+    """Character n-gram inverted index over normalized names, blocked by position."""
+
+    def __init__(self):
+        self._postings = {}   # (pos, gram) -> [dense_id]
+        self._entries = {}    # dense_id -> (norm, grams)
+
+    def add(self, dense_id, norm, pos):
+        grams = _ngrams(norm)
+        self._entries[dense_id] = (norm, grams)
+        for gram in grams:
+            self._postings.setdefault((pos, gram), []).append(dense_id)
+
+    def match(self, norm, pos):
+        """Best dense ID for a name at a position, or None if nothing is close enough."""
+        tokens = norm.split()
+        if len(tokens) < 2:
+            return None
+        grams = _ngrams(norm)
+
+        shared = {}
+        for gram in grams:
+            for dense_id in self._postings.get((pos, gram), ()):
+                shared[dense_id] = shared.get(dense_id, 0) + 1
+
+        scored = []
+        for dense_id, count in shared.items():
+            cand_norm, cand_grams = self._entries[dense_id]
+            cand_tokens = cand_norm.split()
+            if cand_tokens[-1] != tokens[-1] or not _first_names_agree(cand_tokens[0], tokens[0]):
+                continue
+            scored.append((2 * count / (len(grams) + len(cand_grams)), dense_id))
+        if not scored:
+            return None
+
+        scored.sort(reverse=True)
+        best_score, best_id = scored[0]
+        if best_score < MIN_SIMILARITY or (len(scored) > 1 and scored[1][0] == best_score):
+            return None
+        return best_id
+
+
+# ==================== CROSSWALK ====================
+
+def build_crosswalk(current_season, projections, sleeper_players=None):
+    """Assign dense IDs to every player in the season and ECR data.
+
+    Returns {'names', 'ids' (normalized name or alias -> id), 'aliases',
+    'sleeper', 'espn', 'unresolved'}.
+    """
+    started = time.perf_counter()
+    names = []
+    ids = {}
+    aliases = {}
+    index = NameIndex()
+
+    def add(name, pos):
+        norm = normalize_player_name(name)
+        if norm and norm not in ids:
+            ids[norm] = len(names)
+            names.append(name)
+            index.add(ids[norm], norm, pos)
+
+    # Season players are the canonical names; ECR names resolve onto them
+    if current_season:
+        for player in current_season['data']:
+            add(player['p'], player['pos'])
+
+    unresolved = []
+    for week in sorted(projections, key=int):
+        for player in projections[week]:
+            norm = normalize_player_name(player['p'])
+            if not norm or norm in ids:
+                continue
+            dense_id = index.match(norm, player['pos'])
+            if dense_id is not None:
+                ids[norm] = aliases[norm] = dense_id
+            else:
+                add(player['p'], player['pos'])
+                unresolved.append(('ECR', player['p']))
+
+    sleeper = {}
+    espn = {}
+
+    def link(sleeper_id, player, dense_id):
+        sleeper[str(sleeper_id)] = dense_id
+        if player.get('espn_id'):
+            espn[str(player['espn_id'])] = dense_id
+
+    if sleeper_players:
+        candidates = [(sid, p) for sid, p in sleeper_players.items() if p.get('position') in POSITIONS]
+        linked = set()
+        fuzzy = []
+        for sleeper_id, player in candidates:
+            norm = normalize_player_name(player.get('full_name'))
+            dense_id = ids.get(norm)
+            if dense_id is not None:
+                link(sleeper_id, player, dense_id)
+                linked.add(dense_id)
+            elif player.get('active'):
+                fuzzy.append((sleeper_id, player, norm))
+
+        # Only players still without a Sleeper ID are open to fuzzy matches
+        for sleeper_id, player, norm in fuzzy:
+            dense_id = index.match(norm, player['position'])
+            if dense_id is not None and dense_id not in linked:
+                link(sleeper_id, player, dense_id)
+                ids.setdefault(norm, dense_id)
+                aliases.setdefault(norm, dense_id)
+                linked.add(dense_id)
+
+        unresolved.extend(('Sleeper', names[i]) for i in range(len(names)) if i not in linked)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    log(f"   🔎 Name resolution: {len(aliases)} aliases, {len(unresolved)} unresolved ({elapsed_ms:.1f}ms)")
+    for source, name in unresolved[:10]:
+        log(f"      ⚠️  {source}: {name}")
+    if len(unresolved) > 10:
+        log(f"      ... and {len(unresolved) - 10} more")
+
+    return {'names': names, 'ids': ids, 'aliases': aliases, 'sleeper': sleeper, 'espn': espn,
+            'unresolved': unresolved}
+
+
+def attach_ids(crosswalk, current_season, projections):
+    """Return copies of the season and ECR data with each record's dense ID as `i`."""
+    ids = crosswalk['ids']
+
+    def stamp(player):
+        return {**player, 'i': ids.get(normalize_player_name(player['p']), -1)}
+
+    if current_season:
+        current_season = {**current_season, 'data': [stamp(p) for p in current_season['data']]}
+    projections = {week: [stamp(p) for p in players] for week, players in projections.items()}
+    return current_season, projections
+
+
+def embedded_crosswalk(crosswalk):
+    """The part of the crosswalk the page needs (normalized keys are rebuilt in JS)."""
+    return {'names': crosswalk['names'], 'sleeper': crosswalk['sleeper'], 'espn': crosswalk['espn'],
+            'aliases': crosswalk['aliases']}
+
+
+def fetch_sleeper_players(data_folder=DATA_FOLDER):
+    """Download the Sleeper player dump into data_folder."""
+    filepath = Path(data_folder) / SLEEPER_PLAYERS_FILE
+    print(f"🌐 Fetching {SLEEPER_PLAYERS_URL}...")
+    with urllib.request.urlopen(SLEEPER_PLAYERS_URL, timeout=60) as response:
+        raw = response.read()
+    filepath.write_bytes(raw)
+    print(f"   ✅ Saved {filepath} ({len(raw) / (1024 * 1024):.1f} MB)")
+
+
+if __name__ == "__main__":
+    fetch_sleeper_players()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Per-stage timing and memory report for the generator (--profile)
+
+Code marks its stages with stage(); outside profiling() that is a no-op.
+While profiling, each stage records wall time, CPU time, the tracemalloc
+peak above what was allocated when it started, the memory it left allocated,
+and any rows/bytes the code reports:
+
+    with profiler.stage('json historical') as s:
+        hist_json = json.dumps(...)
+        s['bytes'] = len(hist_json)
+
+Stages nest (a loader holds one `parse <file>` stage per CSV it reads) and
+the report is that tree as JSON:
+
+    python3 generate_dashboard_fixed.py --profile              # profile_report.json
+    python3 generate_dashboard_fixed.py --profile --cprofile   # + profile_report.prof
+
+tracemalloc slows allocation-heavy code, so times under --profile run higher
+than a plain build; compare stages with each other, not with a normal run.
+cProfile is heavier still, so --cprofile runs the command a second time with
+cProfile enabled only around the slowest leaf stage of the first run.
+"""
+
+import cProfile
+import json
+import platform
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CPROFILE_TOP = 25  # Functions listed in the report's cprofile section
+
+# Profiler collecting stages, or None when not profiling
+_ACTIVE = None
+
+
+class Profiler:
+    """Collects a tree of stages; optionally runs cProfile around one of them."""
+
+    def __init__(self, cprofile_stage=None):
+        self.stages = []
+        self.cprofile_stage = cprofile_stage
+        self.cprofile = None
+        self._stack = []
+
+    def begin(self, name):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        tracemalloc.reset_peak()
+
+        frame = {'name': name, 'start_mem': current, 'peak': current, 'children': [], 'profile': None}
+        if name == self.cprofile_stage and self.cprofile is None:
+            frame['profile'] = self.cprofile = cProfile.Profile()
+            frame['profile'].enable()
+        self._stack.append(frame)
+        frame['start'] = (time.perf_counter(), time.process_time())
+
+    def end(self, **counts):
+        wall = time.perf_counter() - self._stack[-1]['start'][0]
+        cpu = time.process_time() - self._stack[-1]['start'][1]
+        frame = self._stack.pop()
+        if frame['profile']:
+            frame['profile'].disable()
+
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(frame['peak'], peak)
+        node = {
+            'name': frame['name'],
+            'wall_ms': round(wall * 1000, 2),
+            'cpu_ms': round(cpu * 1000, 2),
+            'peak_kb': round((peak - frame['start_mem']) / 1024, 1),
+            'net_kb': round((current - frame['start_mem']) / 1024, 1),
+        }
+        # Loaders don't count bytes themselves; they read what their parses read
+        children = frame['children']
+        if 'bytes' not in counts and children and all('bytes' in child for child in children):
+            counts['bytes'] = sum(child['bytes'] for child in children)
+        node.update((key, value) for key, value in counts.items() if value is not None)
+        if frame['children']:
+            node['stages'] = frame['children']
+
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            self._stack[-1]['children'].append(node)
+        else:
+            self.stages.append(node)
+        tracemalloc.reset_peak()
+        return node
+
+    @contextmanager
+    def stage(self, name, counts):
+        self.begin(name)
+        try:
+            yield counts
+        finally:
+            self.end(**counts)
+
+    def leaves(self, stages=None):
+        """Every stage without sub-stages, depth first."""
+        for node in self.stages if stages is None else stages:
+            if 'stages' in node:
+                yield from self.leaves(node['stages'])
+            else:
+                yield node
+
+    def slowest(self):
+        """The leaf stage with the most wall time, or None."""
+        return max(self.leaves(), key=lambda node: node['wall_ms'], default=None)
+
+    def report(self, command):
+        slowest = self.slowest()
+        report = {
+            'command': command,
+            'python': platform.python_version(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'max_rss_kb': max_rss_kb(),
+            'slowest_stage': slowest and {'name': slowest['name'], 'wall_ms': slowest['wall_ms']},
+            'stages': self.stages,
+        }
+        return report
+
+    def cprofile_summary(self, path, top=CPROFILE_TOP):
+        """Dump the cProfile stats to path; return the top functions by cumulative time."""
+        if self.cprofile is None:
+            return None
+        stats = pstats.Stats(self.cprofile)
+        stats.dump_stats(path)
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:top]
+        return {
+            'stage': self.cprofile_stage,
+            'stats_file': str(path),
+            'functions': [{'function': f"{Path(filename).name}:{line}({func})", 'calls': calls,
+                           'tottime_ms': round(tottime * 1000, 2), 'cumtime_ms': round(cumtime * 1000, 2)}
+                          for (filename, line, func), (_, calls, tottime, cumtime, _) in rows],
+        }
+
+
+def max_rss_kb():
+    """Peak resident set size of this process in KB, or None where unsupported."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss  # macOS reports bytes
+
+
+@contextmanager
+def stage(name, **counts):
+    """Record the block as a stage of the active profiler; yields a dict for rows/bytes."""
+    if _ACTIVE is None:
+        yield counts
+        return
+    with _ACTIVE.stage(name, counts):
+        yield counts
+
+
+@contextmanager
+def profiling(profiler, name):
+    """Make profiler active, with tracemalloc on, and record the block as stage `name`."""
+    global _ACTIVE
+    previous = _ACTIVE
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _ACTIVE = profiler
+    try:
+        with profiler.stage(name, {}):
+            yield profiler
+    finally:
+        _ACTIVE = previous
+        if started:
+            tracemalloc.stop()
+
+
+def write_report(report, path):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    Path(tmp_path).replace(path)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Compact player records produced by the loaders
+
+A parsed player used to be {'p': name, 'pos': pos, 'w': {week: points}}: a
+dict per player plus a dict of boxed floats per player. PlayerRecord keeps the
+same keys but stores the name and position as interned strings and the weeks
+as one array('d') of WEEKS slots (NaN = no score), so a season costs one small
+object and one flat buffer per player.
+
+Records still read like the old dicts, so callers don't change:
+
+    player['p'], player['pos']          # interned strings
+    player['w'][3], player['w'].get(3)  # WeekScores view over the array
+    {**player, 'i': 7}                  # plain dict copy, as before
+
+EcrRecord does the same for weekly ECR rows ({'p', 'pos', 'ecr', 'std'}).
+json.dumps() needs default=to_json to serialize either.
+"""
+
+import math
+import sys
+from array import array
+from collections.abc import Mapping
+
+WEEKS = 18
+_NO_SCORES = array('d', [math.nan]) * WEEKS
+
+
+class WeekScores(Mapping):
+    """{week: points} view over a record's week array; weeks without a score are absent."""
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getitem__(self, week):
+        if isinstance(week, int) and 1 <= week <= WEEKS:
+            value = self._values[week - 1]
+            if value == value:
+                return value
+        raise KeyError(week)
+
+    def __setitem__(self, week, points):
+        self._values[week - 1] = points
+
+    def __iter__(self):
+        for i, value in enumerate(self._values):
+            if value == value:
+                yield i + 1
+
+    def __len__(self):
+        return sum(1 for value in self._values if value == value)
+
+    def values(self):
+        return [value for value in self._values if value == value]
+
+    def items(self):
+        return [(i + 1, value) for i, value in enumerate(self._values) if value == value]
+
+
+class PlayerRecord(Mapping):
+    """One player's season of weekly points."""
+
+    __slots__ = ('p', 'pos', 'weeks')
+    _KEYS = ('p', 'pos', 'w')
+
+    def __init__(self, name, pos, weeks=None):
+        self.p = sys.intern(name)
+        self.pos = sys.intern(pos)
+        self.weeks = array('d', _NO_SCORES)
+        for week, points in (weeks or {}).items():
+            self.weeks[int(week) - 1] = points
+
+    @property
+    def w(self):
+        return WeekScores(self.weeks)
+
+    def __getitem__(self, key):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def to_dict(self):
+        return {'p': self.p, 'pos': self.pos, 'w': dict(self.w.items())}
+
+
+class EcrRecord(Mapping):
+    """One player's expert consensus rank for one week."""
+
+    __slots__ = ('p', 'pos', 'ecr', 'std')
+    _KEYS = __slots__
+
+    def __init__(self, name, pos, ecr, std):
+        self.p = sys.intern(name)
+        self.pos = sys.intern(pos)
+        self.ecr = ecr
+        self.std = std
+
+    def __getitem__(self, key):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self):
+        return len(self._KEYS)
+
+    def to_dict(self):
+        return {'p': self.p, 'pos': self.pos, 'ecr': self.ecr, 'std': self.std}
+
+
+def to_json(obj):
+    """json.dumps(default=...) hook for records and week views."""
+    if isinstance(obj, (PlayerRecord, EcrRecord)):
+        return obj.to_dict()
+    if isinstance(obj, WeekScores):
+        return dict(obj.items())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
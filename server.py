@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Local HTTP server for the dashboard (`generate_dashboard_fixed.py serve`)
+
+Browsers only run service workers on http(s) pages, so the HTML opened from
+disk can't cache itself. `serve` builds the dashboard and serves exactly two
+files:
+
+    /                     OUTPUT_FILE
+    /service_worker.js    SERVICE_WORKER_FILE (stale-while-revalidate cache for
+                          the page and Sleeper API responses, see that file)
+
+Both are sent with an ETag and `Cache-Control: no-cache`, so the browser and
+the service worker revalidate with a cheap 304 instead of re-downloading, and
+gzipped when the client accepts it. With --watch the data folder is watched
+too and every rebuild is picked up on the next load.
+
+Usage:
+    python3 generate_dashboard_fixed.py serve              # http://127.0.0.1:8000/
+    python3 generate_dashboard_fixed.py serve --watch --port 8080
+"""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from generate_dashboard_fixed import OUTPUT_FILE, log, watch_data_folder
+
+SERVICE_WORKER_FILE = 'service_worker.js'
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8000
+
+ROUTES = {
+    '/': (OUTPUT_FILE, 'text/html; charset=utf-8'),
+    '/index.html': (OUTPUT_FILE, 'text/html; charset=utf-8'),
+    '/service_worker.js': (str(Path(__file__).with_name(SERVICE_WORKER_FILE)), 'text/javascript; charset=utf-8'),
+}
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """Serves ROUTES with ETag revalidation and optional gzip."""
+
+    # path -> (etag, body, gzipped body); rebuilt when the file's mtime/size change
+    _files = {}
+    _lock = threading.Lock()
+
+    def do_GET(self):
+        self._send(include_body=True)
+
+    def do_HEAD(self):
+        self._send(include_body=False)
+
+    def _load(self, path):
+        stat = Path(path).stat()
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        with self._lock:
+            cached = self._files.get(path)
+            if not cached or cached[0] != etag:
+                body = Path(path).read_bytes()
+                cached = self._files[path] = (etag, body, gzip.compress(body, compresslevel=6))
+        return cached
+
+    def _send(self, include_body):
+        route = ROUTES.get(self.path.split('?', 1)[0])
+        if route is None:
+            self.send_error(404)
+            return
+        path, content_type = route
+        try:
+            etag, body, gzipped = self._load(path)
+        except FileNotFoundError:
+            self.send_error(404, f"{path} not built yet")
+            return
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        use_gzip = accepts_gzip(self.headers.get('Accept-Encoding', ''))
+        payload = gzipped if use_gzip else body
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        if include_body:
+            self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        log(f"   🌐 {self.address_string()} {format % args}")
+
+
+def accepts_gzip(accept_encoding):
+    """True if an Accept-Encoding header allows gzip (`gzip;q=0` refuses it)."""
+    qualities = {}
+    for part in accept_encoding.split(','):
+        coding, *params = [item.strip() for item in part.split(';')]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding:
+            qualities[coding.lower()] = q
+    return qualities.get('gzip', qualities.get('*', 0.0)) > 0
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, watch=False, db_path=None):
+    """Serve the dashboard until Ctrl+C, rebuilding on data changes if watch (from db_path if given)."""
+    httpd = ThreadingHTTPServer((host, port), DashboardHandler)
+    log(f"\n🌐 Serving {OUTPUT_FILE} at http://{host}:{port}/ (Ctrl+C to stop)")
+    try:
+        if watch:
+            threading.Thread(target=httpd.serve_forever, daemon=True).start()
+            watch_data_folder(db_path)
+        else:
+            httpd.serve_forever()
+    except KeyboardInterrupt:
+        log("\n👋 Stopped serving")
+    finally:
+        if watch:
+            httpd.shutdown()  # serve_forever runs in the thread; stop it
+        httpd.server_close()
@@ -0,0 +1,97 @@
+// Service worker for the Fantasy Truss dashboard
+//
+// Registered by the page when it is served over http(s)
+// (`python3 generate_dashboard_fixed.py serve`); opened from disk the page
+// never loads it.
+//
+// Stale-while-revalidate for the dashboard page (UI and embedded data are one
+// file) and for Sleeper API GETs: answer from the cache right away when there
+// is a copy, fetch a fresh one in the background and keep it for next time.
+// With no signal the cached copy is all there is, so the last dashboard build
+// and the last Sleeper rosters still load. When a background fetch brings back
+// something different, open pages get {type: 'sw-updated', kind, url}.
+
+const CACHE_PREFIX = 'fantasy-truss-';
+const CACHE_NAME = `${CACHE_PREFIX}v1`;
+const SLEEPER_ORIGIN = 'https://api.sleeper.app';
+
+self.addEventListener('install', (event) => {
+  // Cache the page now so the very next load works offline
+  event.waitUntil(
+    caches.open(CACHE_NAME)
+      .then(cache => cache.add('./'))
+      .then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const names = await caches.keys();
+    await Promise.all(names
+      .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+      .map(name => caches.delete(name)));
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener('fetch', (event) => {
+  const kind = cacheKind(event.request);
+  if (kind) {
+    event.respondWith(staleWhileRevalidate(event, kind));
+  }
+});
+
+// 'dashboard', 'sleeper', or null for requests we leave to the network
+function cacheKind(request) {
+  if (request.method !== 'GET') return null;
+  const url = new URL(request.url);
+  if (url.origin === SLEEPER_ORIGIN) return 'sleeper';
+  if (url.origin === self.location.origin && request.mode === 'navigate') return 'dashboard';
+  return null;
+}
+
+async function staleWhileRevalidate(event, kind) {
+  const cache = await caches.open(CACHE_NAME);
+  // The dashboard is one page whatever the query string
+  const key = kind === 'dashboard' ? new URL('./', self.location).href : event.request;
+  const cached = await cache.match(key);
+  const previous = cached ? cached.clone() : null;
+
+  const refresh = fetch(event.request).then(async (response) => {
+    if (response.ok) {
+      await cache.put(key, response.clone());
+      if (previous && await responsesDiffer(previous, response.clone())) {
+        await notifyClients({ type: 'sw-updated', kind, url: event.request.url });
+      }
+    }
+    return response;
+  });
+
+  if (cached) {
+    // Offline: the cached copy already answered, nothing else to do
+    event.waitUntil(refresh.catch(() => {}));
+    return cached;
+  }
+
+  try {
+    return await refresh;
+  } catch (error) {
+    return new Response(JSON.stringify({ error: 'offline', url: event.request.url }), {
+      status: 503,
+      headers: { 'Content-Type': 'application/json' },
+    });
+  }
+}
+
+async function responsesDiffer(a, b) {
+  const etagA = a.headers.get('ETag');
+  const etagB = b.headers.get('ETag');
+  if (etagA && etagB) return etagA !== etagB;
+  const [textA, textB] = await Promise.all([a.text(), b.text()]);
+  return textA !== textB;
+}
+
+async function notifyClients(message) {
+  const clients = await self.clients.matchAll({ type: 'window' });
+  clients.forEach(client => client.postMessage(message));
+}
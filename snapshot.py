@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Columnar binary snapshot of the parsed dataset
+
+The generator writes SNAPSHOT_FILE next to the dashboard. It holds the same
+data load_all_historical_data(), load_current_season() and
+load_weekly_projections() and load_ecr_history() build, stored as flat typed
+columns:
+
+    points/<FORMAT>/<YEAR>/player   int32    index into the name table
+    points/<FORMAT>/<YEAR>/pos      int8     index into POSITIONS
+    points/<FORMAT>/<YEAR>/weeks    float64  rows x 18, NaN = no score
+    ecr/<YEAR>/week                 int8
+    ecr/<YEAR>/player               int32
+    ecr/<YEAR>/pos                  int8
+    ecr/<YEAR>/ecr                  float64
+    ecr/<YEAR>/std                  float64
+
+load_snapshot() memory-maps the file and hands out memoryviews straight into
+the mapping, so loading every season and format costs a header parse rather
+than a CSV parse:
+
+    import snapshot
+    snap = snapshot.load_snapshot()
+    weeks = snap.column('points/PPR/2024/weeks')   # zero-copy, weeks[i * 18 + w - 1]
+    names = snap.names
+
+File layout: 8-byte magic, 8-byte header length, JSON header, then the
+columns at 8-byte aligned offsets in native byte order.
+"""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from generate_dashboard_fixed import CURRENT_SEASON
+from records import EcrRecord, PlayerRecord
+
+SNAPSHOT_FILE = 'fantasy_data.snap'
+MAGIC = b'FTSNAP1\n'
+POSITIONS = ['QB', 'RB', 'WR', 'TE']
+WEEKS = 18
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+# ==================== WRITE ====================
+
+def write_snapshot(historical, current, projections, ecr_history=None, path=SNAPSHOT_FILE):
+    """Write the parsed dataset to a columnar snapshot. Returns bytes written.
+
+    projections is the current season's weekly ECR; ecr_history holds the
+    earlier seasons ({season: {week: [...]}}) and gets one ecr/<YEAR> group each.
+    """
+    name_ids = {}
+    columns = {}
+    datasets = {}
+
+    def add_points(key, data, **extra):
+        rows = len(data)
+        weeks = array('d', [math.nan]) * (rows * WEEKS)
+        for i, p in enumerate(data):
+            for week, pts in p['w'].items():
+                weeks[i * WEEKS + int(week) - 1] = pts
+        columns[f'{key}/player'] = array('i', (name_ids.setdefault(p['p'], len(name_ids)) for p in data))
+        columns[f'{key}/pos'] = array('b', (POSITIONS.index(p['pos']) for p in data))
+        columns[f'{key}/weeks'] = weeks
+        datasets[key] = {'kind': 'points', 'rows': rows, **extra}
+
+    for scoring_format, years in historical.items():
+        for year, data in years.items():
+            add_points(f'points/{scoring_format}/{year}', data)
+
+    if current:
+        add_points(f'points/PPR/{CURRENT_SEASON}', current['data'], current_week=current['current_week'])
+
+    def add_ecr(key, weeks):
+        rows = [(int(week), p) for week in sorted(weeks, key=int) for p in weeks[week]]
+        columns[f'{key}/week'] = array('b', (week for week, _ in rows))
+        columns[f'{key}/player'] = array('i', (name_ids.setdefault(p['p'], len(name_ids)) for _, p in rows))
+        columns[f'{key}/pos'] = array('b', (POSITIONS.index(p['pos']) for _, p in rows))
+        columns[f'{key}/ecr'] = array('d', (p['ecr'] for _, p in rows))
+        columns[f'{key}/std'] = array('d', (p['std'] for _, p in rows))
+        datasets[key] = {'kind': 'ecr', 'rows': len(rows)}
+
+    for season, weeks in sorted((ecr_history or {}).items()):
+        if weeks:
+            add_ecr(f'ecr/{season}', weeks)
+
+    if projections:
+        add_ecr(f'ecr/{CURRENT_SEASON}', projections)
+
+    # Name table: one UTF-8 blob plus offsets
+    encoded = [name.encode('utf-8') for name in name_ids]
+    offsets = array('i', [0])
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw))
+    columns['names/offsets'] = offsets
+    columns['names/blob'] = array('B', b''.join(encoded))
+
+    layout = {}
+    offset = 0
+    for name, col in columns.items():
+        nbytes = len(col) * col.itemsize
+        layout[name] = {'typecode': col.typecode, 'offset': offset, 'nbytes': nbytes}
+        offset = _align(offset + nbytes)
+
+    header = json.dumps({
+        'byteorder': sys.byteorder,
+        'weeks': WEEKS,
+        'positions': POSITIONS,
+        'datasets': datasets,
+        'columns': layout,
+    }, separators=(',', ':')).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        f.write(b'\0' * (data_start - f.tell()))
+        for name, col in columns.items():
+            f.write(b'\0' * (data_start + layout[name]['offset'] - f.tell()))
+            col.tofile(f)
+        size = f.tell()
+    os.replace(tmp_path, path)
+
+    return size
+
+
+# ==================== READ ====================
+
+class Snapshot:
+    """A memory-mapped snapshot. Columns are memoryviews into the file."""
+
+    def __init__(self, path=SNAPSHOT_FILE):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a Fantasy Truss snapshot")
+
+        (header_len,) = struct.unpack_from('<Q', self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(self._mmap[header_start:header_start + header_len])
+        if header['byteorder'] != sys.byteorder:
+            self._mmap.close()
+            raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine")
+
+        self.datasets = header['datasets']
+        self.positions = header['positions']
+        self.weeks = header['weeks']
+        self._columns = header['columns']
+        self._data_start = _align(header_start + header_len)
+        self._buffer = memoryview(self._mmap)
+        self._names = None
+
+    def column(self, name):
+        """Zero-copy typed view of one column."""
+        col = self._columns[name]
+        start = self._data_start + col['offset']
+        return self._buffer[start:start + col['nbytes']].cast(col['typecode'])
+
+    @property
+    def names(self):
+        """Player names, indexed by the ids in the `player` columns."""
+        if self._names is None:
+            offsets = self.column('names/offsets')
+            blob = self.column('names/blob')
+            self._names = [bytes(blob[offsets[i]:offsets[i + 1]]).decode('utf-8')
+                           for i in range(len(offsets) - 1)]
+        return self._names
+
+    def points(self, scoring_format, season):
+        """Columns for one season/format: {'player', 'pos', 'weeks'}."""
+        key = f'points/{scoring_format}/{season}'
+        return {c: self.column(f'{key}/{c}') for c in ('player', 'pos', 'weeks')}
+
+    def ecr(self, season=CURRENT_SEASON):
+        """Columns for one season of ECR: {'week', 'player', 'pos', 'ecr', 'std'}."""
+        key = f'ecr/{season}'
+        return {c: self.column(f'{key}/{c}') for c in ('week', 'player', 'pos', 'ecr', 'std')}
+
+    # ---- Compatibility: rebuild the generator's dict structures ----
+
+    def _compact(self, key):
+        names, positions, weeks_n = self.names, self.positions, self.weeks
+        player, pos, weeks = (self.column(f'{key}/{c}') for c in ('player', 'pos', 'weeks'))
+        data = []
+        for i in range(len(player)):
+            record = PlayerRecord(names[player[i]], positions[pos[i]])
+            record.weeks[:] = array('d', weeks[i * weeks_n:(i + 1) * weeks_n])
+            data.append(record)
+        return data
+
+    def historical_data(self):
+        """Same shape as load_all_historical_data()."""
+        all_data = {}
+        for key in self.datasets:
+            kind, *rest = key.split('/')
+            if kind != 'points' or int(rest[1]) == CURRENT_SEASON:
+                continue
+            all_data.setdefault(rest[0], {})[rest[1]] = self._compact(key)
+        return all_data
+
+    def current_season(self):
+        """Same shape as load_current_season()."""
+        key = f'points/PPR/{CURRENT_SEASON}'
+        if key not in self.datasets:
+            return None
+        return {'data': self._compact(key), 'current_week': self.datasets[key]['current_week']}
+
+    def weekly_projections(self, season=CURRENT_SEASON):
+        """Same shape as load_weekly_projections()."""
+        if f'ecr/{season}' not in self.datasets:
+            return {}
+        cols = self.ecr(season)
+        names, positions = self.names, self.positions
+        projections = {}
+        for i in range(len(cols['week'])):
+            projections.setdefault(cols['week'][i], []).append(EcrRecord(
+                names[cols['player'][i]], positions[cols['pos'][i]], cols['ecr'][i], cols['std'][i]))
+        return projections
+
+    def ecr_history(self):
+        """Same shape as load_ecr_history()."""
+        seasons = sorted(int(key.split('/')[1]) for key, info in self.datasets.items() if info['kind'] == 'ecr')
+        return {season: self.weekly_projections(season) for season in seasons if season < CURRENT_SEASON}
+
+    def close(self):
+        """Release the mapping.
+
+        Column views still held by the caller stay valid: while any of them is
+        alive the mapping can't be unmapped, so it is left for the garbage
+        collector to close once the last view goes away.
+        """
+        try:
+            self._buffer.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_snapshot(path=SNAPSHOT_FILE):
+    """Memory-map a snapshot written by write_snapshot()."""
+    return Snapshot(path)